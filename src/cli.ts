@@ -1,7 +1,5 @@
-import { bootstrapAgentRuntime } from "./agent-runtime-bootstrap.js";
 import { cliHelp, parseCliOptions, shouldUseTui } from "./cli-options.js";
 import { resolveCliRunContext } from "./cli-runtime.js";
-import { AgentCliApp } from "./tui/app.js";
 
 try {
   const options = parseCliOptions(process.argv.slice(2));
@@ -18,6 +16,9 @@ try {
 async function run(options: ReturnType<typeof parseCliOptions>): Promise<void> {
   const cwd = process.cwd();
   const runContext = resolveCliRunContext(options, cwd);
+  // The agent runtime and TUI pull in the Pi SDK and terminal stack; load them
+  // only once a run starts so --help and option errors return immediately.
+  const { bootstrapAgentRuntime } = await import("./agent-runtime-bootstrap.js");
   const agentRuntime = await bootstrapAgentRuntime({
     cwd,
     runtimeDir: runContext.runtimeDir,
@@ -34,12 +35,31 @@ async function run(options: ReturnType<typeof parseCliOptions>): Promise<void> {
   let stopRequest: Promise<void> | undefined;
   let unsubscribeJsonl: (() => void) | undefined;
   let jsonlResult: unknown;
+  // Events are serialized and written once per tick rather than inside the
+  // append listener, so the controller does not wait on stdout per event.
+  let pendingJsonlEvents: unknown[] = [];
+  let jsonlFlush: NodeJS.Immediate | undefined;
+  const flushJsonlEvents = (): void => {
+    if (jsonlFlush) {
+      clearImmediate(jsonlFlush);
+      jsonlFlush = undefined;
+    }
+    if (pendingJsonlEvents.length === 0) {
+      return;
+    }
+    const events = pendingJsonlEvents;
+    pendingJsonlEvents = [];
+    process.stdout.write(events.map((event) => `${JSON.stringify({ type: "event", event })}\n`).join(""));
+  };
   const requestStop = (signal: NodeJS.Signals): Promise<void> => {
     signalCount += 1;
     if (signalCount > 1) {
       if (!forceExitStarted) {
         forceExitStarted = true;
-        void withTimeout(agentRuntime.close(), 2_000).finally(() => process.exit(128 + signalNumber(signal)));
+        void withTimeout(agentRuntime.close(), 2_000).finally(() => {
+          flushJsonlEvents();
+          process.exit(128 + signalNumber(signal));
+        });
       }
       return stopRequest ?? Promise.resolve();
     }
@@ -52,7 +72,7 @@ async function run(options: ReturnType<typeof parseCliOptions>): Promise<void> {
     void requestStop(signal);
   };
   const app = useTui
-    ? new AgentCliApp({
+    ? new (await import("./tui/app.js")).AgentCliApp({
       executionLog: controller.executionLog,
       artifactStore: controller.artifactStore,
       goal: runContext.userGoal,
@@ -78,7 +98,8 @@ async function run(options: ReturnType<typeof parseCliOptions>): Promise<void> {
         scopeSummary: runContext.scopeSummary
       })}\n`);
       unsubscribeJsonl = controller.executionLog.subscribe((event) => {
-        process.stdout.write(`${JSON.stringify({ type: "event", event })}\n`);
+        pendingJsonlEvents.push(event);
+        jsonlFlush ??= setImmediate(flushJsonlEvents);
       });
     }
     await app?.start();
@@ -97,8 +118,10 @@ async function run(options: ReturnType<typeof parseCliOptions>): Promise<void> {
       console.log(JSON.stringify(result, null, 2));
     }
   } catch (error) {
-    app?.setStatus("failed", errorMessage(error));
-    if (!app) {
+    // The stack is formatted once, for whichever surface shows it.
+    if (app) {
+      app.setStatus("failed", errorMessage(error));
+    } else {
       console.error(errorMessage(error));
     }
     process.exitCode = 1;
@@ -107,6 +130,7 @@ async function run(options: ReturnType<typeof parseCliOptions>): Promise<void> {
     process.off("SIGTERM", handleSignal);
     await stopRequest;
     await agentRuntime.close();
+    flushJsonlEvents();
     if (options.jsonl && jsonlResult !== undefined) {
       process.stdout.write(`${JSON.stringify({ type: "result", result: jsonlResult })}\n`);
     }
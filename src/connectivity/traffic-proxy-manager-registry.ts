@@ -7,6 +7,7 @@ type TrafficProxyManagerRegistryOptions = TrafficProxyManagerOptions & {
 
 export class TrafficProxyManagerRegistry {
   private readonly entries = new Map<string, Promise<TrafficProxyManager>>();
+  private readonly attached = new Map<string, TrafficProxyManager>();
   private closeAllPromise?: Promise<void>;
 
   constructor(private readonly options: TrafficProxyManagerRegistryOptions = {}) {}
@@ -40,10 +41,22 @@ export class TrafficProxyManagerRegistry {
     const canonical = canonicalTrafficProxyRuntimeDir(runtimeDir);
     const existing = this.entries.get(canonical);
     if (existing) return existing;
+    // Attached managers are kept so repeated lookups only pay one health probe
+    // instead of re-deriving the runtime identity and re-checking the socket dir.
+    const cached = this.attached.get(canonical);
+    if (cached) {
+      try {
+        await cached.client.health();
+        return cached;
+      } catch {
+        if (this.attached.get(canonical) === cached) this.attached.delete(canonical);
+      }
+    }
     const { logEventForRuntime: _logEventForRuntime, ...managerOptions } = this.options;
     const manager = new TrafficProxyManager(canonical, managerOptions);
     try {
       await manager.attachExisting();
+      this.attached.set(canonical, manager);
       return manager;
     } catch {
       return undefined;
@@ -60,6 +73,7 @@ export class TrafficProxyManagerRegistry {
 
   async close(runtimeDir: string): Promise<void> {
     const canonical = canonicalTrafficProxyRuntimeDir(runtimeDir);
+    this.attached.delete(canonical);
     const entry = this.entries.get(canonical);
     if (!entry) return;
     this.entries.delete(canonical);
@@ -75,6 +89,7 @@ export class TrafficProxyManagerRegistry {
   private async closeAllInternal(): Promise<void> {
     const entries = [...this.entries.values()];
     this.entries.clear();
+    this.attached.clear();
     const managers = await Promise.allSettled(entries);
     await Promise.allSettled(managers.flatMap((result) => result.status === "fulfilled" ? [result.value.close()] : []));
   }
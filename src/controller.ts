@@ -51,6 +51,7 @@ import {
 import { RuntimeStore } from "./stores/runtime-store.js";
 import type {
   AgentRole,
+  ArtifactRecord,
   ControlSignal,
   ExecutionEpochTerminationReason,
   ExecutionEvent,
@@ -161,6 +162,17 @@ const EXECUTOR_CHECKPOINT_GRACE_MS = positiveIntegerEnv("EXECUTOR_CHECKPOINT_GRA
 const EXECUTOR_PROVIDER_RETRY_ATTEMPTS = 2;
 const EXECUTOR_PROVIDER_RETRY_BACKOFF_MS = 250;
 const EXECUTOR_SESSION_DIR = "executor-sessions";
+const SESSION_RELEASING_TASK_STATUSES = new Set<string>(["completed", "blocked", "failed", "archived"]);
+const TASK_RESULT_STATUSES = new Set<string>(["completed", "partial", "blocked", "failed"]);
+const CONTROL_SIGNAL_DECISIONS = new Set<string>(["continue", "checkpoint", "stop_executor", "need_planner"]);
+const EXECUTOR_STOPPING_DECISIONS = new Set<string>(["checkpoint", "stop_executor", "need_planner"]);
+const GRACEFUL_CHECKPOINT_DECISIONS = new Set<string>(["checkpoint", "need_planner"]);
+const CONTROL_SIGNAL_CONFIDENCES = new Set<string>(["low", "medium", "high"]);
+const REUSABLE_ASSET_NODE_TYPES = new Set<string>(["Host", "Service", "WebEndpoint", "Credential", "Session", "File"]);
+const CONFIRMED_CLAIM_NODE_TYPES = new Set<string>(["Vulnerability", "Exploit"]);
+const TURN_BOUNDARY_EVENT_TYPES = new Set<string>(["turn_usage", "turn_end"]);
+const PROGRESS_MESSAGE_EVENT_TYPES = new Set<string>(["turn_usage", "assistant_intent", "turn_end", "message_end"]);
+const TASK_OUTCOME_EVENT_TYPES = new Set<string>(["task_partial", "task_blocked", "task_failed", "task_completed"]);
 
 type ObserverProjectionRequest = {
   reason: string;
@@ -260,6 +272,20 @@ type ActiveRunRecord = {
   outcome?: RunResult | { completed: false; stoppedReason: string; failed: true };
 };
 
+type InvocationMetricsInput = {
+  session: SecurityAgentSession;
+  before?: PiSessionStatsSnapshot;
+  invocationId: string;
+  invocationKind: "planner" | "executor" | "supervisor" | "projector";
+  agentRole: "planner" | "executor" | "observer";
+  status: string;
+  startedAt: number;
+  taskId?: string;
+  epochId?: string;
+  inputBytes?: number;
+  details?: Record<string, unknown>;
+};
+
 type PiSessionStatsSnapshot = {
   sessionId: string;
   userMessages: number;
@@ -304,6 +330,7 @@ export class SecurityAgentController {
   private projectionCancellationRequested = false;
   private graphStoreClosed = false;
   private projectionJobs = new Set<Promise<ObserverProjection>>();
+  private pendingMetricsWrites = new Set<Promise<void>>();
   private activeProjectorSessions = new Set<SecurityAgentSession>();
   private activeProjectorByTask = new Map<string, SecurityAgentSession>();
   private pendingProjectionRequests = new Map<string, PendingProjectionRequest>();
@@ -315,10 +342,13 @@ export class SecurityAgentController {
   private activeEpochIdByTask = new Map<string, string>();
   private taskSupervisionStates = new Map<string, TaskSupervisionState>();
   private stopRequestedReason?: string;
+  private readonly stopRequested = new AbortController();
   private isolatedSessionsEnabled = false;
   private structuredInvocationsEnabled = false;
   private activeRun?: ActiveRunRecord;
   private currentUserGoal?: string;
+  private waveDependencyOutcomeBriefs?: Map<string, { version: string; brief: Promise<string> }>;
+  private runtimeTailDigests = new Map<string, { committedSeq: number; desiredSeq: number; digest: string }>();
 
   constructor(input: { cwd: string; runtimeDir?: string; environment?: NodeJS.ProcessEnv }) {
     this.cwd = input.cwd;
@@ -450,7 +480,8 @@ export class SecurityAgentController {
         });
       }
     }
-    if (this.isRootGoalStatus("completed") || this.isRootGoalStatus("blocked")) {
+    const rootGoalStatus = this.getRootGoalStatus();
+    if (rootGoalStatus === "completed" || rootGoalStatus === "blocked") {
       return {
         plannerDecision,
         taskEnvelope: taskEnvelopes[0],
@@ -614,7 +645,7 @@ export class SecurityAgentController {
               plannerCycleCount: cycles.length
             }
           });
-          await sleep(backoffMs);
+          await sleep(backoffMs, this.stopRequested.signal);
           continue;
         }
         deferredPlannerFailures = 0;
@@ -623,10 +654,11 @@ export class SecurityAgentController {
         if (this.stopRequestedReason) {
           return await decideRun({ cycles, completed: false, stoppedReason: this.stopRequestedReason });
         }
-        if (this.isRootGoalStatus("completed")) {
+        const rootGoalStatus = this.getRootGoalStatus();
+        if (rootGoalStatus === "completed") {
           return await decideRun({ cycles, completed: true, stoppedReason: cycleResult.plannerDecision.reason });
         }
-        if (this.isRootGoalStatus("blocked")) {
+        if (rootGoalStatus === "blocked") {
           return await decideRun({ cycles, completed: false, stoppedReason: cycleResult.plannerDecision.reason });
         }
       }
@@ -658,6 +690,7 @@ export class SecurityAgentController {
       return;
     }
     this.stopRequestedReason = reason;
+    this.stopRequested.abort();
     this.projectionQueueClosed = true;
     this.clearProjectionCatchupTimers();
     await this.executionLog.append({
@@ -717,19 +750,15 @@ export class SecurityAgentController {
     this.activeRun = undefined;
   }
 
-  private async appendInvocationMetrics(input: {
-    session: SecurityAgentSession;
-    before?: PiSessionStatsSnapshot;
-    invocationId: string;
-    invocationKind: "planner" | "executor" | "supervisor" | "projector";
-    agentRole: "planner" | "executor" | "observer";
-    status: string;
-    startedAt: number;
-    taskId?: string;
-    epochId?: string;
-    inputBytes?: number;
-    details?: Record<string, unknown>;
-  }): Promise<void> {
+  // Stats are captured and the event row queued synchronously; the row commits in a
+  // microtask, reads on the log flush the queue first, and close() drains the rest.
+  private appendInvocationMetrics(input: InvocationMetricsInput): void {
+    const write = this.writeInvocationMetrics(input);
+    this.pendingMetricsWrites.add(write);
+    void write.finally(() => this.pendingMetricsWrites.delete(write));
+  }
+
+  private async writeInvocationMetrics(input: InvocationMetricsInput): Promise<void> {
     try {
       const after = readPiSessionStats(input.session);
       if (!after) {
@@ -833,6 +862,7 @@ export class SecurityAgentController {
         graceMs: 0
       });
     }
+    await Promise.allSettled([...this.pendingMetricsWrites]);
     await this.finalizeRunMetrics();
     await this.executionLog.drain();
     this.graphStoreClosed = true;
@@ -935,41 +965,64 @@ export class SecurityAgentController {
     return this.agents;
   }
 
-  private isRootGoalStatus(status: string): boolean {
+  private getRootGoalStatus(): unknown {
     return this.graphStore
       .query("task", ["goal:root"], 1)
       .nodes
-      .some((node) => node.id === "goal:root" && node.properties.status === status);
+      .find((node) => node.id === "goal:root")
+      ?.properties.status;
   }
 
   private async buildPlannerDecisionView(): Promise<PlannerDecisionView> {
     const view = this.graphStore.plannerDecisionView();
     const runtimeTail: NonNullable<PlannerDecisionView["runtimeTail"]> = [];
+    // One snapshot of lagging projections replaces a state read per ledger task.
+    const uncommittedProjections = new Map(
+      this.runtimeStore.listUncommittedProjectionStates().map((state) => [state.taskId, state])
+    );
+    // Only lagging tasks can need a digest again, so long sessions keep the digest
+    // cache to the current lag set instead of every task that ever lagged.
+    for (const taskId of this.runtimeTailDigests.keys()) {
+      if (!uncommittedProjections.has(taskId)) {
+        this.runtimeTailDigests.delete(taskId);
+      }
+    }
     for (const task of view.taskLedger) {
-      if (runtimeTail.length >= 4) {
+      if (runtimeTail.length >= 4 || uncommittedProjections.size === 0) {
         break;
       }
-      const projectionState = this.runtimeStore.getProjectionState(task.taskId);
-      if (projectionState.desiredSeq <= projectionState.committedSeq) {
+      const projectionState = uncommittedProjections.get(task.taskId);
+      if (!projectionState) {
         continue;
       }
-      const events = await this.executionLog.range({
-        taskId: task.taskId,
-        afterSeq: projectionState.committedSeq,
-        toSeq: projectionState.desiredSeq,
-        roles: ["executor", "runtime"]
-      });
-      const observations = buildProjectionObservations(events);
       runtimeTail.push({
         taskId: task.taskId,
         committedSeq: projectionState.committedSeq,
         desiredSeq: projectionState.desiredSeq,
-        digest: observationDigest(observations, PLANNER_RUNTIME_TAIL_MAX_CHARS)
+        digest: await this.runtimeTailDigest(task.taskId, projectionState.committedSeq, projectionState.desiredSeq)
       });
     }
     return { ...view, runtimeTail };
   }
 
+  // The event log is append-only, so a lagging task's digest only changes when its
+  // projection window moves; planner turns in between reuse the previous digest.
+  private async runtimeTailDigest(taskId: string, committedSeq: number, desiredSeq: number): Promise<string> {
+    const cached = this.runtimeTailDigests.get(taskId);
+    if (cached?.committedSeq === committedSeq && cached.desiredSeq === desiredSeq) {
+      return cached.digest;
+    }
+    const events = await this.executionLog.range({
+      taskId,
+      afterSeq: committedSeq,
+      toSeq: desiredSeq,
+      roles: ["executor", "runtime"]
+    });
+    const digest = observationDigest(buildProjectionObservations(events), PLANNER_RUNTIME_TAIL_MAX_CHARS);
+    this.runtimeTailDigests.set(taskId, { committedSeq, desiredSeq, digest });
+    return digest;
+  }
+
   private async ensureRootGraph(input: { userGoal: string; scopeSummary: string }): Promise<void> {
     this.currentUserGoal = input.userGoal;
     const goalId = "goal:root";
@@ -1041,22 +1094,22 @@ export class SecurityAgentController {
         priority: number;
       }> = [];
       commands.forEach((command, commandIndex) => {
-        if (command.kind === "create_tasks") {
-          const taskEnvelopes = command.tasks.map((taskSpec) => this.taskEnvelopeFromSpec(taskSpec, scopeSummary));
-          taskEnvelopes.forEach((taskEnvelope, taskIndex) => {
-            taskCreateInputs.push({
-              command,
-              taskEnvelope,
-              priority: command.tasks[taskIndex]?.priority ?? 1
-            });
-          });
-          return;
-        }
-        if (command.kind === "set_node_status") {
-          nodeStatusCommands.push({ command, commandIndex });
-          return;
+        switch (command.kind) {
+          case "create_tasks":
+            for (const taskSpec of command.tasks) {
+              taskCreateInputs.push({
+                command,
+                taskEnvelope: this.taskEnvelopeFromSpec(taskSpec, scopeSummary),
+                priority: taskSpec.priority ?? 1
+              });
+            }
+            return;
+          case "set_node_status":
+            nodeStatusCommands.push({ command, commandIndex });
+            return;
+          default:
+            taskCommands.push({ command, commandIndex });
         }
-        taskCommands.push({ command, commandIndex });
       });
       rejectedCommand = commands;
       const applied = this.graphStore.applyPlannerDecision({
@@ -1120,9 +1173,10 @@ export class SecurityAgentController {
         })),
         sourceEventIds: [plannerEventId]
       });
+      const commandEvents: Array<Promise<ExecutionEvent>> = [];
       for (const { command, taskEnvelope } of taskCreateInputs) {
         createdTaskEnvelopes.push(taskEnvelope);
-        await this.executionLog.append({
+        commandEvents.push(this.executionLog.append({
           taskId: taskEnvelope.taskId,
           role: "runtime",
           eventType: "task_created",
@@ -1136,7 +1190,7 @@ export class SecurityAgentController {
             ]),
             taskEnvelope
           }
-        });
+        }));
       }
       if (taskCommands.length > 0) {
         const appliedCommandByIndex = new Map(applied.taskCommands.map((result) => [result.commandIndex, result]));
@@ -1144,33 +1198,33 @@ export class SecurityAgentController {
           const commandReason = command.reason ?? plannerDecision.reason;
           const appliedCommand = appliedCommandByIndex.get(commandIndex);
           if (command.kind === "patch_task") {
-            await this.executionLog.append({
+            commandEvents.push(this.executionLog.append({
               taskId: command.taskId,
               role: "runtime",
               eventType: "planner_task_patched",
               summary: commandReason,
               payload: { command, nodeVersion: appliedCommand?.node.properties.version }
-            });
+            }));
             continue;
           }
           if (command.kind === "replace_dependencies") {
-            await this.executionLog.append({
+            commandEvents.push(this.executionLog.append({
               taskId: command.taskId,
               role: "runtime",
               eventType: "planner_dependencies_replaced",
               summary: commandReason,
               payload: { command, nodeVersion: appliedCommand?.node.properties.version }
-            });
+            }));
             continue;
           }
-          await this.executionLog.append({
+          commandEvents.push(this.executionLog.append({
             taskId: command.taskId,
             role: "runtime",
             eventType: "planner_status_applied",
             summary: commandReason,
             payload: { command, status: command.status, nodeVersion: appliedCommand?.node.properties.version }
-          });
-          if (["completed", "blocked", "failed", "archived"].includes(command.status)) {
+          }));
+          if (SESSION_RELEASING_TASK_STATUSES.has(command.status)) {
             this.runtimeStore.deleteExecutorSession(command.taskId);
           }
         }
@@ -1179,13 +1233,16 @@ export class SecurityAgentController {
       for (const { command, commandIndex } of nodeStatusCommands) {
         const commandReason = command.reason ?? plannerDecision.reason;
         const node = appliedNodeByIndex.get(commandIndex);
-        await this.executionLog.append({
+        commandEvents.push(this.executionLog.append({
           role: "runtime",
           eventType: "planner_status_applied",
           summary: commandReason,
           payload: { command, status: node?.properties.status, nodeId: node?.id, nodeVersion: node?.properties.version }
-        });
+        }));
       }
+      // Command events are queued in order and committed together in one microtask;
+      // their JSONL mirror writes and listener fan-out then settle together.
+      await Promise.all(commandEvents);
     } catch (error) {
       await this.executionLog.append({
         role: "runtime",
@@ -1209,7 +1266,9 @@ export class SecurityAgentController {
     if (readyTasks.length === 0) {
       return [];
     }
-    await this.executionLog.append({
+    // The event row is only queued here and commits in a microtask; reads on the
+    // same log flush the queue first, so executor startup need not await it.
+    const waveStarted = this.executionLog.append({
       role: "runtime",
       eventType: "task_wave_started",
       summary: `Running ${readyTasks.length} admitted task(s)`,
@@ -1220,11 +1279,18 @@ export class SecurityAgentController {
         maxParallelTasks: input.maxParallelTasks
       }
     });
-    const waveExecutions = await Promise.all(
-      readyTasks.map((taskEnvelope) => this.runExecutorTask(taskEnvelope, {
-        useDynamicExecutor: this.isolatedSessionsEnabled || readyTasks.length > 1
-      }))
-    );
+    let waveExecutions: TaskExecution[];
+    this.waveDependencyOutcomeBriefs = new Map();
+    try {
+      waveExecutions = await Promise.all(
+        readyTasks.map((taskEnvelope) => this.runExecutorTask(taskEnvelope, {
+          useDynamicExecutor: this.isolatedSessionsEnabled || readyTasks.length > 1
+        }))
+      );
+    } finally {
+      this.waveDependencyOutcomeBriefs = undefined;
+      await waveStarted;
+    }
     await this.executionLog.append({
       role: "runtime",
       eventType: "task_wave_completed",
@@ -1325,7 +1391,7 @@ export class SecurityAgentController {
         executorInvocationStatus = providerFailure?.retryable ? "provider_error" : "failed";
       } finally {
         await executorLogging?.drain();
-        await this.appendInvocationMetrics({
+        this.appendInvocationMetrics({
           session: executorSession.session,
           before: executorStatsBefore,
           invocationId: executorInvocationId,
@@ -1365,13 +1431,12 @@ export class SecurityAgentController {
         });
       }
 
-      if (
-        !taskResult
-        && providerFailure?.retryable
+      const retryScheduled = !taskResult
+        && providerFailure?.retryable === true
         && state.toolExecutionEndCount === 0
         && providerAttempt <= EXECUTOR_PROVIDER_RETRY_ATTEMPTS
-        && !state.executorStopRequested
-      ) {
+        && !state.executorStopRequested;
+      if (retryScheduled && providerFailure) {
         await this.executionLog.append({
           epochId: state.epochId,
           taskId: taskEnvelope.taskId,
@@ -1390,8 +1455,12 @@ export class SecurityAgentController {
         if (executorSession.dynamicExecutor) {
           disposeSession(executorSession.session);
         }
-        await sleep(EXECUTOR_PROVIDER_RETRY_BACKOFF_MS);
-        continue;
+        await sleep(EXECUTOR_PROVIDER_RETRY_BACKOFF_MS, this.stopRequested.signal);
+        // A stop that cuts the backoff short ends retrying: requestStop could not
+        // reach an epoch opened after it, so the provider failure is reported instead.
+        if (!this.stopRequestedReason) {
+          continue;
+        }
       }
 
       taskResult ??= await this.createSyntheticTaskResult({
@@ -1454,7 +1523,8 @@ export class SecurityAgentController {
           payload: { reason: "task_end", providerFailure, sourceEventIds: [taskCompletedEvent.id] }
         });
       } else {
-        this.runtimeStore.raiseProjectionDesired(taskEnvelope.taskId, taskCompletedEvent.seq ?? 0, 10);
+        // requestProjection raises the desired watermark to this event at task_end
+        // priority, so the projection state is written once.
         void this.enqueueProjectionJob({
           reason: "task_end",
           taskEnvelope,
@@ -1466,10 +1536,13 @@ export class SecurityAgentController {
       const terminationReason = taskResult.status === "completed"
         ? "executor_submitted"
         : terminationReasonForTaskResult(taskResult, state);
-      executorLogging?.();
-      this.finishTaskExecution(taskEnvelope.taskId, terminationReason);
-      if (executorSession.dynamicExecutor) {
-        disposeSession(executorSession.session);
+      // A retry cut short by a stop already closed its epoch and released the session.
+      if (!retryScheduled) {
+        executorLogging?.();
+        this.finishTaskExecution(taskEnvelope.taskId, terminationReason);
+        if (executorSession.dynamicExecutor) {
+          disposeSession(executorSession.session);
+        }
       }
       return { taskEnvelope, taskResult, graphDelta: taskStatusDelta, controlSignal };
     }
@@ -1555,28 +1628,11 @@ export class SecurityAgentController {
     taskStatus?: Record<string, unknown>;
     runtimeBudgetStatus: string;
   }): Promise<string> {
-    const executionGraphContext = this.graphStore.projectionClosure({
-      taskId: input.taskEnvelope.taskId,
-      scopeRef: input.taskEnvelope.scopeRef,
-      dependencyTaskIds: input.taskEnvelope.dependsOnTaskRefs,
-      targetRefs: input.taskEnvelope.targetRefs,
-      nodeLimit: 28,
-      edgeLimit: 48
-    });
-    const operationGraphSlice = compactExecutorGraphClosure(executionGraphContext, "operation", 12);
     return renderExecutorInput({
       rootGoal: input.rootGoal,
       taskEnvelope: input.taskEnvelope,
-      operationGraphSlice,
-      reasoningGraphSlice: compactExecutorGraphClosure(executionGraphContext, "reasoning", 12),
-      sessionRefs: operationGraphSlice.nodes.filter((node) => node.type === "Session" || node.type === "Credential"),
+      ...(await this.buildExecutorInputContext(input.taskEnvelope, input.taskStatus)),
       toolCatalog: ["read", "bash", "grep", "find", "ls", "artifact_read", "artifact_write", "task_result_submit"],
-      executionBrief: createExecutionBrief(input.taskEnvelope, (await this.executionLog.window({
-        taskId: input.taskEnvelope.taskId,
-        limit: 5,
-        roles: ["executor", "runtime"]
-      })).events, input.taskStatus),
-      dependencyOutcomes: await this.createDependencyOutcomeBrief(input.taskEnvelope),
       runtimeBudgetStatus: input.runtimeBudgetStatus
     });
   }
@@ -1588,30 +1644,36 @@ export class SecurityAgentController {
     plannerHint?: string;
     runtimeBudgetStatus: string;
   }): Promise<string> {
+    return renderExecutorResumeInput({
+      rootGoal: input.rootGoal,
+      taskEnvelope: input.taskEnvelope,
+      plannerHint: input.plannerHint,
+      ...(await this.buildExecutorInputContext(input.taskEnvelope, input.taskStatus)),
+      runtimeBudgetStatus: input.runtimeBudgetStatus
+    });
+  }
+
+  private async buildExecutorInputContext(taskEnvelope: TaskEnvelope, taskStatus?: Record<string, unknown>) {
     const executionGraphContext = this.graphStore.projectionClosure({
-      taskId: input.taskEnvelope.taskId,
-      scopeRef: input.taskEnvelope.scopeRef,
-      dependencyTaskIds: input.taskEnvelope.dependsOnTaskRefs,
-      targetRefs: input.taskEnvelope.targetRefs,
+      taskId: taskEnvelope.taskId,
+      scopeRef: taskEnvelope.scopeRef,
+      dependencyTaskIds: taskEnvelope.dependsOnTaskRefs,
+      targetRefs: taskEnvelope.targetRefs,
       nodeLimit: 28,
       edgeLimit: 48
     });
     const operationGraphSlice = compactExecutorGraphClosure(executionGraphContext, "operation", 12);
-    return renderExecutorResumeInput({
-      rootGoal: input.rootGoal,
-      taskEnvelope: input.taskEnvelope,
-      plannerHint: input.plannerHint,
+    return {
       operationGraphSlice,
       reasoningGraphSlice: compactExecutorGraphClosure(executionGraphContext, "reasoning", 12),
       sessionRefs: operationGraphSlice.nodes.filter((node) => node.type === "Session" || node.type === "Credential"),
-      executionBrief: createExecutionBrief(input.taskEnvelope, (await this.executionLog.window({
-        taskId: input.taskEnvelope.taskId,
+      executionBrief: createExecutionBrief(taskEnvelope, (await this.executionLog.window({
+        taskId: taskEnvelope.taskId,
         limit: 5,
         roles: ["executor", "runtime"]
-      })).events, input.taskStatus),
-      dependencyOutcomes: await this.createDependencyOutcomeBrief(input.taskEnvelope),
-      runtimeBudgetStatus: input.runtimeBudgetStatus
-    });
+      })).events, taskStatus),
+      dependencyOutcomes: await this.createDependencyOutcomeBrief(taskEnvelope)
+    };
   }
 
   private getRootGoalText(): string | undefined {
@@ -1748,7 +1810,7 @@ export class SecurityAgentController {
         await plannerLogging?.drain();
         plannerLogging?.();
         if (plannerSessionResult) {
-          await this.appendInvocationMetrics({
+          this.appendInvocationMetrics({
             session: plannerSessionResult.session,
             before: plannerStatsBefore,
             invocationId: plannerPromptId,
@@ -1771,7 +1833,7 @@ export class SecurityAgentController {
         }
       }
       if (retryDelayMs > 0) {
-        await sleep(retryDelayMs);
+        await sleep(retryDelayMs, this.stopRequested.signal);
         if (this.stopRequestedReason) {
           throw new Error(this.stopRequestedReason);
         }
@@ -1828,17 +1890,31 @@ export class SecurityAgentController {
   private beginTaskExecution(taskEnvelope: TaskEnvelope): ActiveTaskState {
     const epochId = `epoch:${randomUUID()}`;
     const attempt = this.nextTaskAttempt(taskEnvelope.taskId);
+    // Every optional field is declared up front so all epoch states share one
+    // object shape, keeping the per-event property reads on this object monomorphic.
     const state: ActiveTaskState = {
       epochId,
       lifecycleState: "created",
+      terminationReason: undefined,
       taskEnvelope,
       toolExecutionEndCount: 0,
       turnEndCount: 0,
       executorStopRequested: false,
+      controlSignal: undefined,
+      abortContext: undefined,
+      taskTimer: undefined,
+      lastObserverProjection: undefined,
+      executorSession: undefined,
       dynamicExecutor: false,
       attempt,
+      lastEventId: undefined,
       budgetExtensionCount: 0,
       budgetStatusSteerKeys: new Set(),
+      budgetDecisionPending: undefined,
+      checkpointGraceTimer: undefined,
+      runDeadlineAt: undefined,
+      epochDeadlineAt: undefined,
+      epochTimeLimitMs: undefined,
       supervisionState: restoreTaskSupervisionState(
         taskEnvelope,
         this.getTaskStatusSnapshot(taskEnvelope.taskId),
@@ -1901,31 +1977,45 @@ export class SecurityAgentController {
     taskResult?: TaskResult;
     observations: ProjectionObservation[];
   }): Promise<{ text: string; itemCount: number; omittedCount: number }> {
-    const directRefs = dedupeStrings(input.observations.flatMap((observation) => observation.artifactRefs));
-    const includeTaskResultArtifacts = input.observations.some((observation) => observation.kind === "task_outcome");
-    const taskResultRefs = includeTaskResultArtifacts ? input.taskResult?.artifactRefs ?? [] : [];
+    const observationArtifactRefs: string[] = [];
+    const anchors: string[] = [];
+    const outcomeDigests: string[] = [];
+    const observationDigests: string[] = [];
+    for (const observation of input.observations) {
+      observationArtifactRefs.push(...observation.artifactRefs);
+      anchors.push(...observation.anchors);
+      if (observation.kind === "task_outcome") {
+        outcomeDigests.push(observation.outcomeDigest);
+      }
+      observationDigests.push(
+        observation.interpretation ?? "",
+        observation.inputDigest ?? "",
+        observation.outcomeDigest
+      );
+    }
+    const directRefs = dedupeStrings(observationArtifactRefs);
+    const taskResultRefs = outcomeDigests.length > 0 ? input.taskResult?.artifactRefs ?? [] : [];
     const candidateRefs = dedupeStrings([...directRefs, ...taskResultRefs]);
     const directRefSet = new Set(directRefs);
     const relevantSnippets = await this.artifactStore.searchWithin({
       artifactRefs: candidateRefs,
       query: [
-        ...input.observations.flatMap((observation) => observation.anchors),
-        ...input.observations
-          .filter((observation) => observation.kind === "task_outcome")
-          .map((observation) => observation.outcomeDigest),
-        ...input.observations.flatMap((observation) => [
-          observation.interpretation ?? "",
-          observation.inputDigest ?? "",
-          observation.outcomeDigest
-        ]),
+        ...anchors,
+        ...outcomeDigests,
+        ...observationDigests,
         input.taskEnvelope.goal,
         ...input.taskEnvelope.successCriteria
       ].join(" "),
       limit: 6
     });
-    const selected: string[] = [];
+    const manifest: Array<{
+      artifactRef: string;
+      record?: ArtifactRecord;
+      snippet?: (typeof relevantSnippets)[number];
+      needsFallbackPreview: boolean;
+    }> = [];
     for (const artifactRef of candidateRefs) {
-      if (selected.length >= PROJECTOR_ARTIFACT_MANIFEST_LIMIT) {
+      if (manifest.length >= PROJECTOR_ARTIFACT_MANIFEST_LIMIT) {
         break;
       }
       const record = artifactRef.startsWith("artifact:") ? await this.artifactStore.get(artifactRef) : undefined;
@@ -1933,18 +2023,26 @@ export class SecurityAgentController {
         continue;
       }
       const snippet = relevantSnippets.find((candidate) => candidate.artifactRef === artifactRef);
-      const needsFallbackPreview = directRefSet.has(artifactRef) && !snippet;
-      const tail = needsFallbackPreview && record && record.byteLength > 240
-        ? await this.artifactStore.read(artifactRef, {
+      manifest.push({ artifactRef, record, snippet, needsFallbackPreview: directRefSet.has(artifactRef) && !snippet });
+    }
+    // Tail reads are independent file reads, so they run together once the
+    // manifest is chosen instead of one after another.
+    const tails = await Promise.all(manifest.map(({ artifactRef, record, needsFallbackPreview }) => (
+      needsFallbackPreview && record && record.byteLength > 240
+        ? this.artifactStore.read(artifactRef, {
           offset: Math.max(0, record.byteLength - 240),
           length: 240
         })
-        : "";
+        : ""
+    )));
+    const selected: string[] = [];
+    for (const [index, { artifactRef, record, snippet, needsFallbackPreview }] of manifest.entries()) {
+      const tail = tails[index];
       selected.push([
         `${artifactRef} kind=${record?.kind ?? "unknown"} bytes=${record?.byteLength ?? "unknown"}`,
-        needsFallbackPreview && record?.preview ? `  head: ${truncateText(record.preview.replace(/\s+/g, " "), 240)}` : undefined,
-        tail ? `  tail: ${truncateText(tail.replace(/\s+/g, " "), 240)}` : undefined,
-        snippet ? `  match: ${truncateText(snippet.snippet.replace(/\s+/g, " "), 480)}` : undefined
+        needsFallbackPreview && record?.preview ? `  head: ${truncateText(record.preview, 240)}` : undefined,
+        tail ? `  tail: ${truncateText(tail, 240)}` : undefined,
+        snippet ? `  match: ${truncateText(snippet.snippet, 480)}` : undefined
       ].filter((line): line is string => Boolean(line)).join("\n"));
     }
     return {
@@ -2197,7 +2295,7 @@ export class SecurityAgentController {
       await supervisorLogging?.drain();
       supervisorLogging?.();
       if (supervisorSession) {
-        await this.appendInvocationMetrics({
+        this.appendInvocationMetrics({
           session: supervisorSession,
           before: supervisorStatsBefore,
           invocationId: input.queueId ?? `supervisor:${randomUUID()}`,
@@ -2732,11 +2830,12 @@ export class SecurityAgentController {
         delta: projection.graphDelta
       });
       projection.graphDelta = commitResult.delta;
-      const orphanCandidates = dedupeStrings([
-        ...(this.projectionOrphanRefsByTask.get(input.taskEnvelope.taskId) ?? []),
+      // commitProjection already reported this delta's orphans inside its
+      // transaction; only orphans carried over from earlier batches need a recheck.
+      const unresolvedOrphanNodeIds = dedupeStrings([
+        ...this.graphStore.findOrphanNodeIds(this.projectionOrphanRefsByTask.get(input.taskEnvelope.taskId) ?? []),
         ...commitResult.orphanNodeIds
-      ]);
-      const unresolvedOrphanNodeIds = this.graphStore.findOrphanNodeIds(orphanCandidates).slice(0, 8);
+      ]).slice(0, 8);
       if (unresolvedOrphanNodeIds.length > 0) {
         this.projectionOrphanRefsByTask.set(input.taskEnvelope.taskId, unresolvedOrphanNodeIds);
         await this.executionLog.append({
@@ -2805,7 +2904,7 @@ export class SecurityAgentController {
       await projectorLogging?.drain();
       projectorLogging?.();
       if (projectorSession) {
-        await this.appendInvocationMetrics({
+        this.appendInvocationMetrics({
           session: projectorSession,
           before: projectorStatsBefore,
           invocationId: input.queueId ?? `projection:${randomUUID()}`,
@@ -3499,7 +3598,7 @@ export class SecurityAgentController {
         ...(state?.lastObserverProjection?.graphDelta.sourceEventIds ?? [])
       ]),
       artifactRefs,
-      suggestedNextGoal: !isInfraAbort && signal && ["checkpoint", "need_planner", "stop_executor"].includes(signal.decision)
+      suggestedNextGoal: !isInfraAbort && signal && EXECUTOR_STOPPING_DECISIONS.has(signal.decision)
         ? "Planner should read the updated graph and create the next goal-level task if needed."
         : undefined,
       checkpointReason: signal?.reason,
@@ -3524,7 +3623,7 @@ export class SecurityAgentController {
     const lastEventId = state?.lastEventId;
     const submittedEvidenceRefs = taskResult.evidenceRefs.filter((ref) => (
       this.executionLog.seqForEvent(ref) !== undefined
-      || this.graphStore.trace({ nodeId: ref }).nodes.some((node) => node.id === ref)
+      || this.graphStore.hasNode(ref)
     ));
     const submittedArtifactRefs: string[] = [];
     for (const artifactRef of taskResult.artifactRefs) {
@@ -3578,63 +3677,83 @@ export class SecurityAgentController {
     if (dependencyTaskIds.length === 0) {
       return "无直接依赖任务结果。";
     }
-    const briefs = await Promise.all(dependencyTaskIds.map(async (dependencyTaskId) => {
-      const taskNode = this.graphStore.getTaskNode(dependencyTaskId);
-      if (!taskNode) {
-        return `${dependencyTaskId}: 图中不存在。`;
+    const briefs = await Promise.all(dependencyTaskIds.map((dependencyTaskId) => this.dependencyOutcomeBrief(dependencyTaskId)));
+    return briefs.join("\n");
+  }
+
+  // Sibling tasks in one wave usually share dependencies, so each brief is built
+  // once per wave and rebuilt only after the graph or that task's events change.
+  private dependencyOutcomeBrief(dependencyTaskId: string): Promise<string> {
+    const cache = this.waveDependencyOutcomeBriefs;
+    if (!cache) {
+      return this.buildDependencyOutcomeBrief(dependencyTaskId);
+    }
+    const version = `${this.graphStore.graphVersion()}:${this.executionLog.latestSeq(dependencyTaskId)}`;
+    const cached = cache.get(dependencyTaskId);
+    if (cached?.version === version) {
+      return cached.brief;
+    }
+    const brief = this.buildDependencyOutcomeBrief(dependencyTaskId);
+    cache.set(dependencyTaskId, { version, brief });
+    void brief.catch(() => {
+      if (cache.get(dependencyTaskId)?.brief === brief) {
+        cache.delete(dependencyTaskId);
       }
-      const dependencyEnvelope = this.graphStore.getTaskEnvelope(dependencyTaskId);
-      const dependencyContext = dependencyEnvelope
-        ? this.graphStore.projectionClosure({
-          taskId: dependencyTaskId,
-          scopeRef: dependencyEnvelope.scopeRef,
-          dependencyTaskIds: dependencyEnvelope.dependsOnTaskRefs,
-          targetRefs: dependencyEnvelope.targetRefs,
-          nodeLimit: 18,
-          edgeLimit: 30
-        })
-        : this.graphStore.trace({ nodeId: dependencyTaskId });
-      const reusableAssets = dependencyContext.nodes
-        .filter((node) => node.graphKind === "operation" && [
-          "Host", "Service", "WebEndpoint", "Credential", "Session", "File"
-        ].includes(node.type))
-        .slice(0, 8)
-        .map((node) => `${node.type}:${node.id}:${truncateText(node.label, 180)}`);
-      const reusableClaims = dependencyContext.nodes
-        .filter((node) => node.graphKind === "reasoning" && ["Vulnerability", "Exploit"].includes(node.type))
-        .slice(0, 5)
-        .map((node) => `${node.type}:${node.id}:${truncateText(node.label, 180)}`);
-      const dependencyEvents = await this.executionLog.window({
+    });
+    return brief;
+  }
+
+  private async buildDependencyOutcomeBrief(dependencyTaskId: string): Promise<string> {
+    const taskNode = this.graphStore.getTaskNode(dependencyTaskId);
+    if (!taskNode) {
+      return `${dependencyTaskId}: 图中不存在。`;
+    }
+    const dependencyEnvelope = this.graphStore.getTaskEnvelope(dependencyTaskId);
+    const dependencyContext = dependencyEnvelope
+      ? this.graphStore.projectionClosure({
         taskId: dependencyTaskId,
-        limit: 96,
-        roles: ["executor", "runtime"],
-        eventTypes: [
-          "assistant_intent",
-          "tool_started",
-          "tool_finished",
-          "task_completed",
-          "task_partial",
-          "task_failed"
-        ]
-      });
-      const capabilities = capabilityDigest(buildProjectionObservations(dependencyEvents.events), 1200);
-      const properties = taskNode.properties;
-      return [
-        `${dependencyTaskId} status=${String(properties.status ?? "unknown")}`,
-        properties.resultSummary ? `  result: ${truncateText(String(properties.resultSummary), 700)}` : undefined,
-        properties.checkpointReason ? `  checkpoint: ${truncateText(String(properties.checkpointReason), 300)}` : undefined,
-        capabilities ? `  capabilities:\n${capabilities.split("\n").map((line) => `    ${line}`).join("\n")}` : undefined,
-        reusableAssets.length > 0 ? `  reusable: ${reusableAssets.join("；")}` : undefined,
-        reusableClaims.length > 0 ? `  confirmed: ${reusableClaims.join("；")}` : undefined,
-        stringArrayProperty(properties.evidenceRefs).length > 0
-          ? `  evidence: ${stringArrayProperty(properties.evidenceRefs).slice(0, 5).join(", ")}`
-          : undefined,
-        stringArrayProperty(properties.artifactRefs).length > 0
-          ? `  artifacts: ${stringArrayProperty(properties.artifactRefs).slice(0, 5).join(", ")}`
-          : undefined
-      ].filter((line): line is string => Boolean(line)).join("\n");
-    }));
-    return briefs.join("\n");
+        scopeRef: dependencyEnvelope.scopeRef,
+        dependencyTaskIds: dependencyEnvelope.dependsOnTaskRefs,
+        targetRefs: dependencyEnvelope.targetRefs,
+        nodeLimit: 18,
+        edgeLimit: 30
+      })
+      : this.graphStore.trace({ nodeId: dependencyTaskId });
+    const reusableAssets = dependencyContext.nodes
+      .filter((node) => node.graphKind === "operation" && REUSABLE_ASSET_NODE_TYPES.has(node.type))
+      .slice(0, 8)
+      .map((node) => `${node.type}:${node.id}:${truncateText(node.label, 180)}`);
+    const reusableClaims = dependencyContext.nodes
+      .filter((node) => node.graphKind === "reasoning" && CONFIRMED_CLAIM_NODE_TYPES.has(node.type))
+      .slice(0, 5)
+      .map((node) => `${node.type}:${node.id}:${truncateText(node.label, 180)}`);
+    const dependencyEvents = await this.executionLog.window({
+      taskId: dependencyTaskId,
+      limit: 96,
+      roles: ["executor", "runtime"],
+      eventTypes: [
+        "assistant_intent",
+        "tool_started",
+        "tool_finished",
+        "task_completed",
+        "task_partial",
+        "task_failed"
+      ]
+    });
+    const capabilities = capabilityDigest(buildProjectionObservations(dependencyEvents.events), 1200);
+    const properties = taskNode.properties;
+    const evidenceRefs = stringArrayProperty(properties.evidenceRefs);
+    const artifactRefs = stringArrayProperty(properties.artifactRefs);
+    return [
+      `${dependencyTaskId} status=${String(properties.status ?? "unknown")}`,
+      properties.resultSummary ? `  result: ${truncateText(String(properties.resultSummary), 700)}` : undefined,
+      properties.checkpointReason ? `  checkpoint: ${truncateText(String(properties.checkpointReason), 300)}` : undefined,
+      capabilities ? `  capabilities:\n${capabilities.split("\n").map((line) => `    ${line}`).join("\n")}` : undefined,
+      reusableAssets.length > 0 ? `  reusable: ${reusableAssets.join("；")}` : undefined,
+      reusableClaims.length > 0 ? `  confirmed: ${reusableClaims.join("；")}` : undefined,
+      evidenceRefs.length > 0 ? `  evidence: ${evidenceRefs.slice(0, 5).join(", ")}` : undefined,
+      artifactRefs.length > 0 ? `  artifacts: ${artifactRefs.slice(0, 5).join(", ")}` : undefined
+    ].filter((line): line is string => Boolean(line)).join("\n");
   }
 
 }
@@ -3733,7 +3852,7 @@ function normalizeControlSignal(signal: Record<string, unknown> | undefined, fal
   const decision = typeof signal?.decision === "string" && isControlSignalDecision(signal.decision)
     ? signal.decision
     : "continue";
-  const confidence = typeof signal?.confidence === "string" && ["low", "medium", "high"].includes(signal.confidence)
+  const confidence = typeof signal?.confidence === "string" && CONTROL_SIGNAL_CONFIDENCES.has(signal.confidence)
     ? signal.confidence as ControlSignal["confidence"]
     : undefined;
   const rawBudgetExtension = isRecord(signal?.budgetExtension) ? signal.budgetExtension : undefined;
@@ -3778,11 +3897,11 @@ function normalizeBudgetNumber(value: unknown, defaultValue: number, maxValue: n
 }
 
 export function shouldStopExecutorForControlSignal(controlSignal: ControlSignal): boolean {
-  return ["checkpoint", "stop_executor", "need_planner"].includes(controlSignal.decision);
+  return EXECUTOR_STOPPING_DECISIONS.has(controlSignal.decision);
 }
 
 function isGracefulCheckpointSignal(controlSignal: ControlSignal): boolean {
-  return ["checkpoint", "need_planner"].includes(controlSignal.decision);
+  return GRACEFUL_CHECKPOINT_DECISIONS.has(controlSignal.decision);
 }
 
 function isRetryableProjectionError(error: unknown): boolean {
@@ -3959,7 +4078,7 @@ function selectRecentExecutorTurnEvents(events: ExecutionEvent[], maxTurns: numb
   let turnsSeen = 0;
   let startIndex = 0;
   for (let index = ordered.length - 1; index >= 0; index -= 1) {
-    if (["turn_usage", "turn_end"].includes(ordered[index]?.eventType ?? "")) {
+    if (TURN_BOUNDARY_EVENT_TYPES.has(ordered[index]?.eventType ?? "")) {
       turnsSeen += 1;
       if (turnsSeen > maxTurns) {
         startIndex = index + 1;
@@ -4052,14 +4171,14 @@ function updateTaskSupervisionState(
     }
     return;
   }
-  if (["turn_usage", "assistant_intent", "turn_end", "message_end"].includes(event.eventType)) {
+  if (PROGRESS_MESSAGE_EVENT_TYPES.has(event.eventType)) {
     const text = eventText(event).slice(0, 240);
     if (text) {
       supervisionState.progressDigest = `最近思考/消息：${text}`;
     }
     return;
   }
-  if (["task_partial", "task_blocked", "task_failed", "task_completed"].includes(event.eventType)) {
+  if (TASK_OUTCOME_EVENT_TYPES.has(event.eventType)) {
     const summary = event.summary ?? eventText(event).slice(0, 240);
     supervisionState.progressDigest = `任务阶段结果：${summary}`;
     if (event.eventType === "task_blocked" || event.eventType === "task_failed") {
@@ -4173,7 +4292,12 @@ function isRuntimeContextArtifact(preview: string): boolean {
 }
 
 function stringArrayProperty(value: unknown): string[] {
-  return Array.isArray(value) ? value.filter((item): item is string => typeof item === "string") : [];
+  if (!Array.isArray(value)) {
+    return [];
+  }
+  return value.every((item) => typeof item === "string")
+    ? value as string[]
+    : value.filter((item): item is string => typeof item === "string");
 }
 
 function stringProperty(value: unknown): string | undefined {
@@ -4181,11 +4305,11 @@ function stringProperty(value: unknown): string | undefined {
 }
 
 function isControlSignalDecision(value: string): value is ControlSignal["decision"] {
-  return ["continue", "checkpoint", "stop_executor", "need_planner"].includes(value);
+  return CONTROL_SIGNAL_DECISIONS.has(value);
 }
 
 function isTaskResultStatus(value: unknown): value is TaskResultStatus {
-  return ["completed", "partial", "blocked", "failed"].includes(String(value));
+  return TASK_RESULT_STATUSES.has(String(value));
 }
 
 function isRecord(value: unknown): value is Record<string, unknown> {
@@ -4499,6 +4623,19 @@ function disposeSession(session: SecurityAgentSession): void {
   void candidate.abort?.();
 }
 
-async function sleep(ms: number): Promise<void> {
-  await new Promise((resolve) => setTimeout(resolve, ms));
+// Resolves early once the signal aborts, so a stop request does not wait out a
+// retry backoff.
+async function sleep(ms: number, signal?: AbortSignal): Promise<void> {
+  if (signal?.aborted) {
+    return;
+  }
+  await new Promise<void>((resolve) => {
+    const finish = () => {
+      clearTimeout(timer);
+      signal?.removeEventListener("abort", finish);
+      resolve();
+    };
+    const timer = setTimeout(finish, ms);
+    signal?.addEventListener("abort", finish, { once: true });
+  });
 }
@@ -1,6 +1,9 @@
 import type { ExecutionEvent, JsonObject } from "./types.js";
 import { buildProjectionObservations, type ProjectionObservation } from "./projection.js";
 
+const COMPACT_JSON_OMITTED_KEYS = new Set(["thinking", "thinkingSignature", "messages"]);
+const SUPERVISOR_FALLBACK_TRACE_LINES = 16;
+
 export function compactExecutionEvents(events: ExecutionEvent[]): Array<Record<string, unknown>> {
   return events.map(compactExecutionEvent);
 }
@@ -33,7 +36,7 @@ export function compactJson(value: unknown, depth: number): unknown {
   }
   const compacted: JsonObject = {};
   for (const [key, propertyValue] of Object.entries(value)) {
-    if (["thinking", "thinkingSignature", "messages"].includes(key)) {
+    if (COMPACT_JSON_OMITTED_KEYS.has(key)) {
       continue;
     }
     compacted[key] = compactJson(propertyValue, depth + 1);
@@ -47,7 +50,9 @@ export type SupervisorTraceSummary = {
 };
 
 export function summarizeSupervisorTrace(events: ExecutionEvent[]): SupervisorTraceSummary {
+  // Only the newest fallback lines are shown, so keep a fixed window while numbering every line.
   const fallbackTraceLines: string[] = [];
+  let fallbackTraceLineCount = 0;
   const actionKeys: string[] = [];
   const failureKeys: string[] = [];
   let localWorkspaceDrift = false;
@@ -57,7 +62,11 @@ export function summarizeSupervisorTrace(events: ExecutionEvent[]): SupervisorTr
     const payload = event.payload;
     const line = summarizeSupervisorEvent(event, payload);
     if (line) {
-      fallbackTraceLines.push(`${fallbackTraceLines.length + 1}. ${line}`);
+      fallbackTraceLineCount += 1;
+      fallbackTraceLines.push(`${fallbackTraceLineCount}. ${line}`);
+      if (fallbackTraceLines.length > SUPERVISOR_FALLBACK_TRACE_LINES) {
+        fallbackTraceLines.shift();
+      }
     }
     const actionKey = actionFingerprint(event, payload);
     if (actionKey) {
@@ -80,7 +89,7 @@ export function summarizeSupervisorTrace(events: ExecutionEvent[]): SupervisorTr
   const causalObservations = buildProjectionObservations(events).slice(-8);
   const visibleTraceLines = causalObservations.length > 0
     ? causalObservations.map((observation, index) => `${index + 1}. ${summarizeCausalObservation(observation)}`)
-    : fallbackTraceLines.slice(-16).map((line) => truncateOneLine(line, 120));
+    : fallbackTraceLines.map((line) => truncateOneLine(line, 120));
   const loopSignals = [
     repeatedAction.count >= 2 ? `重复动作：${repeatedAction.key} ×${repeatedAction.count}` : "重复动作：未明显出现",
     repeatedFailure.count >= 2 ? `重复失败：${repeatedFailure.key} ×${repeatedFailure.count}` : "重复失败：未明显出现",
@@ -186,8 +195,10 @@ function extractContentText(content: unknown[]): string {
     .join(" ");
 }
 
+const FINGERPRINTED_EVENT_TYPES = new Set(["assistant_intent", "message_end", "turn_end", "tool_started", "tool_execution_start"]);
+
 function actionFingerprint(event: ExecutionEvent, payload: JsonObject): string | undefined {
-  if (!["assistant_intent", "message_end", "turn_end", "tool_started", "tool_execution_start"].includes(event.eventType)) {
+  if (!FINGERPRINTED_EVENT_TYPES.has(event.eventType)) {
     return undefined;
   }
   const message = isRecord(payload.message) ? payload.message : undefined;
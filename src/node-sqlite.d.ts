@@ -1,6 +1,7 @@
 declare module "node:sqlite" {
   export class DatabaseSync {
     constructor(path: string);
+    readonly isTransaction: boolean;
     exec(sql: string): void;
     prepare(sql: string): StatementSync;
     transaction<T extends (...args: never[]) => unknown>(fn: T): T;
@@ -11,5 +12,6 @@ declare module "node:sqlite" {
     run(...params: unknown[]): unknown;
     all(...params: unknown[]): unknown[];
     get(...params: unknown[]): unknown;
+    iterate(...params: unknown[]): IterableIterator<unknown>;
   }
 }
@@ -601,12 +601,12 @@ async function sanitizePiEvent(input: {
   threshold: number;
 }): Promise<{ payload: JsonObject; artifactRefs: string[] }> {
   const artifactRefs: string[] = [];
-  const jsonSafeEvent = JSON.parse(JSON.stringify(input.event)) as unknown;
-  const payload = await spillLargeStrings(jsonSafeEvent, {
+  const payload = await spillLargeStrings(input.event, {
     artifactStore: input.artifactStore,
     artifactRefs,
     taskId: input.taskId,
-    threshold: input.threshold
+    threshold: input.threshold,
+    ancestors: []
   });
   return {
     payload: payload as JsonObject,
@@ -614,15 +614,25 @@ async function sanitizePiEvent(input: {
   };
 }
 
+// Walks the event once, applying JSON.stringify value semantics while spilling
+// large strings, instead of round-tripping the whole event through JSON first.
 async function spillLargeStrings(
-  value: unknown,
+  rawValue: unknown,
   input: {
     artifactStore?: ArtifactStore;
     artifactRefs: string[];
     taskId?: string;
     threshold: number;
+    ancestors: readonly object[];
   }
 ): Promise<unknown> {
+  const value = isRecord(rawValue) && typeof rawValue.toJSON === "function" ? rawValue.toJSON() : rawValue;
+  if (typeof value === "number") {
+    return Number.isFinite(value) ? value : null;
+  }
+  if (value === undefined || typeof value === "function" || typeof value === "symbol") {
+    return null;
+  }
   if (typeof value === "string") {
     if (value.length <= input.threshold) {
       return value;
@@ -640,13 +650,20 @@ async function spillLargeStrings(
     input.artifactRefs.push(record.artifactRef);
     return artifactPointer(record, value.length);
   }
-  if (Array.isArray(value)) {
-    return Promise.all(value.map((item) => spillLargeStrings(item, input)));
-  }
   if (value && typeof value === "object") {
+    if (input.ancestors.includes(value)) {
+      throw new TypeError("Converting circular structure to JSON");
+    }
+    const childInput = { ...input, ancestors: [...input.ancestors, value] };
+    if (Array.isArray(value)) {
+      return Promise.all(value.map((item) => spillLargeStrings(item, childInput)));
+    }
     const output: JsonObject = {};
     for (const [key, propertyValue] of Object.entries(value)) {
-      output[key] = await spillLargeStrings(propertyValue, input);
+      if (propertyValue === undefined || typeof propertyValue === "function" || typeof propertyValue === "symbol") {
+        continue;
+      }
+      output[key] = await spillLargeStrings(propertyValue, childInput);
     }
     return output;
   }
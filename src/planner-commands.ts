@@ -8,6 +8,8 @@ import type {
 
 export class PlannerProtocolError extends Error {}
 
+const TASK_GRAPH_STATUSES = new Set<string>(["open", "partial", "completed", "blocked", "failed", "archived"]);
+
 export function normalizePlannerDecision(value: unknown): PlannerDecision {
   if (!isRecord(value)) {
     throw new PlannerProtocolError("Planner output must be a JSON object");
@@ -131,7 +133,7 @@ function requireNodeId(value: unknown): string {
 }
 
 function requireTaskStatus(value: unknown): TaskGraphStatus {
-  if (["open", "partial", "completed", "blocked", "failed", "archived"].includes(String(value))) {
+  if (TASK_GRAPH_STATUSES.has(String(value))) {
     return value as TaskGraphStatus;
   }
   throw new PlannerProtocolError(`Invalid task status: ${String(value)}`);
@@ -809,15 +809,16 @@ function compactHeadTail(value: string, maxChars: number): string {
   return `${normalized.slice(0, headLength)}${marker}${normalized.slice(-tailLength)}`;
 }
 
+const CONTEXT_PROPERTY_KEYS = [
+  "status", "host", "hostname", "ip", "port", "protocol", "scheme", "service", "url", "endpoint", "path", "method",
+  "name", "location", "in", "username", "role", "valid", "confidence", "resultSummary", "checkpointReason",
+  "blockerReason", "pendingCondition", "sessionId", "agentSessionId", "shellSessionId", "tunnelId", "routeId",
+  "createdAt", "updatedAt", "lastSeenAt", "expiresAt", "closedAt", "transport", "localHost", "localPort",
+  "remoteHost", "remotePort", "via"
+];
+
 function compactNodeProperties(properties: Record<string, unknown>): Record<string, unknown> {
-  const allowedKeys = [
-    "status", "host", "hostname", "ip", "port", "protocol", "scheme", "service", "url", "endpoint", "path", "method",
-    "name", "location", "in", "username", "role", "valid", "confidence", "resultSummary", "checkpointReason",
-    "blockerReason", "pendingCondition", "sessionId", "agentSessionId", "shellSessionId", "tunnelId", "routeId",
-    "createdAt", "updatedAt", "lastSeenAt", "expiresAt", "closedAt", "transport", "localHost", "localPort",
-    "remoteHost", "remotePort", "via"
-  ];
-  return Object.fromEntries(allowedKeys
+  return Object.fromEntries(CONTEXT_PROPERTY_KEYS
     .filter((key) => properties[key] !== undefined)
     .map((key) => [key, compactContextPropertyValue(key, properties[key])]));
 }
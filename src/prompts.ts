@@ -536,25 +536,26 @@ ${input.invalidOutputPreview.slice(0, 4000)}
 }
 
 export function stableJson(value: unknown): string {
-  return JSON.stringify(value, Object.keys(flattenKeys(value)).sort(), 2);
+  return JSON.stringify(withSortedKeys(value), null, 2);
 }
 
 function stableCompactJson(value: unknown): string {
-  return JSON.stringify(value, Object.keys(flattenKeys(value)).sort());
+  return JSON.stringify(withSortedKeys(value));
 }
 
-function flattenKeys(value: unknown, keys: Record<string, true> = {}): Record<string, true> {
+// Sorting each object's own keys in one walk avoids a global key allow-list, which
+// JSON.stringify would re-check against every object in large graph slices.
+function withSortedKeys(value: unknown): unknown {
   if (Array.isArray(value)) {
-    for (const item of value) {
-      flattenKeys(item, keys);
-    }
-    return keys;
+    return value.map(withSortedKeys);
   }
-  if (value && typeof value === "object") {
-    for (const [propertyName, propertyValue] of Object.entries(value)) {
-      keys[propertyName] = true;
-      flattenKeys(propertyValue, keys);
-    }
+  if (!value || typeof value !== "object" || typeof (value as { toJSON?: unknown }).toJSON === "function") {
+    return value;
+  }
+  const record = value as Record<string, unknown>;
+  const sorted: Record<string, unknown> = {};
+  for (const key of Object.keys(record).sort()) {
+    sorted[key] = withSortedKeys(record[key]);
   }
-  return keys;
+  return sorted;
 }
@@ -1,10 +1,12 @@
-import { appendFile, mkdir, readFile, stat, writeFile } from "node:fs/promises";
+import { appendFile, mkdir, open, rename, rm, stat, writeFile } from "node:fs/promises";
 import { existsSync, mkdirSync, readFileSync } from "node:fs";
 import { dirname, join } from "node:path";
 import { createHash, randomUUID } from "node:crypto";
 import { DatabaseSync } from "node:sqlite";
 import { toJsonLine } from "../json.js";
 import type { ArtifactRecord } from "../types.js";
+import { timeOrderedUuid } from "./time-ordered-id.js";
+import { STORE_CONNECTION_PRAGMAS } from "./sqlite-pragmas.js";
 
 type ArtifactRow = {
   artifact_ref: string;
@@ -22,13 +24,16 @@ export class ArtifactStore {
   readonly rootDir: string;
   readonly databasePath: string;
   private readonly database: DatabaseSync;
+  private pendingIndexLines: string[] = [];
+  private pendingIndexWrite?: Promise<void>;
+  private indexWriteChain: Promise<void> = Promise.resolve();
 
   constructor(rootDir: string, databasePath = join(dirname(rootDir), "state.sqlite")) {
     this.rootDir = rootDir;
     this.databasePath = databasePath;
     mkdirSync(dirname(databasePath), { recursive: true });
     this.database = new DatabaseSync(databasePath);
-    this.database.exec("PRAGMA journal_mode = WAL; PRAGMA busy_timeout = 5000;");
+    this.database.exec(STORE_CONNECTION_PRAGMAS);
     this.initialize();
     this.importLegacyIndex();
   }
@@ -56,13 +61,22 @@ export class ArtifactStore {
     }
 
     const createdAt = new Date().toISOString();
-    const artifactRef = `artifact:${randomUUID()}`;
+    const artifactRef = `artifact:${timeOrderedUuid()}`;
     const extension = input.extension ?? extensionForKind(input.kind);
     const relativePath = join(input.taskId ?? "global", `${contentHash}.${extension}`);
     const absolutePath = join(this.rootDir, relativePath);
     await mkdir(dirname(absolutePath), { recursive: true });
     if (!existsSync(absolutePath)) {
-      await writeFile(absolutePath, dataBuffer);
+      // Content-addressed files are never rewritten once present, so a torn write
+      // must not land at the final path; publish through a same-directory rename.
+      const temporaryPath = `${absolutePath}.${randomUUID()}.tmp`;
+      try {
+        await writeFile(temporaryPath, dataBuffer);
+        await rename(temporaryPath, absolutePath);
+      } catch (error) {
+        await rm(temporaryPath, { force: true });
+        throw error;
+      }
     }
     const record: ArtifactRecord = {
       artifactRef,
@@ -89,19 +103,22 @@ export class ArtifactStore {
   }
 
   async read(refOrPath: string, range?: { offset?: number; length?: number }): Promise<string> {
-    const fileBuffer = await readFile(await this.resolvePath(refOrPath));
+    const artifactPath = await this.resolvePath(refOrPath);
+    const { size } = await stat(artifactPath);
     const offset = range?.offset ?? 0;
-    const length = range?.length ?? fileBuffer.byteLength - offset;
-    return fileBuffer.subarray(offset, offset + length).toString("utf8");
+    const length = range?.length ?? size - offset;
+    // Same bounds as Buffer#subarray, but only the requested bytes are read.
+    const bound = (value: number) => value < 0 ? Math.max(size + value, 0) : Math.min(value, size);
+    return (await readFileRange(artifactPath, bound(offset), bound(offset + length))).toString("utf8");
   }
 
   async preview(refOrPath: string, maxBytes = 1000): Promise<{ byteLength: number; preview: string }> {
     const artifactPath = await this.resolvePath(refOrPath);
     const fileStat = await stat(artifactPath);
-    const fileBuffer = await readFile(artifactPath);
+    const fileBuffer = await readFileRange(artifactPath, 0, Math.min(fileStat.size, maxBytes));
     return {
       byteLength: fileStat.size,
-      preview: fileBuffer.toString("utf8", 0, Math.min(fileBuffer.byteLength, maxBytes))
+      preview: fileBuffer.toString("utf8")
     };
   }
 
@@ -236,10 +253,23 @@ export class ArtifactStore {
     }
   }
 
-  private async appendRecord(record: ArtifactRecord): Promise<void> {
-    const indexPath = this.indexPath();
-    await mkdir(dirname(indexPath), { recursive: true });
-    await appendFile(indexPath, toJsonLine(record));
+  // Records written while an earlier index append is in flight share the next
+  // appendFile call instead of each paying its own mkdir and write.
+  private appendRecord(record: ArtifactRecord): Promise<void> {
+    this.pendingIndexLines.push(toJsonLine(record));
+    if (!this.pendingIndexWrite) {
+      const indexWrite = this.indexWriteChain.then(async () => {
+        const lines = this.pendingIndexLines;
+        this.pendingIndexLines = [];
+        this.pendingIndexWrite = undefined;
+        const indexPath = this.indexPath();
+        await mkdir(dirname(indexPath), { recursive: true });
+        await appendFile(indexPath, lines.join(""));
+      });
+      this.pendingIndexWrite = indexWrite;
+      this.indexWriteChain = indexWrite.then(() => undefined, () => undefined);
+    }
+    return this.pendingIndexWrite;
   }
 
   private async resolvePath(refOrPath: string): Promise<string> {
@@ -302,6 +332,20 @@ export class ArtifactStore {
   }
 }
 
+async function readFileRange(path: string, start: number, end: number): Promise<Buffer> {
+  if (end <= start) {
+    return Buffer.alloc(0);
+  }
+  const handle = await open(path, "r");
+  try {
+    const buffer = Buffer.alloc(end - start);
+    const { bytesRead } = await handle.read(buffer, 0, buffer.byteLength, start);
+    return buffer.subarray(0, bytesRead);
+  } finally {
+    await handle.close();
+  }
+}
+
 function rowToRecord(row: ArtifactRow): ArtifactRecord {
   return {
     artifactRef: row.artifact_ref,
@@ -3,6 +3,7 @@ import { mkdirSync } from "node:fs";
 import { dirname } from "node:path";
 import { DatabaseSync } from "node:sqlite";
 import type { JsonObject, OperationalStatus } from "../types.js";
+import { STORE_CONNECTION_PRAGMAS } from "./sqlite-pragmas.js";
 
 export type ConnectivityKind = "session" | "tunnel" | "route";
 export type ConnectivityDesiredState = "running" | "stopped" | "closed";
@@ -90,7 +91,7 @@ export class ConnectivityStore {
     this.clock = options.clock ?? (() => new Date());
     mkdirSync(dirname(databasePath), { recursive: true });
     this.database = new DatabaseSync(databasePath);
-    this.database.exec("PRAGMA journal_mode = WAL; PRAGMA busy_timeout = 5000;");
+    this.database.exec(STORE_CONNECTION_PRAGMAS);
     this.initialize();
   }
 
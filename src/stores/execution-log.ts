@@ -1,10 +1,10 @@
 import { appendFile } from "node:fs/promises";
 import { existsSync, mkdirSync, readFileSync } from "node:fs";
 import { dirname, join } from "node:path";
-import { randomUUID } from "node:crypto";
-import { DatabaseSync } from "node:sqlite";
-import { toJsonLine } from "../json.js";
+import { DatabaseSync, type StatementSync } from "node:sqlite";
 import type { AgentRole, ExecutionEvent, JsonObject } from "../types.js";
+import { timeOrderedUuid } from "./time-ordered-id.js";
+import { STORE_CONNECTION_PRAGMAS } from "./sqlite-pragmas.js";
 
 type ExecutionEventRow = {
   seq: number;
@@ -19,12 +19,49 @@ type ExecutionEventRow = {
   artifact_refs_json: string;
 };
 
+const TASK_OUTCOME_STATUSES = new Set(["completed", "partial", "blocked", "failed"]);
+// Only these event types contribute payload fields to metrics; every other event
+// is counted from its role and type columns alone.
+const METRICS_PAYLOAD_EVENT_TYPES = [
+  "tool_started",
+  "tool_finished",
+  "provider_error",
+  "turn_usage",
+  "invocation_metrics",
+  "projection_input_built",
+  "projection_job_succeeded",
+  "projection_job_failed",
+  "supervisor_check_succeeded"
+];
+
+// Decoded events share one copy of each role and event type. Only these
+// low-cardinality columns are interned; ids and summaries rarely repeat enough
+// to pay for a lookup, and the bound keeps unexpected vocabularies from growing it.
+const MAX_EVENT_VOCABULARY_STRINGS = 512;
+const eventVocabularyStrings = new Map<string, string>();
+
+export function eventVocabularyCacheSize(): number {
+  return eventVocabularyStrings.size;
+}
+
 export class ExecutionLog {
   readonly filePath: string;
   readonly databasePath: string;
   private readonly database: DatabaseSync;
+  private readonly insertEventStatement: StatementSync;
+  private readonly latestSeqStatement: StatementSync;
+  private readonly latestTaskSeqStatement: StatementSync;
+  private readonly seqForEventStatement: StatementSync;
   private readonly listeners = new Set<(event: ExecutionEvent) => void>();
   private mirrorWriteChain: Promise<void> = Promise.resolve();
+  private pendingMirrorLines: string[] = [];
+  private pendingMirrorWrite?: Promise<void>;
+  private pendingInserts: Array<{
+    row: unknown[];
+    resolve: (seq: number) => void;
+    reject: (error: unknown) => void;
+  }> = [];
+  private insertFlushScheduled = false;
 
   constructor(filePath: string, databasePath = join(dirname(filePath), "state.sqlite")) {
     this.filePath = filePath;
@@ -32,12 +69,27 @@ export class ExecutionLog {
     mkdirSync(dirname(databasePath), { recursive: true });
     mkdirSync(dirname(filePath), { recursive: true });
     this.database = new DatabaseSync(databasePath);
-    this.database.exec("PRAGMA journal_mode = WAL; PRAGMA busy_timeout = 5000;");
+    this.database.exec(STORE_CONNECTION_PRAGMAS);
     this.initialize();
+    // Appends are the hottest write in a run, so the insert is compiled once per
+    // connection rather than on every event.
+    this.insertEventStatement = this.database.prepare(`
+      INSERT INTO execution_events (
+        id, epoch_id, task_id, role, event_type, timestamp,
+        summary, payload_json, artifact_refs_json
+      ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    `);
+    // Sequence probes back projection watermarks and cache keys on most events.
+    this.latestSeqStatement = this.database.prepare("SELECT COALESCE(MAX(seq), 0) AS seq FROM execution_events");
+    this.latestTaskSeqStatement = this.database.prepare(
+      "SELECT COALESCE(MAX(seq), 0) AS seq FROM execution_events WHERE task_id = ?"
+    );
+    this.seqForEventStatement = this.database.prepare("SELECT seq FROM execution_events WHERE id = ?");
     this.importLegacyJsonl();
   }
 
   close(): void {
+    this.flushPendingInserts();
     this.database.close();
   }
 
@@ -62,7 +114,7 @@ export class ExecutionLog {
     artifactRefs?: string[];
   }): Promise<ExecutionEvent> {
     const baseEvent = {
-      id: `event:${randomUUID()}`,
+      id: `event:${timeOrderedUuid()}`,
       epochId: input.epochId,
       taskId: input.taskId,
       role: input.role,
@@ -72,12 +124,8 @@ export class ExecutionLog {
       payload: input.payload,
       artifactRefs: input.artifactRefs
     };
-    const result = this.database.prepare(`
-      INSERT INTO execution_events (
-        id, epoch_id, task_id, role, event_type, timestamp,
-        summary, payload_json, artifact_refs_json
-      ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    `).run(
+    const payloadJson = JSON.stringify(baseEvent.payload);
+    const seq = await this.insertEvent([
       baseEvent.id,
       baseEvent.epochId ?? null,
       baseEvent.taskId ?? null,
@@ -85,16 +133,14 @@ export class ExecutionLog {
       baseEvent.eventType,
       baseEvent.timestamp,
       baseEvent.summary ?? null,
-      JSON.stringify(baseEvent.payload),
+      payloadJson,
       JSON.stringify(baseEvent.artifactRefs ?? [])
-    );
+    ]);
     const event: ExecutionEvent = {
       ...baseEvent,
-      seq: Number(result.lastInsertRowid)
+      seq
     };
-    const mirrorWrite = this.mirrorWriteChain.then(() => appendFile(this.filePath, toJsonLine(event)));
-    this.mirrorWriteChain = mirrorWrite.then(() => undefined, () => undefined);
-    await mirrorWrite;
+    await this.mirror(toMirrorLine(event, payloadJson));
     for (const listener of this.listeners) {
       try {
         listener(event);
@@ -103,6 +149,69 @@ export class ExecutionLog {
     return event;
   }
 
+  // Appends made in the same tick are inserted together in one transaction, so a
+  // burst of events costs one commit. Reads on this log flush pending rows first.
+  private insertEvent(row: unknown[]): Promise<number> {
+    return new Promise<number>((resolve, reject) => {
+      this.pendingInserts.push({ row, resolve, reject });
+      if (!this.insertFlushScheduled) {
+        this.insertFlushScheduled = true;
+        queueMicrotask(() => this.flushPendingInserts());
+      }
+    });
+  }
+
+  private flushPendingInserts(): void {
+    this.insertFlushScheduled = false;
+    const batch = this.pendingInserts;
+    if (batch.length === 0) {
+      return;
+    }
+    this.pendingInserts = [];
+    if (batch.length > 1) {
+      try {
+        this.database.exec("BEGIN");
+        const seqs = batch.map(({ row }) => Number(this.insertEventStatement.run(...row).lastInsertRowid));
+        this.database.exec("COMMIT");
+        batch.forEach(({ resolve }, index) => resolve(seqs[index]));
+        return;
+      } catch {
+        // SQLite may already have rolled back (SQLITE_FULL, IOERR) or the log may be
+        // closed; this runs from a microtask, so the rollback must never throw.
+        try {
+          if (this.database.isTransaction) {
+            this.database.exec("ROLLBACK");
+          }
+        } catch {}
+      }
+    }
+    // A failed batch falls back to row-by-row inserts so only the bad row fails.
+    for (const { row, resolve, reject } of batch) {
+      try {
+        resolve(Number(this.insertEventStatement.run(...row).lastInsertRowid));
+      } catch (error) {
+        reject(error);
+      }
+    }
+  }
+
+  // Lines appended while an earlier mirror write is in flight are coalesced
+  // into one appendFile call, keeping their seq order in the JSONL mirror.
+  private mirror(line: string): Promise<void> {
+    this.pendingMirrorLines.push(line);
+    if (!this.pendingMirrorWrite) {
+      const mirrorWrite = this.mirrorWriteChain.then(() => {
+        const lines = this.pendingMirrorLines;
+        this.pendingMirrorLines = [];
+        this.pendingMirrorWrite = undefined;
+        return appendFile(this.filePath, lines.join(""));
+      });
+      this.pendingMirrorWrite = mirrorWrite;
+      this.mirrorWriteChain = mirrorWrite.then(() => undefined, () => undefined);
+    }
+    return this.pendingMirrorWrite;
+  }
+
   async window(input: {
     taskId?: string;
     epochId?: string;
@@ -111,6 +220,7 @@ export class ExecutionLog {
     eventTypes?: string[];
     roles?: Array<AgentRole | "runtime">;
   }): Promise<{ events: ExecutionEvent[]; nextCursor?: string }> {
+    this.flushPendingInserts();
     const where: string[] = [];
     const parameters: Array<string | number> = [];
     if (input.taskId) {
@@ -156,6 +266,7 @@ export class ExecutionLog {
     roles?: Array<AgentRole | "runtime">;
     eventTypes?: string[];
   }): Promise<ExecutionEvent[]> {
+    this.flushPendingInserts();
     const where = ["task_id = ?", "seq > ?", "seq <= ?"];
     const parameters: Array<string | number> = [input.taskId, input.afterSeq, input.toSeq];
     if (input.roles && input.roles.length > 0) {
@@ -166,35 +277,45 @@ export class ExecutionLog {
       where.push(`event_type IN (${input.eventTypes.map(() => "?").join(",")})`);
       parameters.push(...input.eventTypes);
     }
-    const rows = this.database.prepare(`
+    return decodeEventRows(this.database.prepare(`
       SELECT * FROM execution_events WHERE ${where.join(" AND ")} ORDER BY seq ASC
-    `).all(...parameters) as ExecutionEventRow[];
-    return rows.map(rowToEvent);
+    `).iterate(...parameters));
   }
 
   latestSeq(taskId?: string): number {
-    const row = taskId
-      ? this.database.prepare("SELECT COALESCE(MAX(seq), 0) AS seq FROM execution_events WHERE task_id = ?").get(taskId)
-      : this.database.prepare("SELECT COALESCE(MAX(seq), 0) AS seq FROM execution_events").get();
+    this.flushPendingInserts();
+    const row = taskId ? this.latestTaskSeqStatement.get(taskId) : this.latestSeqStatement.get();
     return Number((row as { seq: number }).seq);
   }
 
   seqForEvent(eventId: string): number | undefined {
-    const row = this.database.prepare("SELECT seq FROM execution_events WHERE id = ?")
-      .get(eventId) as { seq: number } | undefined;
+    this.flushPendingInserts();
+    const row = this.seqForEventStatement.get(eventId) as { seq: number } | undefined;
     return row ? Number(row.seq) : undefined;
   }
 
   async readAll(): Promise<ExecutionEvent[]> {
-    const rows = this.database.prepare("SELECT * FROM execution_events ORDER BY seq ASC").all() as ExecutionEventRow[];
-    return rows.map(rowToEvent);
+    this.flushPendingInserts();
+    return decodeEventRows(this.database.prepare("SELECT * FROM execution_events ORDER BY seq ASC").iterate());
   }
 
   metrics(afterSeq = 0): Record<string, unknown> {
+    this.flushPendingInserts();
+    const payloadTypePlaceholders = METRICS_PAYLOAD_EVENT_TYPES.map(() => "?").join(",");
     const rows = this.database.prepare(`
-      SELECT * FROM execution_events WHERE seq >= ? ORDER BY seq ASC
-    `).all(Math.max(0, afterSeq)) as ExecutionEventRow[];
-    const events = rows.map(rowToEvent);
+      SELECT seq, role, event_type, timestamp,
+             CASE WHEN event_type IN (${payloadTypePlaceholders}) THEN payload_json END AS payload_json
+      FROM execution_events WHERE seq >= ? ORDER BY seq ASC
+    `).all(...METRICS_PAYLOAD_EVENT_TYPES, Math.max(0, afterSeq)) as Array<
+      Pick<ExecutionEventRow, "seq" | "role" | "event_type" | "timestamp"> & { payload_json: string | null }
+    >;
+    const events = rows.map((row) => ({
+      seq: Number(row.seq),
+      role: row.role,
+      eventType: row.event_type,
+      timestamp: row.timestamp,
+      payload: row.payload_json === null ? {} : JSON.parse(row.payload_json) as JsonObject
+    }));
     const byRole: Record<string, number> = {};
     const byEventType: Record<string, number> = {};
     const taskOutcomes: Record<string, number> = {};
@@ -253,17 +374,19 @@ export class ExecutionLog {
       }
       if (event.eventType.startsWith("task_")) {
         const outcome = event.eventType.slice("task_".length);
-        if (["completed", "partial", "blocked", "failed"].includes(outcome)) {
+        if (TASK_OUTCOME_STATUSES.has(outcome)) {
           taskOutcomes[outcome] = (taskOutcomes[outcome] ?? 0) + 1;
         }
       }
-      if (event.eventType === "turn_usage" && accumulateUsage(turnUsage, event.payload.usage)) {
+      const usage = event.eventType === "turn_usage" ? readUsage(event.payload.usage) : undefined;
+      if (usage) {
+        accumulateUsage(turnUsage, usage);
         turnsWithUsage += 1;
         const modelKey = [stringValue(event.payload.provider), stringValue(event.payload.model)]
           .filter((value): value is string => Boolean(value))
           .join("/") || "unknown";
         const modelUsage = turnUsageByModel[modelKey] ?? createUsageAccumulator();
-        accumulateUsage(modelUsage, event.payload.usage);
+        accumulateUsage(modelUsage, usage);
         turnUsageByModel[modelKey] = modelUsage;
       }
       if (event.eventType === "invocation_metrics") {
@@ -271,13 +394,13 @@ export class ExecutionLog {
         const invocationKind = stringValue(event.payload.invocationKind) ?? "unknown";
         const status = stringValue(event.payload.status) ?? "unknown";
         invocationByStatus[status] = (invocationByStatus[status] ?? 0) + 1;
-        const stats = recordValue(event.payload.stats);
-        accumulateUsage(invocationUsage, stats?.usage);
+        const invocationUsageDelta = readUsage(recordValue(event.payload.stats)?.usage);
+        accumulateUsage(invocationUsage, invocationUsageDelta);
         accumulateNumber(invocationDurationMs, event.payload.durationMs);
         accumulateNumber(invocationInputBytes, event.payload.inputBytes);
         const kindMetrics = invocationByKind[invocationKind] ?? createInvocationAccumulator();
         kindMetrics.count += 1;
-        accumulateUsage(kindMetrics.usage, stats?.usage);
+        accumulateUsage(kindMetrics.usage, invocationUsageDelta);
         accumulateNumber(kindMetrics.durationMs, event.payload.durationMs);
         accumulateNumber(kindMetrics.inputBytes, event.payload.inputBytes);
         invocationByKind[invocationKind] = kindMetrics;
@@ -416,6 +539,33 @@ export class ExecutionLog {
   }
 }
 
+// Payloads can carry large tool output, so the mirror line splices in the JSON
+// already written to payload_json rather than serializing the payload again.
+// Fields keep the order of the event object itself.
+function toMirrorLine(event: ExecutionEvent, payloadJson: string): string {
+  const head = JSON.stringify({
+    id: event.id,
+    epochId: event.epochId,
+    taskId: event.taskId,
+    role: event.role,
+    eventType: event.eventType,
+    timestamp: event.timestamp,
+    summary: event.summary
+  });
+  const tail = JSON.stringify({ artifactRefs: event.artifactRefs, seq: event.seq });
+  return `${head.slice(0, -1)},"payload":${payloadJson},${tail.slice(1)}\n`;
+}
+
+// Long ranges are decoded as SQLite steps through them, so the raw row array and
+// the decoded events are never both held in memory.
+function decodeEventRows(rows: Iterable<unknown>): ExecutionEvent[] {
+  const events: ExecutionEvent[] = [];
+  for (const row of rows) {
+    events.push(rowToEvent(row as ExecutionEventRow));
+  }
+  return events;
+}
+
 function rowToEvent(row: ExecutionEventRow): ExecutionEvent {
   const artifactRefs = JSON.parse(row.artifact_refs_json) as string[];
   return {
@@ -423,8 +573,8 @@ function rowToEvent(row: ExecutionEventRow): ExecutionEvent {
     id: row.id,
     epochId: row.epoch_id ?? undefined,
     taskId: row.task_id ?? undefined,
-    role: row.role,
-    eventType: row.event_type,
+    role: eventVocabularyString(row.role),
+    eventType: eventVocabularyString(row.event_type),
     timestamp: row.timestamp,
     summary: row.summary ?? undefined,
     payload: JSON.parse(row.payload_json) as JsonObject,
@@ -432,6 +582,17 @@ function rowToEvent(row: ExecutionEventRow): ExecutionEvent {
   };
 }
 
+function eventVocabularyString<T extends string>(value: T): T {
+  const canonical = eventVocabularyStrings.get(value);
+  if (canonical !== undefined) {
+    return canonical as T;
+  }
+  if (eventVocabularyStrings.size < MAX_EVENT_VOCABULARY_STRINGS) {
+    eventVocabularyStrings.set(value, value);
+  }
+  return value;
+}
+
 function createUsageAccumulator(): {
   input: number;
   output: number;
@@ -484,23 +645,42 @@ function summarizeNumberAccumulator(
   };
 }
 
+// Usage payloads are normalized once per event and then added to every
+// accumulator that tracks them (overall, per model, per invocation kind).
+function readUsage(value: unknown): ReturnType<typeof createUsageAccumulator> | undefined {
+  const usage = recordValue(value);
+  if (!usage) {
+    return undefined;
+  }
+  const input = numberValue(usage.input);
+  const output = numberValue(usage.output);
+  const cacheRead = numberValue(usage.cacheRead);
+  const cacheWrite = numberValue(usage.cacheWrite);
+  return {
+    input,
+    output,
+    cacheRead,
+    cacheWrite,
+    reasoning: numberValue(usage.reasoning),
+    totalTokens: numberValue(usage.totalTokens) || input + output + cacheRead + cacheWrite,
+    cost: numberValue(recordValue(usage.cost)?.total ?? usage.cost)
+  };
+}
+
 function accumulateUsage(
   accumulator: ReturnType<typeof createUsageAccumulator>,
-  value: unknown
-): boolean {
-  const usage = recordValue(value);
+  usage: ReturnType<typeof createUsageAccumulator> | undefined
+): void {
   if (!usage) {
-    return false;
+    return;
   }
-  accumulator.input += numberValue(usage.input);
-  accumulator.output += numberValue(usage.output);
-  accumulator.cacheRead += numberValue(usage.cacheRead);
-  accumulator.cacheWrite += numberValue(usage.cacheWrite);
-  accumulator.reasoning += numberValue(usage.reasoning);
-  accumulator.totalTokens += numberValue(usage.totalTokens)
-    || numberValue(usage.input) + numberValue(usage.output) + numberValue(usage.cacheRead) + numberValue(usage.cacheWrite);
-  accumulator.cost += numberValue(recordValue(usage.cost)?.total ?? usage.cost);
-  return true;
+  accumulator.input += usage.input;
+  accumulator.output += usage.output;
+  accumulator.cacheRead += usage.cacheRead;
+  accumulator.cacheWrite += usage.cacheWrite;
+  accumulator.reasoning += usage.reasoning;
+  accumulator.totalTokens += usage.totalTokens;
+  accumulator.cost += usage.cost;
 }
 
 function recordValue(value: unknown): Record<string, unknown> | undefined {
@@ -1,8 +1,6 @@
 import { appendFileSync, mkdirSync } from "node:fs";
 import { dirname } from "node:path";
-import { randomUUID } from "node:crypto";
-import { DatabaseSync } from "node:sqlite";
-import { toJsonLine } from "../json.js";
+import { DatabaseSync, type StatementSync } from "node:sqlite";
 import { operationIdentityKeys, stableOperationIdentityId } from "../operation-identity.js";
 import type {
   GraphDelta,
@@ -21,6 +19,8 @@ import type {
   TaskGraphStatus,
   TaskResult
 } from "../types.js";
+import { timeOrderedUuid } from "./time-ordered-id.js";
+import { STORE_CONNECTION_PRAGMAS } from "./sqlite-pragmas.js";
 
 export class GraphValidationError extends Error {}
 
@@ -114,21 +114,79 @@ export type ProjectionCommitResult = {
   orphanNodeIds: string[];
 };
 
+// A graph_deltas row as written: its serialized delta and the timestamp shared by
+// every row the delta touched.
+type CommittedGraphDelta = {
+  json: string;
+  createdAt: string;
+};
+
+type ProjectionClosureInput = {
+  taskId: string;
+  scopeRef: string;
+  dependencyTaskIds?: string[];
+  targetRefs?: string[];
+  anchors?: string[];
+  nodeLimit?: number;
+  edgeLimit?: number;
+};
+
+const MAX_CACHED_PROJECTION_CLOSURES = 32;
+const MAX_INSERT_PARAMETERS = 999;
+const MAX_KNOWN_OPERATION_IDENTITY_KEYS = 10_000;
+
 export class SQLiteGraphStore {
   readonly databasePath: string;
   readonly deltaLogPath: string;
   private readonly database: DatabaseSync;
+  private readonly graphVersionStatement: StatementSync;
+  private readonly hasNodeStatement: StatementSync;
+  private readonly deleteEdgesByTypeStatement: StatementSync;
+  private readonly selectDeltaNodesStatement: StatementSync;
+  private readonly selectDeltaEdgesStatement: StatementSync;
+  private readonly selectEndpointStatement: StatementSync;
+  private readonly insertGraphDeltaStatement: StatementSync;
+  // Multi-row inserts keyed by row count and template; deltas mostly repeat a few sizes.
+  private readonly insertRowsStatements = new Map<string, StatementSync>();
+  private plannerDecisionViewCache?: { version: number; limit: number; view: PlannerDecisionView };
+  private projectionClosureCache?: { version: number; closures: Map<string, { nodes: GraphNode[]; edges: GraphEdge[] }> };
+  private pendingDeltaLogLines: string[] = [];
+  // Identity keys already recorded in operation_identities; keys staged during a
+  // projection commit are only remembered once that commit succeeds.
+  private readonly knownOperationIdentityKeys = new Set<string>();
+  private stagedOperationIdentityKeys: string[] = [];
+  private deltaLogFlush?: NodeJS.Immediate;
 
   constructor(databasePath: string, deltaLogPath: string) {
     this.databasePath = databasePath;
     this.deltaLogPath = deltaLogPath;
     mkdirSync(dirname(databasePath), { recursive: true });
     this.database = new DatabaseSync(databasePath);
-    this.database.exec("PRAGMA journal_mode = WAL; PRAGMA busy_timeout = 5000;");
+    this.database.exec(STORE_CONNECTION_PRAGMAS);
     this.initialize();
+    // Version and existence probes run ahead of nearly every cached read, so
+    // they are compiled once per connection.
+    this.graphVersionStatement = this.database.prepare("SELECT COALESCE(MAX(rowid), 0) AS version FROM graph_deltas");
+    this.hasNodeStatement = this.database.prepare("SELECT 1 FROM nodes WHERE id = ?");
+    // The fixed-shape reads and writes of every applied delta.
+    this.deleteEdgesByTypeStatement = this.database.prepare("DELETE FROM edges WHERE from_id = ? AND type = ?");
+    this.selectDeltaNodesStatement = this.database.prepare(`
+      SELECT id, graph_kind, type, properties_json, evidence_refs_json FROM nodes
+      WHERE id IN (SELECT value FROM json_each(?))
+    `);
+    this.selectDeltaEdgesStatement = this.database.prepare(`
+      SELECT id, from_id, to_id, type, properties_json, evidence_refs_json FROM edges
+      WHERE id IN (SELECT value FROM json_each(?))
+    `);
+    this.selectEndpointStatement = this.database.prepare("SELECT graph_kind, type FROM nodes WHERE id = ?");
+    this.insertGraphDeltaStatement = this.database.prepare(`
+      INSERT INTO graph_deltas (id, source_event_ids_json, delta_json, created_at)
+      VALUES (?, ?, ?, ?)
+    `);
   }
 
   close(): void {
+    this.flushDeltaLog();
     this.database.close();
   }
 
@@ -148,6 +206,7 @@ export class SQLiteGraphStore {
     let remappedNodeCount = 0;
     let mergedNodeCount = 0;
     let orphanNodeIds: string[] = [];
+    let committed!: CommittedGraphDelta;
     this.database.exec("BEGIN IMMEDIATE");
     try {
       const state = this.database.prepare(`
@@ -180,7 +239,7 @@ export class SQLiteGraphStore {
       committedDelta = rebased.delta;
       remappedNodeCount = rebased.remappedNodeCount;
       mergedNodeCount = rebased.mergedNodeCount;
-      this.applyDeltaInTransaction(committedDelta, [], true);
+      committed = this.applyDeltaInTransaction(committedDelta, [], true);
       orphanNodeIds = this.findOrphanNodeIds(committedDelta.nodes.map((node) => node.id));
       const updated = this.database.prepare(`
         UPDATE projection_states
@@ -188,7 +247,7 @@ export class SQLiteGraphStore {
         WHERE task_id = ? AND committed_seq = ? AND active_generation = ?
       `).run(
         input.toSeq,
-        new Date().toISOString(),
+        committed.createdAt,
         input.taskId,
         input.fromSeq,
         input.generation
@@ -199,9 +258,11 @@ export class SQLiteGraphStore {
       this.database.exec("COMMIT");
     } catch (error) {
       this.database.exec("ROLLBACK");
+      this.stagedOperationIdentityKeys = [];
       throw error;
     }
-    appendDeltaLog(this.deltaLogPath, committedDelta);
+    this.rememberOperationIdentityKeys();
+    this.appendDeltaLog(committed);
     return { delta: committedDelta, remappedNodeCount, mergedNodeCount, orphanNodeIds };
   }
 
@@ -211,8 +272,11 @@ export class SQLiteGraphStore {
     mergedNodeCount: number;
   } {
     this.refreshOperationIdentityIndexInTransaction();
+    // Identity keys and merge targets only ever involve operation nodes, so the
+    // task and reasoning graphs are not materialized on every projection commit.
     const existingNodes = (this.database.prepare(`
-      SELECT id, graph_kind, type, label, properties_json, evidence_refs_json FROM nodes
+      SELECT id, graph_kind, type, label, properties_json, evidence_refs_json
+      FROM nodes WHERE graph_kind = 'operation'
     `).all() as StoredNodeRow[]).map(rowToNode);
     const existingEdges = (this.database.prepare(`
       SELECT id, from_id, to_id, type, properties_json, evidence_refs_json FROM edges
@@ -315,26 +379,44 @@ export class SQLiteGraphStore {
     `);
     const now = new Date().toISOString();
     for (const [nodeId, identityKey] of identities) {
+      if (this.knownOperationIdentityKeys.has(identityKey)) {
+        continue;
+      }
       insert.run(identityKey, nodeId, now);
+      this.stagedOperationIdentityKeys.push(identityKey);
+    }
+  }
+
+  private rememberOperationIdentityKeys(): void {
+    for (const identityKey of this.stagedOperationIdentityKeys) {
+      this.knownOperationIdentityKeys.add(identityKey);
+    }
+    this.stagedOperationIdentityKeys = [];
+    for (const identityKey of this.knownOperationIdentityKeys) {
+      if (this.knownOperationIdentityKeys.size <= MAX_KNOWN_OPERATION_IDENTITY_KEYS) {
+        break;
+      }
+      this.knownOperationIdentityKeys.delete(identityKey);
     }
   }
 
   findOrphanNodeIds(nodeIds: string[]): string[] {
     const uniqueIds = dedupeStringValues(nodeIds);
-    const orphanIds: string[] = [];
-    const query = this.database.prepare(`
-      SELECT n.id
-      FROM nodes n
-      WHERE n.id = ?
-        AND n.graph_kind IN ('operation', 'reasoning')
-        AND NOT EXISTS (SELECT 1 FROM edges e WHERE e.from_id = n.id OR e.to_id = n.id)
-    `);
-    for (const nodeId of uniqueIds) {
-      if (query.get(nodeId)) {
-        orphanIds.push(nodeId);
-      }
+    if (uniqueIds.length === 0) {
+      return [];
     }
-    return orphanIds;
+    // One set-based statement over all candidates; the edge probes are split so
+    // each one can use its endpoint index instead of an OR scan.
+    const rows = this.database.prepare(`
+      SELECT n.id
+      FROM json_each(?) candidate
+      JOIN nodes n ON n.id = candidate.value
+      WHERE n.graph_kind IN ('operation', 'reasoning')
+        AND NOT EXISTS (SELECT 1 FROM edges e WHERE e.from_id = n.id)
+        AND NOT EXISTS (SELECT 1 FROM edges e WHERE e.to_id = n.id)
+      ORDER BY candidate.key
+    `).all(JSON.stringify(uniqueIds)) as Array<{ id: string }>;
+    return rows.map((row) => row.id);
   }
 
   private applyDelta(
@@ -342,35 +424,39 @@ export class SQLiteGraphStore {
     edgeReplacements: Array<{ from: string; type: string }> = []
   ): void {
     validateGraphDelta(delta);
+    let committed!: CommittedGraphDelta;
     this.database.exec("BEGIN");
     try {
-      this.applyDeltaInTransaction(delta, edgeReplacements);
+      committed = this.applyDeltaInTransaction(delta, edgeReplacements);
       this.database.exec("COMMIT");
     } catch (error) {
       this.database.exec("ROLLBACK");
       throw error;
     }
-    appendDeltaLog(this.deltaLogPath, delta);
+    this.appendDeltaLog(committed);
   }
 
   private applyDeltaInTransaction(
     delta: GraphDelta,
     edgeReplacements: Array<{ from: string; type: string }>,
     requireEdgeEndpoints = false
-  ): void {
+  ): CommittedGraphDelta {
+    const now = new Date().toISOString();
     for (const replacement of edgeReplacements) {
-      this.database.prepare("DELETE FROM edges WHERE from_id = ? AND type = ?")
-        .run(replacement.from, replacement.type);
+      this.deleteEdgesByTypeStatement.run(replacement.from, replacement.type);
     }
+    // Every node and edge the delta touches is read in one keyed query up front, so
+    // each write is a single UPSERT rather than a SELECT followed by an UPSERT.
+    const existingNodes = new Map<string, Omit<StoredNodeRow, "label">>();
+    if (delta.nodes.length > 0) {
+      const rows = this.selectDeltaNodesStatement.all(JSON.stringify(delta.nodes.map((node) => node.id))) as Array<Omit<StoredNodeRow, "label">>;
+      for (const row of rows) {
+        existingNodes.set(row.id, row);
+      }
+    }
+    const nodeWrites = new Map<string, unknown[]>();
     for (const node of delta.nodes) {
-      const existing = this.database.prepare(`
-        SELECT graph_kind, type, properties_json, evidence_refs_json FROM nodes WHERE id = ?
-      `).get(node.id) as {
-        graph_kind: GraphKind;
-        type: string;
-        properties_json: string;
-        evidence_refs_json: string;
-      } | undefined;
+      const existing = existingNodes.get(node.id);
       if (existing && (existing.graph_kind !== node.graphKind || existing.type !== node.type)) {
         throw new GraphValidationError(
           `Node identity conflict for ${node.id}: existing ${existing.graph_kind}/${existing.type}, submitted ${node.graphKind}/${node.type}`
@@ -383,31 +469,56 @@ export class SQLiteGraphStore {
         ...(existing ? JSON.parse(existing.evidence_refs_json) as string[] : []),
         ...(node.evidenceRefs ?? [])
       ]);
-      this.database.prepare(`
-        INSERT INTO nodes (id, graph_kind, type, label, properties_json, evidence_refs_json, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(id) DO UPDATE SET
-          graph_kind = excluded.graph_kind,
-          type = excluded.type,
-          label = excluded.label,
-          properties_json = excluded.properties_json,
-          evidence_refs_json = excluded.evidence_refs_json,
-          updated_at = excluded.updated_at
-      `).run(
+      const written = {
+        id: node.id,
+        graph_kind: node.graphKind,
+        type: node.type,
+        properties_json: JSON.stringify(properties),
+        evidence_refs_json: JSON.stringify(evidenceRefs)
+      };
+      // A repeated id keeps its first position but carries the latest merge.
+      nodeWrites.set(node.id, [
         node.id,
         node.graphKind,
         node.type,
         node.label,
-        JSON.stringify(properties),
-        JSON.stringify(evidenceRefs),
-        new Date().toISOString()
-      );
+        written.properties_json,
+        written.evidence_refs_json,
+        now
+      ]);
+      existingNodes.set(node.id, written);
+    }
+    this.insertRows(`
+      INSERT INTO nodes (id, graph_kind, type, label, properties_json, evidence_refs_json, updated_at)
+      VALUES :rows
+      ON CONFLICT(id) DO UPDATE SET
+        graph_kind = excluded.graph_kind,
+        type = excluded.type,
+        label = excluded.label,
+        properties_json = excluded.properties_json,
+        evidence_refs_json = excluded.evidence_refs_json,
+        updated_at = excluded.updated_at
+    `, [...nodeWrites.values()]);
+    // Edges in one delta usually share endpoints, so each endpoint is looked up
+    // once; nodes written above are already known.
+    const endpoints = new Map<string, { graph_kind: GraphKind; type: string } | undefined>(existingNodes);
+    const endpoint = (nodeId: string) => {
+      if (!endpoints.has(nodeId)) {
+        endpoints.set(nodeId, this.selectEndpointStatement.get(nodeId) as { graph_kind: GraphKind; type: string } | undefined);
+      }
+      return endpoints.get(nodeId);
+    };
+    const existingEdges = new Map<string, StoredEdgeRow>();
+    if (delta.edges.length > 0) {
+      const rows = this.selectDeltaEdgesStatement.all(JSON.stringify(delta.edges.map(edgeIdFor))) as StoredEdgeRow[];
+      for (const row of rows) {
+        existingEdges.set(row.id, row);
+      }
     }
+    const edgeWrites = new Map<string, unknown[]>();
     for (const edge of delta.edges) {
-      const fromNode = this.database.prepare("SELECT graph_kind, type FROM nodes WHERE id = ?")
-        .get(edge.from) as { graph_kind: GraphKind; type: string } | undefined;
-      const toNode = this.database.prepare("SELECT graph_kind, type FROM nodes WHERE id = ?")
-        .get(edge.to) as { graph_kind: GraphKind; type: string } | undefined;
+      const fromNode = endpoint(edge.from);
+      const toNode = endpoint(edge.to);
       if (requireEdgeEndpoints && (!fromNode || !toNode)) {
         throw new GraphValidationError(`Edge ${edge.type} references missing node: ${edge.from} -> ${edge.to}`);
       }
@@ -415,24 +526,16 @@ export class SQLiteGraphStore {
         || toNode?.graph_kind !== "task" || toNode.type !== "Task")) {
         throw new GraphValidationError(`depends_on requires Task -> Task, received ${edge.from} -> ${edge.to}`);
       }
-      if (["tunnels_to", "proxy_route"].includes(edge.type)
+      if (HOST_ROUTE_EDGE_TYPES.has(edge.type)
         && (fromNode?.type !== "Host" || toNode?.type !== "Host")) {
         throw new GraphValidationError(`${edge.type} requires Host -> Host, received ${edge.from} -> ${edge.to}`);
       }
       if (edge.type === "session_on"
-        && (!fromNode || !["AgentSession", "ShellSession", "Session"].includes(fromNode.type) || toNode?.type !== "Host")) {
+        && (!fromNode || !SESSION_NODE_TYPES.has(fromNode.type) || toNode?.type !== "Host")) {
         throw new GraphValidationError(`session_on requires AgentSession/ShellSession/Session -> Host, received ${edge.from} -> ${edge.to}`);
       }
       const edgeId = edgeIdFor(edge);
-      const existing = this.database.prepare(`
-        SELECT from_id, to_id, type, properties_json, evidence_refs_json FROM edges WHERE id = ?
-      `).get(edgeId) as {
-        from_id: string;
-        to_id: string;
-        type: string;
-        properties_json: string;
-        evidence_refs_json: string;
-      } | undefined;
+      const existing = existingEdges.get(edgeId);
       if (edge.id && existing
         && (existing.from_id !== edge.from || existing.to_id !== edge.to || existing.type !== edge.type)) {
         throw new GraphValidationError(
@@ -446,32 +549,63 @@ export class SQLiteGraphStore {
         ...(existing ? JSON.parse(existing.evidence_refs_json) as string[] : []),
         ...(edge.evidenceRefs ?? [])
       ]);
-      this.database.prepare(`
-        INSERT INTO edges (id, from_id, to_id, type, properties_json, evidence_refs_json, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(id) DO UPDATE SET
-          properties_json = excluded.properties_json,
-          evidence_refs_json = excluded.evidence_refs_json,
-          updated_at = excluded.updated_at
-      `).run(
+      const written = existing
+        ? { ...existing, properties_json: JSON.stringify(properties), evidence_refs_json: JSON.stringify(evidenceRefs) }
+        : {
+          id: edgeId,
+          from_id: edge.from,
+          to_id: edge.to,
+          type: edge.type,
+          properties_json: JSON.stringify(properties),
+          evidence_refs_json: JSON.stringify(evidenceRefs)
+        };
+      edgeWrites.set(edgeId, [
         edgeId,
         edge.from,
         edge.to,
         edge.type,
-        JSON.stringify(properties),
-        JSON.stringify(evidenceRefs),
-        new Date().toISOString()
-      );
+        written.properties_json,
+        written.evidence_refs_json,
+        now
+      ]);
+      existingEdges.set(edgeId, written);
     }
-    this.database.prepare(`
-      INSERT INTO graph_deltas (id, source_event_ids_json, delta_json, created_at)
-      VALUES (?, ?, ?, ?)
-    `).run(
-      `delta:${randomUUID()}`,
+    this.insertRows(`
+      INSERT INTO edges (id, from_id, to_id, type, properties_json, evidence_refs_json, updated_at)
+      VALUES :rows
+      ON CONFLICT(id) DO UPDATE SET
+        properties_json = excluded.properties_json,
+        evidence_refs_json = excluded.evidence_refs_json,
+        updated_at = excluded.updated_at
+    `, [...edgeWrites.values()]);
+    const deltaJson = JSON.stringify(delta);
+    this.insertGraphDeltaStatement.run(
+      `delta:${timeOrderedUuid()}`,
       JSON.stringify(delta.sourceEventIds),
-      JSON.stringify(delta),
-      new Date().toISOString()
+      deltaJson,
+      now
     );
+    return { json: deltaJson, createdAt: now };
+  }
+
+  // Writes a batch as multi-row INSERT statements; `:rows` in the SQL expands to
+  // one placeholder tuple per row, chunked under SQLite's bound-parameter limit.
+  private insertRows(sql: string, rows: unknown[][]): void {
+    if (rows.length === 0) {
+      return;
+    }
+    const tuple = `(${rows[0].map(() => "?").join(", ")})`;
+    const chunkSize = Math.max(1, Math.floor(MAX_INSERT_PARAMETERS / rows[0].length));
+    for (let start = 0; start < rows.length; start += chunkSize) {
+      const chunk = rows.slice(start, start + chunkSize);
+      const key = `${chunk.length}:${sql}`;
+      let statement = this.insertRowsStatements.get(key);
+      if (!statement) {
+        statement = this.database.prepare(sql.replace(":rows", chunk.map(() => tuple).join(", ")));
+        this.insertRowsStatements.set(key, statement);
+      }
+      statement.run(...chunk.flat());
+    }
   }
 
   query(view: GraphView, focusNodeIds: string[] = [], limit = 200): GraphSnapshot {
@@ -517,28 +651,34 @@ export class SQLiteGraphStore {
   }
 
   stats(): Record<string, unknown> {
+    // Node totals are folded out of the per-kind rows so the nodes table is scanned once.
+    const kindRows = this.database.prepare(`
+      SELECT graph_kind, COUNT(*) AS count, SUM(evidence_refs_json <> '[]') AS evidence_backed_count
+      FROM nodes GROUP BY graph_kind ORDER BY graph_kind
+    `).all() as Array<{ graph_kind: string; count: number; evidence_backed_count: number }>;
     const totals = this.database.prepare(`
       SELECT
-        (SELECT COUNT(*) FROM nodes) AS node_count,
         (SELECT COUNT(*) FROM edges) AS edge_count,
         (SELECT COUNT(*) FROM graph_deltas) AS delta_count,
-        (SELECT COUNT(*) FROM nodes WHERE evidence_refs_json <> '[]') AS evidence_backed_node_count,
         (SELECT COUNT(*) FROM edges WHERE evidence_refs_json <> '[]') AS evidence_backed_edge_count
     `).get() as {
-      node_count: number;
       edge_count: number;
       delta_count: number;
-      evidence_backed_node_count: number;
       evidence_backed_edge_count: number;
     };
-    const nodesByKind = Object.fromEntries((this.database.prepare(`
-      SELECT graph_kind, COUNT(*) AS count FROM nodes GROUP BY graph_kind ORDER BY graph_kind
-    `).all() as Array<{ graph_kind: string; count: number }>).map((row) => [row.graph_kind, Number(row.count)]));
+    const nodesByKind: Record<string, number> = {};
+    let nodeCount = 0;
+    let evidenceBackedNodeCount = 0;
+    for (const row of kindRows) {
+      nodesByKind[row.graph_kind] = Number(row.count);
+      nodeCount += Number(row.count);
+      evidenceBackedNodeCount += Number(row.evidence_backed_count);
+    }
     return {
-      nodeCount: Number(totals.node_count),
+      nodeCount,
       edgeCount: Number(totals.edge_count),
       deltaCount: Number(totals.delta_count),
-      evidenceBackedNodeCount: Number(totals.evidence_backed_node_count),
+      evidenceBackedNodeCount,
       evidenceBackedEdgeCount: Number(totals.evidence_backed_edge_count),
       nodesByKind
     };
@@ -563,15 +703,36 @@ export class SQLiteGraphStore {
     };
   }
 
-  projectionClosure(input: {
-    taskId: string;
-    scopeRef: string;
-    dependencyTaskIds?: string[];
-    targetRefs?: string[];
-    anchors?: string[];
-    nodeLimit?: number;
-    edgeLimit?: number;
-  }): { nodes: GraphNode[]; edges: GraphEdge[] } {
+  projectionClosure(input: ProjectionClosureInput): { nodes: GraphNode[]; edges: GraphEdge[] } {
+    // Executor dispatches, provider retries, resumes and dependency briefs ask for
+    // the same closures; they are reused until the next graph delta.
+    const version = this.graphVersion();
+    if (this.projectionClosureCache?.version !== version) {
+      this.projectionClosureCache = { version, closures: new Map() };
+    }
+    const closures = this.projectionClosureCache.closures;
+    const key = JSON.stringify([
+      input.taskId,
+      input.scopeRef,
+      input.dependencyTaskIds,
+      input.targetRefs,
+      input.anchors,
+      input.nodeLimit,
+      input.edgeLimit
+    ]);
+    const cached = closures.get(key);
+    if (cached) {
+      return cached;
+    }
+    const closure = this.buildProjectionClosure(input);
+    closures.set(key, closure);
+    if (closures.size > MAX_CACHED_PROJECTION_CLOSURES) {
+      closures.delete(closures.keys().next().value!);
+    }
+    return closure;
+  }
+
+  private buildProjectionClosure(input: ProjectionClosureInput): { nodes: GraphNode[]; edges: GraphEdge[] } {
     const nodeLimit = Math.max(8, input.nodeLimit ?? 24);
     const edgeLimit = Math.max(12, input.edgeLimit ?? 36);
     const taskMemoryRefs = dedupeStringValues([
@@ -591,10 +752,16 @@ export class SQLiteGraphStore {
       .map(normalizeProjectionToken)
       .filter((token) => token.length >= 3);
     const exactSemanticRefs = new Set((input.targetRefs ?? []).filter((ref) => nodeById.get(ref)?.graphKind !== "task"));
-    const anchorSeedNodes = semanticNodes.filter((node) => (
-      exactSemanticRefs.has(node.id)
-      || anchorTokens.some((token) => projectionNodeSearchText(node).includes(token))
-    ));
+    const anchorSeedNodes = semanticNodes.filter((node) => {
+      if (exactSemanticRefs.has(node.id)) {
+        return true;
+      }
+      if (anchorTokens.length === 0) {
+        return false;
+      }
+      const searchText = projectionNodeSearchText(node);
+      return anchorTokens.some((token) => searchText.includes(token));
+    });
 
     const selectedIds = new Set(taskNodes.slice(0, 8).map((node) => node.id));
     const traversedEdges = new Map(taskEdges.map((edge) => [edgeIdFor(edge), edge]));
@@ -670,10 +837,11 @@ export class SQLiteGraphStore {
     const graphKinds: GraphKind[] = input.graphKind ? [input.graphKind] : ["operation", "reasoning"];
     const candidates = graphKinds.flatMap((graphKind) => (
       this.readNodes({ graphKind, limit: 1_000_000 })
-    )).map((node) => ({
-      node,
-      matches: tokens.filter((token) => projectionNodeSearchText(node).includes(token)).length
-    })).filter((candidate) => candidate.matches > 0)
+    )).map((node) => {
+      // Serialize each node's properties once, not once per query token.
+      const searchText = projectionNodeSearchText(node);
+      return { node, matches: tokens.filter((token) => searchText.includes(token)).length };
+    }).filter((candidate) => candidate.matches > 0)
       .sort((left, right) => right.matches - left.matches || compareProjectionSeedNodes(left.node, right.node));
     const nodes = candidates.slice(0, limit).map((candidate) => candidate.node);
     return {
@@ -689,10 +857,23 @@ export class SQLiteGraphStore {
   }
 
   plannerDecisionView(limit = 200): PlannerDecisionView {
+    // Every graph write appends a graph_deltas row, so its max rowid versions the
+    // graph across connections and an unchanged graph reuses the last view.
+    const version = this.graphVersion();
+    const cached = this.plannerDecisionViewCache;
+    if (cached && cached.version === version && cached.limit === limit) {
+      return cached.view;
+    }
+    const view = this.buildPlannerDecisionView(limit);
+    this.plannerDecisionViewCache = { version, limit, view };
+    return view;
+  }
+
+  private buildPlannerDecisionView(limit: number): PlannerDecisionView {
     const rawTaskNodes = this.readNodes({ graphKind: "task", limit });
     const taskNodes = withDerivedTaskDependencies(
       rawTaskNodes,
-      this.readEdgesForNodes(rawTaskNodes.map((node) => node.id), limit * 2)
+      this.readTaskDependencyEdges(rawTaskNodes.map((node) => node.id))
     );
     const reasoningNodes = this.readNodes({ graphKind: "reasoning", limit });
     const operationNodes = this.readNodes({ graphKind: "operation", limit });
@@ -704,7 +885,7 @@ export class SQLiteGraphStore {
     const rootScope = taskNodes.find((node) => node.id === "scope:root")
       ?? taskNodes.find((node) => node.type === "Scope");
     const taskLedger = [
-      ...fullTaskLedger.filter((item) => ["open", "partial", "blocked", "failed"].includes(item.status)),
+      ...fullTaskLedger.filter((item) => PLANNER_LEDGER_ACTIVE_STATUSES.has(item.status)),
       ...fullTaskLedger.filter((item) => item.status === "completed").slice(0, 8),
       ...fullTaskLedger.filter((item) => item.status === "archived").slice(0, 4)
     ]
@@ -718,11 +899,10 @@ export class SQLiteGraphStore {
         scopeRef: rootScope?.id ?? null
       },
       taskLedger,
-      reasoningDigest: topDigestItems(reasoningNodes, allEdges, context, 10),
-      operationDigest: topDigestItems(operationNodes, allEdges, context, 10),
+      reasoningDigest: topDigestItems(reasoningNodes, context, 10),
+      operationDigest: topDigestItems(operationNodes, context, 10),
       blockers: topDigestItems(
         taskNodes.filter((node) => node.type === "Blocker"),
-        allEdges,
         context,
         5
       ),
@@ -748,11 +928,7 @@ export class SQLiteGraphStore {
   }
 
   createTasks(inputs: TaskCreateInput[], sourceEventIds: string[] = []): GraphNode[] {
-    const existingTaskIds = new Set(
-      this.readNodes({ graphKind: "task", limit: 5000 })
-        .filter((node) => node.type === "Task")
-        .map((node) => node.id)
-    );
+    const existingTaskIds = this.readTaskIds();
     const newTaskIds = new Set<string>();
     for (const input of inputs) {
       if (existingTaskIds.has(input.taskId) || newTaskIds.has(input.taskId)) {
@@ -812,9 +988,18 @@ export class SQLiteGraphStore {
     return nodes;
   }
 
+  graphVersion(): number {
+    const row = this.graphVersionStatement.get() as { version: number };
+    return Number(row.version);
+  }
+
   plannerVersionSnapshot(): Record<string, number> {
-    return Object.fromEntries(this.readNodes({ graphKind: "task", limit: 5000 })
-      .map((node) => [node.id, nodeVersion(node)]));
+    // Only the version property is needed, so the full property and evidence JSON is never decoded.
+    const rows = this.database.prepare(`
+      SELECT id, json_extract(properties_json, '$.version') AS version
+      FROM nodes WHERE graph_kind = 'task' ORDER BY updated_at DESC LIMIT 5000
+    `).all() as Array<{ id: string; version: unknown }>;
+    return Object.fromEntries(rows.map((row) => [row.id, normalizeNodeVersion(row.version)]));
   }
 
   validatePlannerDecision(decision: PlannerDecision): void {
@@ -841,21 +1026,28 @@ export class SQLiteGraphStore {
       }
     }
 
-    for (const command of commands) {
-      if (command.kind === "create_tasks") {
-        continue;
+    const requireTask = (taskId: string) => {
+      if (!existingTaskIds.has(taskId) && !newTaskIds.has(taskId)) {
+        throw new GraphValidationError(`Task ${taskId} does not exist`);
       }
-      if (command.kind === "set_node_status") {
-        if (!existingById.has(command.nodeId) && !newTaskIds.has(command.nodeId)) {
-          throw new GraphValidationError(`Node ${command.nodeId} does not exist`);
-        }
-        continue;
-      }
-      if (!existingTaskIds.has(command.taskId) && !newTaskIds.has(command.taskId)) {
-        throw new GraphValidationError(`Task ${command.taskId} does not exist`);
-      }
-      if (command.kind === "replace_dependencies") {
-        dependencyOverrides.set(command.taskId, [...new Set(command.dependencyTaskIds)]);
+    };
+    for (const command of commands) {
+      switch (command.kind) {
+        case "create_tasks":
+          break;
+        case "set_node_status":
+          if (!existingById.has(command.nodeId) && !newTaskIds.has(command.nodeId)) {
+            throw new GraphValidationError(`Node ${command.nodeId} does not exist`);
+          }
+          break;
+        case "replace_dependencies":
+          requireTask(command.taskId);
+          dependencyOverrides.set(command.taskId, [...new Set(command.dependencyTaskIds)]);
+          break;
+        case "patch_task":
+        case "set_task_status":
+          requireTask(command.taskId);
+          break;
       }
     }
 
@@ -883,8 +1075,8 @@ export class SQLiteGraphStore {
     try {
       const result = this.applyPlannerDecisionInTransaction(input);
       this.database.exec("COMMIT");
-      if (result.delta.nodes.length > 0 || result.delta.edges.length > 0) {
-        appendDeltaLog(this.deltaLogPath, result.delta);
+      if (result.committed && (result.delta.nodes.length > 0 || result.delta.edges.length > 0)) {
+        this.appendDeltaLog(result.committed);
       }
       return result.applied;
     } catch (error) {
@@ -898,22 +1090,29 @@ export class SQLiteGraphStore {
     taskCommands: PlannerTaskBatchCommand[];
     nodeStatusCommands: PlannerNodeStatusBatchCommand[];
     sourceEventIds: string[];
-  }): { applied: AppliedPlannerDecision; delta: GraphDelta } {
+  }): { applied: AppliedPlannerDecision; delta: GraphDelta; committed?: CommittedGraphDelta } {
     if (input.createTasks.length === 0 && input.taskCommands.length === 0 && input.nodeStatusCommands.length === 0) {
       return {
         applied: { createdNodes: [], taskCommands: [], nodeStatusCommands: [] },
         delta: { sourceEventIds: input.sourceEventIds, nodes: [], edges: [] }
       };
     }
-    const existingTaskNodes = this.readNodes({ graphKind: "task", limit: 5000 });
-    const existingById = new Map(existingTaskNodes.map((node) => [node.id, node]));
-    const existingTaskIds = new Set(existingTaskNodes.filter((node) => node.type === "Task").map((node) => node.id));
+    const existingById = new Map<string, GraphNode>();
+    const existingTaskIds = new Set<string>();
+    for (const node of this.readNodes({ graphKind: "task", limit: 5000 })) {
+      existingById.set(node.id, node);
+      if (node.type === "Task") {
+        existingTaskIds.add(node.id);
+      }
+    }
     const newTaskIds = new Set<string>();
+    const dependencyOverrides = new Map<string, string[]>();
     for (const task of input.createTasks) {
       if (existingById.has(task.taskId) || newTaskIds.has(task.taskId)) {
         throw new GraphValidationError(`Task ${task.taskId} already exists`);
       }
       newTaskIds.add(task.taskId);
+      dependencyOverrides.set(task.taskId, [...new Set(task.dependsOnTaskRefs ?? [])]);
     }
     const conflicts: PlannerDecisionConflictItem[] = [];
     const collectConflict = (node: GraphNode, expectedVersion: number): void => {
@@ -986,10 +1185,6 @@ export class SQLiteGraphStore {
     const mutatedExistingIds = new Set<string>();
     const sourceEventIdsByNode = new Map<string, string[]>();
     const plannerReasonsByNode = new Map<string, string[]>();
-    const dependencyOverrides = new Map<string, string[]>();
-    for (const task of input.createTasks) {
-      dependencyOverrides.set(task.taskId, [...new Set(task.dependsOnTaskRefs ?? [])]);
-    }
     const recordMutation = (nodeId: string, sourceEventIds: string[], reason?: string): void => {
       sourceEventIdsByNode.set(nodeId, mergeStrings(sourceEventIdsByNode.get(nodeId) ?? [], sourceEventIds));
       if (reason?.trim()) {
@@ -1030,7 +1225,7 @@ export class SQLiteGraphStore {
         throw new GraphValidationError(`Node ${command.nodeId} does not exist`);
       }
       recordMutation(command.nodeId, command.sourceEventIds ?? [], command.reason);
-      const normalizedStatus = current.type === "Goal" && command.status === "achieved" ? "completed" : command.status;
+      const normalizedStatus = normalizeNodeStatus(current.type, command.status);
       workingById.set(command.nodeId, {
         ...current,
         properties: {
@@ -1088,7 +1283,7 @@ export class SQLiteGraphStore {
       edges: [...creationEdges, ...dependencyEdges]
     };
     validateGraphDelta(delta);
-    this.applyDeltaInTransaction(
+    const committed = this.applyDeltaInTransaction(
       delta,
       [...dependencyOverrides.keys()]
         .filter((taskId) => existingTaskIds.has(taskId))
@@ -1108,7 +1303,8 @@ export class SQLiteGraphStore {
           node: finalById.get(command.nodeId) ?? workingById.get(command.nodeId)!
         }))
       },
-      delta
+      delta,
+      committed
     };
   }
 
@@ -1249,9 +1445,7 @@ export class SQLiteGraphStore {
       throw new GraphValidationError(`Node ${input.nodeId} does not exist`);
     }
     assertExpectedVersion(node, input.expectedVersion);
-    const normalizedStatus = node.type === "Goal" && input.status === "achieved"
-      ? "completed"
-      : input.status;
+    const normalizedStatus = normalizeNodeStatus(node.type, input.status);
     const nextNode: GraphNode = {
       ...node,
       properties: {
@@ -1403,6 +1597,10 @@ export class SQLiteGraphStore {
     }));
   }
 
+  hasNode(nodeId: string): boolean {
+    return this.hasNodeStatement.get(nodeId) !== undefined;
+  }
+
   getTaskNode(taskId: string): GraphNode | undefined {
     return this.readNodes({ focusNodeIds: [taskId], limit: 1 })
       .find((node) => node.graphKind === "task" && node.type === "Task");
@@ -1414,23 +1612,72 @@ export class SQLiteGraphStore {
   }
 
   listReadyTasks(limit = 4): TaskEnvelope[] {
-    const taskNodes = this.readNodes({ graphKind: "task", limit: 1000 })
-      .filter((node) => node.type === "Task");
-    const taskById = new Map(taskNodes.map((node) => [node.id, node]));
-    const taskIds = taskNodes.map((node) => node.id);
-    const taskDependencyEdges = this.readEdgesForNodes(taskIds, 5000)
-      .filter((edge) => edge.type === "depends_on" && taskById.has(edge.from) && taskById.has(edge.to));
-    const readyTasks = taskNodes
-      .filter((task) => isRunnableTaskStatus(task.properties.status))
-      .filter((task) => taskDependencyEdges
-        .filter((edge) => edge.from === task.id)
-        .every((edge) => isDependencyOutcomeAvailable(taskById.get(edge.to)?.properties)))
+    // Readiness only depends on task status (and an archived task's summary), so
+    // those are read as columns and only runnable tasks are decoded in full.
+    const taskRows = this.database.prepare(`
+      SELECT id,
+             json_extract(properties_json, '$.status') AS status,
+             CASE WHEN json_type(properties_json, '$.resultSummary') = 'text'
+               THEN json_extract(properties_json, '$.resultSummary') END AS result_summary
+      FROM nodes WHERE graph_kind = 'task' AND type = 'Task'
+      ORDER BY updated_at DESC LIMIT 1000
+    `).all() as Array<{ id: string; status: unknown; result_summary: string | null }>;
+    const taskById = new Map<string, Record<string, unknown>>();
+    const runnableTaskIds: string[] = [];
+    for (const row of taskRows) {
+      const status = row.status ?? undefined;
+      taskById.set(row.id, { status, resultSummary: row.result_summary ?? undefined });
+      if (isRunnableTaskStatus(status)) {
+        runnableTaskIds.push(row.id);
+      }
+    }
+    if (runnableTaskIds.length === 0) {
+      return [];
+    }
+    const runnableTasks = this.readNodes({ focusNodeIds: runnableTaskIds, limit: runnableTaskIds.length });
+    // Only the outgoing depends_on edges of runnable tasks decide readiness, so
+    // terminal tasks and non-dependency edges are never read per cycle.
+    const dependenciesByTask = new Map<string, string[]>();
+    for (const edge of this.readTaskDependencyEdges(runnableTasks.map((task) => task.id))) {
+      if (!taskById.has(edge.to)) {
+        continue;
+      }
+      const dependencies = dependenciesByTask.get(edge.from);
+      if (dependencies) {
+        dependencies.push(edge.to);
+      } else {
+        dependenciesByTask.set(edge.from, [edge.to]);
+      }
+    }
+    const readyTasks = runnableTasks
+      .filter((task) => (dependenciesByTask.get(task.id) ?? [])
+        .every((dependencyId) => isDependencyOutcomeAvailable(taskById.get(dependencyId))))
       .sort(compareTaskPriorityThenId)
       .slice(0, limit);
-    return readyTasks.map((task) => taskNodeToEnvelope(
-      task,
-      taskDependencyEdges.filter((edge) => edge.from === task.id).map((edge) => edge.to)
-    ));
+    return readyTasks.map((task) => taskNodeToEnvelope(task, dependenciesByTask.get(task.id) ?? []));
+  }
+
+  // The JSONL delta log is a mirror of graph_deltas, so deltas committed in the
+  // same tick are written with one append instead of one sync write each, and
+  // each line reuses the delta JSON and timestamp already written to its
+  // graph_deltas row.
+  private appendDeltaLog(committed: CommittedGraphDelta): void {
+    this.pendingDeltaLogLines.push(`{"timestamp":${JSON.stringify(committed.createdAt)},"delta":${committed.json}}\n`);
+    this.deltaLogFlush ??= setImmediate(() => this.flushDeltaLog());
+  }
+
+  private flushDeltaLog(): void {
+    if (this.deltaLogFlush) {
+      clearImmediate(this.deltaLogFlush);
+      this.deltaLogFlush = undefined;
+    }
+    if (this.pendingDeltaLogLines.length === 0) {
+      return;
+    }
+    const lines = this.pendingDeltaLogLines.join("");
+    this.pendingDeltaLogLines = [];
+    mkdirSync(dirname(this.deltaLogPath), { recursive: true });
+    appendFileSync(this.deltaLogPath, lines);
   }
 
   private requireTaskNode(taskId: string): GraphNode {
@@ -1485,6 +1732,11 @@ export class SQLiteGraphStore {
     for (const [taskId, dependencies] of dependencyOverrides) {
       dependencyMap.set(taskId, new Set(dependencies));
     }
+    // Kahn's pass settles the common acyclic case without recursion or per-node
+    // sorting; the ordered DFS below only runs to name the cycle it found.
+    if (isAcyclicDependencyMap(dependencyMap)) {
+      return;
+    }
     const visited = new Set<string>();
     const activeIndex = new Map<string, number>();
     const path: string[] = [];
@@ -1558,8 +1810,10 @@ export class SQLiteGraphStore {
         updated_at TEXT NOT NULL
       );
       CREATE INDEX IF NOT EXISTS idx_nodes_kind_type ON nodes(graph_kind, type);
+      CREATE INDEX IF NOT EXISTS idx_nodes_kind_updated ON nodes(graph_kind, updated_at);
       CREATE INDEX IF NOT EXISTS idx_edges_from ON edges(from_id);
       CREATE INDEX IF NOT EXISTS idx_edges_to ON edges(to_id);
+      CREATE INDEX IF NOT EXISTS idx_edges_type_from ON edges(type, from_id, to_id);
       CREATE INDEX IF NOT EXISTS idx_operation_identities_node ON operation_identities(node_id);
     `);
     this.database.exec(`
@@ -1625,6 +1879,13 @@ export class SQLiteGraphStore {
     return rows.map(rowToNode);
   }
 
+  private readTaskIds(): Set<string> {
+    const rows = this.database.prepare(`
+      SELECT id FROM nodes WHERE graph_kind = 'task' AND type = 'Task'
+    `).all() as Array<{ id: string }>;
+    return new Set(rows.map((row) => row.id));
+  }
+
   private readEdgesForNodes(nodeIds: string[], limit: number): GraphEdge[] {
     if (nodeIds.length === 0) {
       return [];
@@ -1637,6 +1898,20 @@ export class SQLiteGraphStore {
     `).all(...nodeIds, ...nodeIds, limit) as StoredEdgeRow[];
     return rows.map(rowToEdge);
   }
+
+  // Dependency derivation only needs endpoints, so skip the full edge rows and
+  // their properties/evidence JSON decoding.
+  private readTaskDependencyEdges(taskIds: string[]): GraphEdge[] {
+    if (taskIds.length === 0) {
+      return [];
+    }
+    const placeholders = taskIds.map(() => "?").join(",");
+    const rows = this.database.prepare(`
+      SELECT from_id, to_id FROM edges
+      WHERE type = 'depends_on' AND from_id IN (${placeholders})
+    `).all(...taskIds) as Array<{ from_id: string; to_id: string }>;
+    return rows.map((row) => ({ from: row.from_id, to: row.to_id, type: "depends_on" }));
+  }
 }
 
 function projectionNodeSearchText(node: GraphNode): string {
@@ -1734,28 +2009,35 @@ function validateGraphNodeCategory(node: GraphNode): void {
   }
 }
 
+const GRAPH_KIND_BY_NODE_TYPE = new Map<string, GraphKind>([
+  ...["Evidence", "Hypothesis", "Vulnerability", "Exploit"].map((type) => [type, "reasoning"] as const),
+  ...["Host", "Port", "Service", "WebEndpoint", "Parameter", "Credential", "AgentSession", "ShellSession", "Session", "File", "Process"]
+    .map((type) => [type, "operation"] as const),
+  ...["Goal", "Task", "Milestone", "Blocker", "Scope"].map((type) => [type, "task"] as const)
+]);
+
+// Decoded rows reuse the vocabulary's own strings, so long-lived graph reads keep
+// one copy of each kind and type instead of a fresh string per node.
+const GRAPH_KIND_TOKENS = new Map([...new Set(GRAPH_KIND_BY_NODE_TYPE.values())].map((kind) => [kind, kind]));
+const NODE_TYPE_TOKENS = new Map([...GRAPH_KIND_BY_NODE_TYPE.keys()].map((type) => [type, type]));
+
+const HOST_ROUTE_EDGE_TYPES = new Set(["tunnels_to", "proxy_route"]);
+const SESSION_NODE_TYPES = new Set(["AgentSession", "ShellSession", "Session"]);
+
 function expectedGraphKindForNodeType(type: string): GraphKind | undefined {
-  if (["Evidence", "Hypothesis", "Vulnerability", "Exploit"].includes(type)) {
-    return "reasoning";
-  }
-  if (["Host", "Port", "Service", "WebEndpoint", "Parameter", "Credential", "AgentSession", "ShellSession", "Session", "File", "Process"].includes(type)) {
-    return "operation";
-  }
-  if (["Goal", "Task", "Milestone", "Blocker", "Scope"].includes(type)) {
-    return "task";
-  }
-  return undefined;
+  return GRAPH_KIND_BY_NODE_TYPE.get(type);
 }
 
+const RESERVED_NODE_ID_PREFIXES: Array<{ prefix: string; graphKind: GraphKind; type: string }> = [
+  { prefix: "task:", graphKind: "task", type: "Task" },
+  { prefix: "goal:", graphKind: "task", type: "Goal" },
+  { prefix: "scope:", graphKind: "task", type: "Scope" },
+  { prefix: "milestone:", graphKind: "task", type: "Milestone" },
+  { prefix: "blocker:", graphKind: "task", type: "Blocker" }
+];
+
 function validateReservedNodeIdentity(node: GraphNode): void {
-  const reservedPrefixes: Array<{ prefix: string; graphKind: GraphKind; type: string }> = [
-    { prefix: "task:", graphKind: "task", type: "Task" },
-    { prefix: "goal:", graphKind: "task", type: "Goal" },
-    { prefix: "scope:", graphKind: "task", type: "Scope" },
-    { prefix: "milestone:", graphKind: "task", type: "Milestone" },
-    { prefix: "blocker:", graphKind: "task", type: "Blocker" }
-  ];
-  const reservation = reservedPrefixes.find((candidate) => node.id.startsWith(candidate.prefix));
+  const reservation = RESERVED_NODE_ID_PREFIXES.find((candidate) => node.id.startsWith(candidate.prefix));
   if (reservation && (node.graphKind !== reservation.graphKind || node.type !== reservation.type)) {
     throw new GraphValidationError(
       `Reserved node id ${node.id} requires ${reservation.graphKind}/${reservation.type}, received ${node.graphKind}/${node.type}`
@@ -1766,8 +2048,8 @@ function validateReservedNodeIdentity(node: GraphNode): void {
 function rowToNode(row: StoredNodeRow): GraphNode {
   return {
     id: row.id,
-    graphKind: row.graph_kind,
-    type: row.type,
+    graphKind: GRAPH_KIND_TOKENS.get(row.graph_kind) ?? row.graph_kind,
+    type: NODE_TYPE_TOKENS.get(row.type) ?? row.type,
     label: row.label,
     properties: JSON.parse(row.properties_json) as Record<string, unknown>,
     evidenceRefs: JSON.parse(row.evidence_refs_json) as string[]
@@ -1825,6 +2107,7 @@ function buildTaskLedger(taskNodes: GraphNode[]): PlannerTaskLedgerItem[] {
 type PlannerDigestContext = {
   relevantIds: Set<string>;
   degreeById: Map<string, number>;
+  edgesByNodeId: Map<string, GraphEdge[]>;
   taskStatusById: Map<string, string>;
 };
 
@@ -1847,36 +2130,49 @@ function createPlannerDigestContext(taskNodes: GraphNode[], edges: GraphEdge[]):
       relevantIds.add(node.id);
     }
   }
+  // Incident edges are indexed once so scoring each digest candidate reads its
+  // own edges instead of rescanning the whole edge window.
   const degreeById = new Map<string, number>();
+  const edgesByNodeId = new Map<string, GraphEdge[]>();
+  const addIncidentEdge = (nodeId: string, edge: GraphEdge) => {
+    const incident = edgesByNodeId.get(nodeId);
+    if (incident) {
+      incident.push(edge);
+    } else {
+      edgesByNodeId.set(nodeId, [edge]);
+    }
+  };
   for (const edge of edges) {
     degreeById.set(edge.from, (degreeById.get(edge.from) ?? 0) + 1);
     degreeById.set(edge.to, (degreeById.get(edge.to) ?? 0) + 1);
+    addIncidentEdge(edge.from, edge);
+    if (edge.to !== edge.from) {
+      addIncidentEdge(edge.to, edge);
+    }
   }
-  return { relevantIds, degreeById, taskStatusById };
+  return { relevantIds, degreeById, edgesByNodeId, taskStatusById };
 }
 
 function topDigestItems(
   nodes: GraphNode[],
-  edges: GraphEdge[],
   context: PlannerDigestContext,
   limit: number
 ): PlannerDigestItem[] {
   return nodes
-    .map((node, index) => scoreDigestItem(node, edges, context, index))
+    .map((node, index) => scoreDigestItem(node, context, index))
     .sort((left, right) => right.score - left.score || left.id.localeCompare(right.id))
     .slice(0, limit);
 }
 
 function scoreDigestItem(
   node: GraphNode,
-  edges: GraphEdge[],
   context: PlannerDigestContext,
   recencyIndex: number
 ): PlannerDigestItem {
   const reasons: string[] = [];
   let score = 0;
   const degree = context.degreeById.get(node.id) ?? 0;
-  const relatedEdges = edges.filter((edge) => edge.from === node.id || edge.to === node.id);
+  const relatedEdges = context.edgesByNodeId.get(node.id) ?? [];
   if (context.relevantIds.has(node.id) || relatedEdges.some((edge) => context.relevantIds.has(edge.from) || context.relevantIds.has(edge.to))) {
     score += 8;
     reasons.push("target_or_task_related");
@@ -1924,18 +2220,29 @@ function scoreDigestItem(
   };
 }
 
+const PLANNER_LEDGER_ACTIVE_STATUSES = new Set<string>(["open", "partial", "blocked", "failed"]);
+
+const NODE_STATUS_ALIASES = new Map<string, string>([
+  ["Goal:achieved", "completed"]
+]);
+
+const STATE_IMPORTANCE_BY_STATUS = new Map<string, number>([
+  ...["confirmed", "succeeded", "valid", "privileged", "authenticated"].map((status) => [status, 10] as const),
+  ...["partial", "blocked", "running", "open"].map((status) => [status, 6] as const),
+  ...["failed", "invalid", "closed"].map((status) => [status, 3] as const)
+]);
+
+function normalizeNodeStatus(type: string, status: string): string {
+  return NODE_STATUS_ALIASES.get(`${type}:${status}`) ?? status;
+}
+
 function scoreStateImportance(node: GraphNode, status: string | undefined): number {
   if (node.type === "Blocker") {
     return status === "resolved" || status === "completed" ? 2 : 10;
   }
-  if (["confirmed", "succeeded", "valid", "privileged", "authenticated"].includes(status ?? "")) {
-    return 10;
-  }
-  if (["partial", "blocked", "running", "open"].includes(status ?? "")) {
-    return 6;
-  }
-  if (["failed", "invalid", "closed"].includes(status ?? "")) {
-    return 3;
+  const statusImportance = status === undefined ? undefined : STATE_IMPORTANCE_BY_STATUS.get(status);
+  if (statusImportance !== undefined) {
+    return statusImportance;
   }
   if (node.type === "Vulnerability" || node.type === "Exploit") {
     return 7;
@@ -1969,7 +2276,7 @@ function scoreDecisionImpact(node: GraphNode): number {
   }
 }
 
-const DECISION_KEYWORDS = [
+const DECISION_KEYWORD_PATTERN = new RegExp([
   "flag",
   "admin",
   "auth",
@@ -1989,11 +2296,10 @@ const DECISION_KEYWORDS = [
   "sqli",
   "ssrf",
   "ssti"
-];
+].join("|"), "i");
 
 function containsDecisionKeyword(node: GraphNode): boolean {
-  const haystack = `${node.id} ${node.label} ${JSON.stringify(node.properties)}`.toLowerCase();
-  return DECISION_KEYWORDS.some((keyword) => haystack.includes(keyword));
+  return DECISION_KEYWORD_PATTERN.test(`${node.id} ${node.label} ${JSON.stringify(node.properties)}`);
 }
 
 const DIGEST_PROPERTY_ALLOWLIST = [
@@ -2118,11 +2424,6 @@ function dedupeConflictItems(conflicts: PlannerDecisionConflictItem[]): PlannerD
   return [...new Map(conflicts.map((conflict) => [conflict.nodeId, conflict])).values()];
 }
 
-function appendDeltaLog(deltaLogPath: string, delta: GraphDelta): void {
-  mkdirSync(dirname(deltaLogPath), { recursive: true });
-  appendFileSync(deltaLogPath, toJsonLine({ timestamp: new Date().toISOString(), delta }));
-}
-
 function taskNodeToEnvelope(node: GraphNode, dependencyTaskIds: string[] = []): TaskEnvelope {
   return {
     taskId: node.id,
@@ -2182,7 +2483,10 @@ function applyPlannerTaskPatch(task: GraphNode, patch: PlannerTaskPatch, reason:
 }
 
 function nodeVersion(node: GraphNode): number {
-  const version = node.properties.version;
+  return normalizeNodeVersion(node.properties.version);
+}
+
+function normalizeNodeVersion(version: unknown): number {
   return typeof version === "number" && Number.isFinite(version) && version >= 1
     ? Math.floor(version)
     : 1;
@@ -2217,6 +2521,32 @@ function stringArray(value: unknown, fallback: string[] = []): string[] {
     : fallback;
 }
 
+function isAcyclicDependencyMap(dependencyMap: Map<string, Set<string>>): boolean {
+  const dependentCounts = new Map<string, number>();
+  for (const [taskId, dependencies] of dependencyMap) {
+    if (!dependentCounts.has(taskId)) {
+      dependentCounts.set(taskId, 0);
+    }
+    for (const dependencyTaskId of dependencies) {
+      dependentCounts.set(dependencyTaskId, (dependentCounts.get(dependencyTaskId) ?? 0) + 1);
+    }
+  }
+  const ready = [...dependentCounts].filter(([, count]) => count === 0).map(([taskId]) => taskId);
+  let settled = 0;
+  while (ready.length > 0) {
+    const taskId = ready.pop()!;
+    settled += 1;
+    for (const dependencyTaskId of dependencyMap.get(taskId) ?? []) {
+      const remaining = dependentCounts.get(dependencyTaskId)! - 1;
+      dependentCounts.set(dependencyTaskId, remaining);
+      if (remaining === 0) {
+        ready.push(dependencyTaskId);
+      }
+    }
+  }
+  return settled === dependentCounts.size;
+}
+
 function isRunnableTaskStatus(status: unknown): boolean {
   return status === undefined || status === "open";
 }
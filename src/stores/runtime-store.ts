@@ -1,6 +1,6 @@
 import { mkdirSync } from "node:fs";
 import { dirname } from "node:path";
-import { DatabaseSync } from "node:sqlite";
+import { DatabaseSync, type StatementSync } from "node:sqlite";
 import type {
   ExecutionEpochRecord,
   ExecutionEpochState,
@@ -8,6 +8,7 @@ import type {
   ProjectionClaim,
   ProjectionState
 } from "../types.js";
+import { STORE_CONNECTION_PRAGMAS } from "./sqlite-pragmas.js";
 
 export type ExecutorSessionRecord = {
   taskId: string;
@@ -49,13 +50,32 @@ export class RuntimeStore {
   readonly databasePath: string;
   readonly recoveredProjectionClaims: number;
   private readonly database: DatabaseSync;
+  private readonly selectProjectionStateStatement: StatementSync;
+  private readonly raiseProjectionDesiredStatement: StatementSync;
 
   constructor(databasePath: string) {
     this.databasePath = databasePath;
     mkdirSync(dirname(databasePath), { recursive: true });
     this.database = new DatabaseSync(databasePath);
-    this.database.exec("PRAGMA journal_mode = WAL; PRAGMA busy_timeout = 5000;");
+    this.database.exec(STORE_CONNECTION_PRAGMAS);
     this.initialize();
+    // Projection state is read and raised for nearly every executor event, so
+    // these statements are compiled once per connection.
+    this.selectProjectionStateStatement = this.database.prepare(`
+      SELECT * FROM projection_states WHERE task_id = ?
+    `);
+    this.raiseProjectionDesiredStatement = this.database.prepare(`
+      INSERT INTO projection_states (
+        task_id, committed_seq, desired_seq, generation, active_generation, priority, updated_at
+      ) VALUES (?, 0, ?, 0, NULL, ?, ?)
+      ON CONFLICT(task_id) DO UPDATE SET
+        desired_seq = MAX(projection_states.desired_seq, excluded.desired_seq),
+        priority = MAX(projection_states.priority, excluded.priority),
+        updated_at = excluded.updated_at
+      WHERE excluded.desired_seq > projection_states.desired_seq
+        OR excluded.priority > projection_states.priority
+      RETURNING *
+    `);
     this.recoverInterruptedEpochs();
     this.recoveredProjectionClaims = this.recoverInterruptedProjectionClaims();
   }
@@ -94,26 +114,24 @@ export class RuntimeStore {
     endSeq?: number;
   }): ExecutionEpochRecord {
     const closedAt = input.state === "closed" ? new Date().toISOString() : null;
-    const result = this.database.prepare(`
+    // RETURNING hands back the updated row, so the transition costs one statement.
+    const row = this.database.prepare(`
       UPDATE execution_epochs
       SET state = ?, termination_reason = COALESCE(?, termination_reason),
           closed_at = COALESCE(?, closed_at), end_seq = COALESCE(?, end_seq)
       WHERE epoch_id = ?
-    `).run(
+      RETURNING *
+    `).get(
       input.state,
       input.terminationReason ?? null,
       closedAt,
       input.endSeq ?? null,
       input.epochId
-    );
-    if (Number(result.changes) !== 1) {
+    ) as EpochRow | undefined;
+    if (!row) {
       throw new Error(`Execution epoch not found: ${input.epochId}`);
     }
-    const record = this.getEpoch(input.epochId);
-    if (!record) {
-      throw new Error(`Execution epoch disappeared after transition: ${input.epochId}`);
-    }
-    return record;
+    return epochRowToRecord(row);
   }
 
   getEpoch(epochId: string): ExecutionEpochRecord | undefined {
@@ -153,16 +171,15 @@ export class RuntimeStore {
 
   raiseProjectionDesired(taskId: string, seq: number, priority = 0): ProjectionState {
     const updatedAt = new Date().toISOString();
-    this.database.prepare(`
-      INSERT INTO projection_states (
-        task_id, committed_seq, desired_seq, generation, active_generation, priority, updated_at
-      ) VALUES (?, 0, ?, 0, NULL, ?, ?)
-      ON CONFLICT(task_id) DO UPDATE SET
-        desired_seq = MAX(projection_states.desired_seq, excluded.desired_seq),
-        priority = MAX(projection_states.priority, excluded.priority),
-        updated_at = excluded.updated_at
-    `).run(taskId, Math.max(0, seq), Math.max(0, priority), updatedAt);
-    return this.getProjectionState(taskId);
+    // A raise that moves neither the watermark nor the priority leaves the row
+    // untouched, so repeated raises for the same event do not rewrite it.
+    const row = this.raiseProjectionDesiredStatement.get(
+      taskId,
+      Math.max(0, seq),
+      Math.max(0, priority),
+      updatedAt
+    ) as ProjectionRow | undefined;
+    return row ? projectionRowToState(row) : this.getProjectionState(taskId);
   }
 
   claimProjection(taskId: string): ProjectionClaim | undefined {
@@ -221,9 +238,7 @@ export class RuntimeStore {
   }
 
   getProjectionState(taskId: string): ProjectionState {
-    const row = this.database.prepare(`
-      SELECT * FROM projection_states WHERE task_id = ?
-    `).get(taskId) as ProjectionRow | undefined;
+    const row = this.selectProjectionStateStatement.get(taskId) as ProjectionRow | undefined;
     if (!row) {
       const updatedAt = new Date().toISOString();
       this.database.prepare(`
@@ -252,6 +267,13 @@ export class RuntimeStore {
     return rows.map(projectionRowToState);
   }
 
+  listUncommittedProjectionStates(): ProjectionState[] {
+    const rows = this.database.prepare(`
+      SELECT * FROM projection_states WHERE desired_seq > committed_seq
+    `).all() as ProjectionRow[];
+    return rows.map(projectionRowToState);
+  }
+
   upsertExecutorSession(input: { taskId: string; sessionFile: string; resumeCount?: number }): ExecutorSessionRecord {
     const updatedAt = new Date().toISOString();
     this.database.prepare(`
@@ -0,0 +1,9 @@
+// Every store connection runs in WAL mode. synchronous = NORMAL is durable across
+// application crashes in WAL and drops the fsync from each commit; only the WAL
+// checkpoint syncs. Temporary sort and index b-trees stay in memory.
+export const STORE_CONNECTION_PRAGMAS = [
+  "PRAGMA journal_mode = WAL;",
+  "PRAGMA busy_timeout = 5000;",
+  "PRAGMA synchronous = NORMAL;",
+  "PRAGMA temp_store = MEMORY;"
+].join(" ");
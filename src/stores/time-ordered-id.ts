@@ -0,0 +1,24 @@
+import { randomFillSync } from "node:crypto";
+
+const RANDOM_POOL_BYTES = 4096;
+const UUID_BYTES = 16;
+
+// Burst inserts draw ids from one pooled entropy fill instead of one per id.
+const randomPool = Buffer.allocUnsafe(RANDOM_POOL_BYTES);
+let randomPoolOffset = RANDOM_POOL_BYTES;
+
+// UUIDv7 (RFC 9562): a millisecond timestamp prefix keeps consecutive ids on the
+// same index leaf, unlike random UUIDv4 keys.
+export function timeOrderedUuid(now = Date.now()): string {
+  if (randomPoolOffset + UUID_BYTES > RANDOM_POOL_BYTES) {
+    randomFillSync(randomPool);
+    randomPoolOffset = 0;
+  }
+  const bytes = randomPool.subarray(randomPoolOffset, randomPoolOffset + UUID_BYTES);
+  randomPoolOffset += UUID_BYTES;
+  bytes.writeUIntBE(now, 0, 6);
+  bytes[6] = (bytes[6] & 0x0f) | 0x70;
+  bytes[8] = (bytes[8] & 0x3f) | 0x80;
+  const hex = bytes.toString("hex");
+  return `${hex.slice(0, 8)}-${hex.slice(8, 12)}-${hex.slice(12, 16)}-${hex.slice(16, 20)}-${hex.slice(20)}`;
+}
@@ -66,6 +66,7 @@ export class AgentTimeline implements Component {
   private readonly expandedActionIds = new Set<string>();
   private readonly artifactDetails = new Map<string, string>();
   private readonly loadingArtifactRefs = new Set<string>();
+  private renderCache?: { width: number; lines: string[] };
 
   constructor(
     private readonly maxEvents = 500,
@@ -73,10 +74,12 @@ export class AgentTimeline implements Component {
   ) {}
 
   setGoal(goal: string): void {
+    this.invalidate();
     this.goal = goal;
   }
 
   setRuntime(runtimeDir: string, resumed: boolean): void {
+    this.invalidate();
     this.runtimeDir = runtimeDir;
     this.resumed = resumed;
   }
@@ -85,6 +88,7 @@ export class AgentTimeline implements Component {
     if (this.seenEventIds.has(event.id)) {
       return;
     }
+    this.invalidate();
     this.seenEventIds.add(event.id);
     if (event.taskId && !this.taskOrdinals.has(event.taskId)) {
       this.taskOrdinals.set(event.taskId, this.taskOrdinals.size + 1);
@@ -99,11 +103,13 @@ export class AgentTimeline implements Component {
   }
 
   setStatus(status: TimelineStatus, detail: string): void {
+    this.invalidate();
     this.status = status;
     this.statusDetail = detail;
   }
 
   cycleTaskFilter(direction = 1): void {
+    this.invalidate();
     const taskIds = [...buildTaskPresentation(this.events, this.taskOrdinals).keys()];
     if (taskIds.length === 0) {
       this.taskFilter = undefined;
@@ -119,6 +125,7 @@ export class AgentTimeline implements Component {
   }
 
   moveActionSelection(direction: number): void {
+    this.invalidate();
     const items = this.timelineItems();
     const actions = items.filter((item): item is Extract<TimelineItem, { kind: "action" }> => item.kind === "action");
     if (actions.length === 0) {
@@ -133,6 +140,7 @@ export class AgentTimeline implements Component {
   }
 
   async toggleSelectedAction(): Promise<void> {
+    this.invalidate();
     const items = this.timelineItems();
     this.syncSelectedAction(items);
     if (!this.selectedActionId) {
@@ -152,19 +160,28 @@ export class AgentTimeline implements Component {
       .filter((ref) => !this.artifactDetails.has(ref) && !this.loadingArtifactRefs.has(ref));
     await Promise.all(refs.map(async (ref) => {
       this.loadingArtifactRefs.add(ref);
+      this.invalidate();
       try {
         this.artifactDetails.set(ref, await this.loadArtifactDetail!(ref));
       } catch (error) {
         this.artifactDetails.set(ref, `无法读取完整输出: ${errorMessage(error)}`);
       } finally {
         this.loadingArtifactRefs.delete(ref);
+        this.invalidate();
       }
     }));
   }
 
-  invalidate(): void {}
+  // Every state change drops the cached frame, so repeated render requests with
+  // nothing new (duplicate events, resize-free redraws) skip the full rebuild.
+  invalidate(): void {
+    this.renderCache = undefined;
+  }
 
   render(width: number): string[] {
+    if (this.renderCache?.width === width) {
+      return this.renderCache.lines;
+    }
     const contentWidth = Math.max(20, width - 2);
     const lines: string[] = [];
     const header = new Text(
@@ -223,6 +240,7 @@ export class AgentTimeline implements Component {
         0
       ).render(contentWidth + 2));
     }
+    this.renderCache = { width, lines };
     return lines;
   }
 
@@ -235,9 +253,9 @@ export class AgentTimeline implements Component {
 
   private syncSelectedAction(items: TimelineItem[]): void {
     const actions = items.filter((item): item is Extract<TimelineItem, { kind: "action" }> => item.kind === "action");
-    const actionIds = actions.map((item) => item.id);
+    const actionIds = new Set(actions.map((item) => item.id));
     for (const actionId of this.expandedActionIds) {
-      if (!actionIds.includes(actionId)) {
+      if (!actionIds.has(actionId)) {
         this.expandedActionIds.delete(actionId);
       }
     }
@@ -248,14 +266,14 @@ export class AgentTimeline implements Component {
       }
     }
     if (!this.selectionPinned) {
-      this.selectedActionId = actionIds.at(-1);
+      this.selectedActionId = actions.at(-1)?.id;
       return;
     }
-    if (this.selectedActionId && actionIds.includes(this.selectedActionId)) {
+    if (this.selectedActionId && actionIds.has(this.selectedActionId)) {
       return;
     }
     this.selectionPinned = false;
-    this.selectedActionId = actionIds.at(-1);
+    this.selectedActionId = actions.at(-1)?.id;
   }
 }
 
@@ -436,12 +454,13 @@ function toolOutput(
   artifactDetails: Map<string, string>,
   loadingArtifactRefs: Set<string>
 ): string {
-  const inlineOutput = extractToolOutput(tool.result);
+  // Expanded tools backed by artifacts show the artifact bodies instead, so the
+  // inline result is only extracted and sanitized when it is actually displayed.
   if (!expanded) {
-    return previewText(inlineOutput, 700, 5).text;
+    return previewText(extractToolOutput(tool.result), 700, 5).text;
   }
   if (tool.artifactRefs.length === 0) {
-    return inlineOutput;
+    return extractToolOutput(tool.result);
   }
   const details = tool.artifactRefs.flatMap((ref) => {
     const detail = artifactDetails.get(ref);
@@ -584,22 +603,21 @@ function collectOutputText(value: unknown, target: string[]): void {
   }
 }
 
+const VISIBLE_CONTROL_EVENT_TYPES = new Set([
+  "planner_cycle_started",
+  "planner_cycle_completed",
+  "task_started",
+  "task_completed",
+  "task_partial",
+  "task_blocked",
+  "task_failed",
+  "supervisor_check_succeeded",
+  "projection_job_succeeded",
+  "provider_error"
+]);
+
 function shouldShowControlEvent(event: ExecutionEvent): boolean {
-  if (event.eventType.startsWith("run_")) {
-    return true;
-  }
-  return [
-    "planner_cycle_started",
-    "planner_cycle_completed",
-    "task_started",
-    "task_completed",
-    "task_partial",
-    "task_blocked",
-    "task_failed",
-    "supervisor_check_succeeded",
-    "projection_job_succeeded",
-    "provider_error"
-  ].includes(event.eventType);
+  return event.eventType.startsWith("run_") || VISIBLE_CONTROL_EVENT_TYPES.has(event.eventType);
 }
 
 function controlEventLabel(eventType: string): string {
@@ -652,7 +670,10 @@ function compactJson(value: unknown): string {
   if (value === undefined) {
     return "";
   }
-  const serialized = JSON.stringify(value);
+  // Only the first 600 characters survive, so oversized strings and arrays are
+  // clipped before serializing; the kept prefix and overflow marker are unchanged.
+  const serialized = JSON.stringify(value, (_key, item: unknown) =>
+    (typeof item === "string" || Array.isArray(item)) && item.length > 600 ? item.slice(0, 601) : item);
   return serialized.length > 600 ? `${serialized.slice(0, 600)}...` : serialized;
 }
 
@@ -663,13 +684,23 @@ function prettyJson(value: unknown): string {
   return JSON.stringify(value, null, 2);
 }
 
+// Every row of a task repeats the same inline label, so it is formatted once per
+// presentation object rather than sanitized and truncated for each event.
+const taskInlineLabels = new WeakMap<TaskPresentation, string>();
+
 function taskInlineLabel(task: TaskPresentation | undefined): string {
   if (!task) {
     return "未知任务";
   }
-  return task.goal
+  const cached = taskInlineLabels.get(task);
+  if (cached !== undefined) {
+    return cached;
+  }
+  const label = task.goal
     ? `${task.label} ${truncatePlain(sanitizeTerminalText(task.goal), 22)}`
     : `${task.label} ${sanitizeTerminalText(task.taskId)}`;
+  taskInlineLabels.set(task, label);
+  return label;
 }
 
 function taskStatusSummary(tasks: Map<string, TaskPresentation>): string {
@@ -727,15 +758,16 @@ function errorMessage(error: unknown): string {
   return error instanceof Error ? error.message : String(error);
 }
 
+// C0 controls other than tab and newline, plus DEL; removed with one regex pass
+// instead of splitting the text into code points.
+const TERMINAL_CONTROL_CHARACTERS = /[\u0000-\u0008\u000b-\u001f\u007f]/g;
+
 function sanitizeTerminalText(value: string): string {
-  const withoutAnsi = value
+  return value
     .replace(/\u001b\][^\u0007]*(?:\u0007|\u001b\\)/g, "")
     .replace(/\u001b\[[0-?]*[ -/]*[@-~]/g, "")
-    .replace(/\r\n?/g, "\n");
-  return [...withoutAnsi].filter((character) => {
-    const codePoint = character.codePointAt(0)!;
-    return codePoint === 9 || codePoint === 10 || (codePoint >= 32 && codePoint !== 127);
-  }).join("");
+    .replace(/\r\n?/g, "\n")
+    .replace(TERMINAL_CONTROL_CHARACTERS, "");
 }
 
 function stringValue(value: unknown): string | undefined {
@@ -3,6 +3,7 @@ import { mkdirSync } from "node:fs";
 import { promisify } from "node:util";
 import { dirname } from "node:path";
 import { DatabaseSync } from "node:sqlite";
+import { STORE_CONNECTION_PRAGMAS } from "./stores/sqlite-pragmas.js";
 
 const scrypt = promisify(scryptCallback);
 const SESSION_TTL_MS = 7 * 24 * 60 * 60 * 1000;
@@ -41,7 +42,7 @@ export class WebAuthService {
   constructor(databasePath: string) {
     mkdirSync(dirname(databasePath), { recursive: true });
     this.database = new DatabaseSync(databasePath);
-    this.database.exec("PRAGMA journal_mode = WAL; PRAGMA busy_timeout = 5000; PRAGMA foreign_keys = ON;");
+    this.database.exec(`${STORE_CONNECTION_PRAGMAS} PRAGMA foreign_keys = ON;`);
     this.database.exec(`
       CREATE TABLE IF NOT EXISTS web_users (
         id TEXT PRIMARY KEY,
@@ -1,6 +1,6 @@
 import { createServer, type IncomingMessage, type ServerResponse } from "node:http";
 import { randomUUID } from "node:crypto";
-import { createReadStream, existsSync } from "node:fs";
+import { createReadStream, type Stats } from "node:fs";
 import { open, readFile, stat } from "node:fs/promises";
 import { basename, extname, join, relative, resolve, sep } from "node:path";
 import { DatabaseSync } from "node:sqlite";
@@ -366,7 +366,9 @@ class HttpError extends Error {
 }
 
 server.listen(port, host, () => {
-  console.log(`Luanniao Agent Trace listening on http://${host}:${port}`);
+  const address = server.address();
+  const boundPort = address && typeof address === "object" ? address.port : port;
+  console.log(`Luanniao Agent Trace listening on http://${host}:${boundPort}`);
   console.log(`Runtime dir: ${runtimePathPolicy.rootDir}`);
   if (!isLoopbackHost(host)) {
     console.error("Warning: web workbench is bound beyond loopback; traffic-proxy data and runtime artifacts are reachable to anyone who can authenticate. Only do this on a trusted network.");
@@ -392,6 +394,8 @@ const shutdown = (signal: NodeJS.Signals): Promise<void> => {
     ]);
     await trafficProxyRegistry.closeAll();
     authService.close();
+    for (const databasePath of [...runtimeDatabases.keys()]) closeRuntimeDatabase(databasePath);
+    for (const databasePath of [...connectivityReadStores.keys()]) closeConnectivityReadStore(databasePath);
     server.closeAllConnections();
     await withTimeout(serverClosed, 2_000).catch(() => undefined);
   })().finally(() => {
@@ -474,18 +478,49 @@ async function readConnectivity(url: URL, includeCredentialRef: boolean): Promis
   const runtimeInput = url.searchParams.get("runtimeDir") ?? defaultRuntimeDir;
   const runtimeDir = await runtimePathPolicy.resolveRuntime(runtimeInput, "existing");
   const databasePath = join(runtimeDir, "state.sqlite");
-  if (!existsSync(databasePath)) {
+  const databaseStat = await statMaybe(databasePath);
+  if (!databaseStat) {
     return { runtimeDir: runtimeInput, loadedAt: new Date().toISOString(), connections: [] };
   }
-  const store = new ConnectivityStore(databasePath);
+  const managedStore = connectivityManagers.get(runtimeDir)?.store;
+  const store = managedStore ?? connectivityReadStore(databasePath, databaseStat);
   try {
     return {
       runtimeDir: runtimeInput,
       loadedAt: new Date().toISOString(),
       connections: store.listDefinitions().map((definition) => webConnection(definition, runtimeInput, includeCredentialRef))
     };
-  } finally {
-    store.close();
+  } catch (error) {
+    if (!managedStore) closeConnectivityReadStore(databasePath);
+    throw error;
+  }
+}
+
+// Connectivity polls reuse one store per runtime database instead of opening and
+// initializing a connection per request; a recreated file gets a fresh store.
+const connectivityReadStores = new Map<string, { ino: number; store: ConnectivityStore }>();
+
+function connectivityReadStore(databasePath: string, databaseStat: Stats): ConnectivityStore {
+  const cached = connectivityReadStores.get(databasePath);
+  if (cached?.ino === databaseStat.ino) {
+    return cached.store;
+  }
+  closeConnectivityReadStore(databasePath);
+  const store = new ConnectivityStore(databasePath);
+  connectivityReadStores.set(databasePath, { ino: databaseStat.ino, store });
+  if (connectivityReadStores.size > MAX_RUNTIME_DATABASES) {
+    closeConnectivityReadStore(connectivityReadStores.keys().next().value!);
+  }
+  return store;
+}
+
+function closeConnectivityReadStore(databasePath: string): void {
+  const cached = connectivityReadStores.get(databasePath);
+  connectivityReadStores.delete(databasePath);
+  try {
+    cached?.store.close();
+  } catch {
+    // Already closed.
   }
 }
 
@@ -1196,8 +1231,8 @@ async function closeConnectivityManagers(): Promise<void> {
   const entries = [...connectivityManagers.entries()];
   connectivityManagers.clear();
   await Promise.allSettled(entries.map(async ([, managers]) => {
-    const tunnels = managers.store.listDefinitions().filter((definition) =>
-      definition.kind === "tunnel" && isManagedConnection(definition) && definition.status !== "closed"
+    const tunnels = managers.store.listDefinitions("tunnel").filter((definition) =>
+      isManagedConnection(definition) && definition.status !== "closed"
     );
     await Promise.allSettled(tunnels.map((definition) => withTimeout(managers.tunnels.stop(definition.id), 2_000)));
     managers.graphStore.close();
@@ -1230,12 +1265,12 @@ function optionalPositiveNumber(value: unknown): number | undefined {
 
 async function readRuntimeState(runtimeDirInput: string): Promise<JsonRecord> {
   const runtimeDir = await runtimePathPolicy.resolveRuntime(runtimeDirInput, "existing");
-  const [events, graphDeltas, artifacts] = await Promise.all([
+  const [events, artifacts, databaseStat] = await Promise.all([
     readJsonl<WebEvent>(join(runtimeDir, "execution.jsonl"), 700),
-    readJsonl<JsonRecord>(join(runtimeDir, "graph-deltas.jsonl"), 260),
-    readJsonl<ArtifactRecord>(join(runtimeDir, "artifacts", "index.jsonl"), 240)
+    readJsonl<ArtifactRecord>(join(runtimeDir, "artifacts", "index.jsonl"), 240),
+    statMaybe(join(runtimeDir, "state.sqlite"))
   ]);
-  const graph = readGraph(runtimeDir, graphDeltas);
+  const graph = await readGraph(runtimeDir, databaseStat);
   const traceItems = buildTraceItems(events);
   return {
     runtimeDir,
@@ -1332,17 +1367,17 @@ async function readRuntimeSession(rootDir: string, runtimeDir: string): Promise<
   ]);
   if (!databaseStat && !executionStat && !graphDeltaStat && !artifactIndexStat) return undefined;
 
-  const graphMeta = await readRuntimeSessionGraphMeta(runtimeDir);
+  const [graphMeta, eventCount, artifactCount] = await Promise.all([
+    readRuntimeSessionGraphMeta(runtimeDir, databaseStat),
+    countJsonlLines(join(runtimeDir, "execution.jsonl")),
+    countJsonlLines(join(runtimeDir, "artifacts", "index.jsonl"))
+  ]);
   const updatedAtMs = Math.max(
     databaseStat?.mtimeMs ?? 0,
     executionStat?.mtimeMs ?? 0,
     graphDeltaStat?.mtimeMs ?? 0,
     artifactIndexStat?.mtimeMs ?? 0
   );
-  const [eventCount, artifactCount] = await Promise.all([
-    countJsonlLines(join(runtimeDir, "execution.jsonl")),
-    countJsonlLines(join(runtimeDir, "artifacts", "index.jsonl"))
-  ]);
 
   return {
     name: runtimeDir === rootDir ? `${basename(rootDir)} / 当前根` : basename(runtimeDir),
@@ -1363,7 +1398,40 @@ async function readRuntimeSession(rootDir: string, runtimeDir: string): Promise<
   };
 }
 
-async function readRuntimeSessionGraphMeta(runtimeDir: string): Promise<{
+// Session listings and state polls read the same runtime databases repeatedly,
+// so connections stay open per file and are replaced when the file is recreated.
+const MAX_RUNTIME_DATABASES = 16;
+const runtimeDatabases = new Map<string, { ino: number; database: DatabaseSync }>();
+
+function runtimeDatabase(databasePath: string, databaseStat: Stats): DatabaseSync {
+  const cached = runtimeDatabases.get(databasePath);
+  if (cached?.ino === databaseStat.ino) {
+    return cached.database;
+  }
+  closeRuntimeDatabase(databasePath);
+  // The agent process owns writes to this file. Web reads go through a read-only
+  // connection, so they can never take the write lock; with WAL they also never
+  // wait for the writer except for a brief lock, which the busy timeout covers.
+  const database = new DatabaseSync(databasePath, { readOnly: true });
+  database.exec("PRAGMA busy_timeout = 5000;");
+  runtimeDatabases.set(databasePath, { ino: databaseStat.ino, database });
+  if (runtimeDatabases.size > MAX_RUNTIME_DATABASES) {
+    closeRuntimeDatabase(runtimeDatabases.keys().next().value!);
+  }
+  return database;
+}
+
+function closeRuntimeDatabase(databasePath: string): void {
+  const cached = runtimeDatabases.get(databasePath);
+  runtimeDatabases.delete(databasePath);
+  try {
+    cached?.database.close();
+  } catch {
+    // Already closed.
+  }
+}
+
+async function readRuntimeSessionGraphMeta(runtimeDir: string, databaseStat: Stats | undefined): Promise<{
   source: string;
   nodeCount: number;
   edgeCount: number;
@@ -1373,45 +1441,42 @@ async function readRuntimeSessionGraphMeta(runtimeDir: string): Promise<{
   latestTaskStatus?: string;
 }> {
   const databasePath = join(runtimeDir, "state.sqlite");
-  if (existsSync(databasePath)) {
+  if (databaseStat) {
     try {
-      const database = new DatabaseSync(databasePath);
-      try {
-        const nodeRow = asRecord(database.prepare(`
-          SELECT
-            COUNT(*) AS nodeCount,
-            SUM(CASE WHEN type = 'Task' THEN 1 ELSE 0 END) AS taskCount
-          FROM nodes
-        `).get());
-        const edgeRow = asRecord(database.prepare("SELECT COUNT(*) AS edgeCount FROM edges").get());
-        const goalRow = asRecord(database.prepare(`
-          SELECT label
-          FROM nodes
-          WHERE type = 'Goal'
-          ORDER BY updated_at DESC
-          LIMIT 1
-        `).get());
-        const taskRow = asRecord(database.prepare(`
-          SELECT label, properties_json
-          FROM nodes
-          WHERE type = 'Task'
-          ORDER BY updated_at DESC
-          LIMIT 1
-        `).get());
-        const taskProperties = parseJsonObject(taskRow.properties_json);
-        return {
-          source: "sqlite",
-          nodeCount: numberValue(nodeRow.nodeCount),
-          edgeCount: numberValue(edgeRow.edgeCount),
-          taskCount: numberValue(nodeRow.taskCount),
-          goal: stringValue(goalRow.label, ""),
-          latestTask: stringValue(taskRow.label, ""),
-          latestTaskStatus: stringValue(taskProperties.status, "")
-        };
-      } finally {
-        database.close();
-      }
+      const database = runtimeDatabase(databasePath, databaseStat);
+      const nodeRow = asRecord(database.prepare(`
+        SELECT
+          COUNT(*) AS nodeCount,
+          SUM(CASE WHEN type = 'Task' THEN 1 ELSE 0 END) AS taskCount
+        FROM nodes
+      `).get());
+      const edgeRow = asRecord(database.prepare("SELECT COUNT(*) AS edgeCount FROM edges").get());
+      const goalRow = asRecord(database.prepare(`
+        SELECT label
+        FROM nodes
+        WHERE graph_kind = 'task' AND type = 'Goal'
+        ORDER BY updated_at DESC
+        LIMIT 1
+      `).get());
+      const taskRow = asRecord(database.prepare(`
+        SELECT label, properties_json
+        FROM nodes
+        WHERE graph_kind = 'task' AND type = 'Task'
+        ORDER BY updated_at DESC
+        LIMIT 1
+      `).get());
+      const taskProperties = parseJsonObject(taskRow.properties_json);
+      return {
+        source: "sqlite",
+        nodeCount: numberValue(nodeRow.nodeCount),
+        edgeCount: numberValue(edgeRow.edgeCount),
+        taskCount: numberValue(nodeRow.taskCount),
+        goal: stringValue(goalRow.label, ""),
+        latestTask: stringValue(taskRow.label, ""),
+        latestTaskStatus: stringValue(taskProperties.status, "")
+      };
     } catch {
+      closeRuntimeDatabase(databasePath);
       // Fall through to graph-deltas so a broken SQLite file does not hide a session.
     }
   }
@@ -1430,39 +1495,59 @@ async function readRuntimeSessionGraphMeta(runtimeDir: string): Promise<{
   };
 }
 
-function readGraph(runtimeDir: string, graphDeltas: JsonRecord[]): {
+// Every graph write appends a graph_deltas row, so the newest delta identifies
+// the graph and unchanged sessions skip re-reading and re-parsing it per poll.
+const MAX_CACHED_GRAPH_SNAPSHOTS = 16;
+const graphSnapshotCache = new Map<string, { version: string; graph: Awaited<ReturnType<typeof readGraph>> }>();
+
+// graph-deltas.jsonl is only a fallback for runtimes without a readable SQLite
+// graph, so the whole log is not read and parsed on every poll.
+async function readGraph(runtimeDir: string, databaseStat: Stats | undefined): Promise<{
   nodes: WebNode[];
   edges: WebEdge[];
   summary: JsonRecord;
   source: string;
+  version?: string;
   sqliteError?: string;
-} {
+}> {
+  const readGraphDeltas = () => readJsonl<JsonRecord>(join(runtimeDir, "graph-deltas.jsonl"), 260);
   const databasePath = join(runtimeDir, "state.sqlite");
-  if (existsSync(databasePath)) {
+  if (databaseStat) {
     try {
-      const database = new DatabaseSync(databasePath);
-      try {
-        const nodes = database.prepare(`
-          SELECT id, graph_kind, type, label, properties_json, evidence_refs_json, updated_at
-          FROM nodes
-          ORDER BY updated_at DESC
-          LIMIT 1200
-        `).all().map(normalizeNode);
-        const edges = database.prepare(`
-          SELECT id, from_id, to_id, type, properties_json, evidence_refs_json, updated_at
-          FROM edges
-          ORDER BY updated_at DESC
-          LIMIT 2400
-        `).all().map(normalizeEdge);
-        return { nodes, edges, summary: summarizeGraph(nodes, edges), source: "sqlite" };
-      } finally {
-        database.close();
+      const database = runtimeDatabase(databasePath, databaseStat);
+      const latestDelta = asRecord(database.prepare(`
+        SELECT rowid AS version, created_at FROM graph_deltas ORDER BY rowid DESC LIMIT 1
+      `).get());
+      const version = `${databaseStat.ino}:${numberValue(latestDelta.version)}:${stringValue(latestDelta.created_at, "")}`;
+      const cached = graphSnapshotCache.get(runtimeDir);
+      if (cached?.version === version) {
+        return cached.graph;
       }
+      const nodes = database.prepare(`
+        SELECT id, graph_kind, type, label, properties_json, evidence_refs_json, updated_at
+        FROM nodes
+        ORDER BY updated_at DESC
+        LIMIT 1200
+      `).all().map(normalizeNode);
+      const edges = database.prepare(`
+        SELECT id, from_id, to_id, type, properties_json, evidence_refs_json, updated_at
+        FROM edges
+        ORDER BY updated_at DESC
+        LIMIT 2400
+      `).all().map(normalizeEdge);
+      const graph = { nodes, edges, summary: summarizeGraph(nodes, edges), source: "sqlite", version };
+      graphSnapshotCache.delete(runtimeDir);
+      graphSnapshotCache.set(runtimeDir, { version, graph });
+      if (graphSnapshotCache.size > MAX_CACHED_GRAPH_SNAPSHOTS) {
+        graphSnapshotCache.delete(graphSnapshotCache.keys().next().value!);
+      }
+      return graph;
     } catch (error) {
-      return graphFromDeltas(graphDeltas, error instanceof Error ? error.message : String(error));
+      closeRuntimeDatabase(databasePath);
+      return graphFromDeltas(await readGraphDeltas(), error instanceof Error ? error.message : String(error));
     }
   }
-  return graphFromDeltas(graphDeltas);
+  return graphFromDeltas(await readGraphDeltas());
 }
 
 function graphFromDeltas(graphDeltas: JsonRecord[], sqliteError?: string): {
@@ -1658,6 +1743,8 @@ function collectAgentActionEvents(events: WebEvent[], intentIndex: number, toolE
 function toAgentActionTraceItem(intent: WebEvent, actionEvents: WebEvent[], toolEvents: WebEvent[]): TraceItem {
   const intentPayload = isRecord(intent.payload) ? intent.payload : {};
   const relatedPayloads = actionEvents.map((event) => (isRecord(event.payload) ? event.payload : {}));
+  const plannerDecisions = relatedPayloads.map((payload) => firstRecord(payload.plannerDecision));
+  const controlSignals = relatedPayloads.map((payload) => firstRecord(payload.controlSignal));
   const toolItem = toolEvents.length ? toToolTraceItem(toolEvents) : undefined;
   const calls = intentToolCalls(intentPayload);
   const firstCall = calls[0];
@@ -1668,8 +1755,8 @@ function toAgentActionTraceItem(intent: WebEvent, actionEvents: WebEvent[], tool
     recordedText: intentPayload.text,
     call: firstCall,
     relatedReasons: [
-      ...relatedPayloads.map((payload) => firstRecord(payload.plannerDecision)?.reason),
-      ...relatedPayloads.map((payload) => firstRecord(payload.controlSignal)?.reason)
+      ...plannerDecisions.map((plannerDecision) => plannerDecision?.reason),
+      ...controlSignals.map((controlSignal) => controlSignal?.reason)
     ]
   });
   const action = summarizeTraceAction(firstCall) || toolItem?.action;
@@ -1677,7 +1764,7 @@ function toAgentActionTraceItem(intent: WebEvent, actionEvents: WebEvent[], tool
   const commandDetails = firstCall?.name === "planner_submit"
     ? summarizePlannerCommands(
       callArgs.commands
-      ?? relatedPayloads.map((payload) => firstRecord(payload.plannerDecision)?.commands).find(Array.isArray)
+      ?? plannerDecisions.map((plannerDecision) => plannerDecision?.commands).find(Array.isArray)
     )
     : [];
   const lastEvent = actionEvents[actionEvents.length - 1] ?? intent;
@@ -1697,7 +1784,11 @@ function toAgentActionTraceItem(intent: WebEvent, actionEvents: WebEvent[], tool
     summary: intentPresentation.text,
     intentSource: intentPresentation.source,
     detail: actionEvents.map((event) => eventTypeLabel(event.role, event.eventType)).join(" → "),
-    decision: firstText(callArgs.decision, ...relatedPayloads.map((payload) => firstRecord(payload.plannerDecision)?.decision), ...relatedPayloads.map((payload) => firstRecord(payload.controlSignal)?.decision)),
+    decision: firstText(
+      callArgs.decision,
+      ...plannerDecisions.map((plannerDecision) => plannerDecision?.decision),
+      ...controlSignals.map((controlSignal) => controlSignal?.decision)
+    ),
     action,
     observation: toolItem?.observation,
     next: toolItem?.next,
@@ -2036,10 +2127,12 @@ function readableEventSummary(event: WebEvent, payload: JsonRecord): string {
   return eventTypeLabel(event.role, event.eventType);
 }
 
+const TOOL_CALL_EVENT_TYPES = new Set(["tool_started", "tool_finished", "runtime_control"]);
+
 function getToolCallId(event: WebEvent): string | undefined {
   const payload = isRecord(event.payload) ? event.payload : {};
   const toolCallId = stringValue(payload.toolCallId, "");
-  if (event.eventType?.startsWith("tool_execution") || ["tool_started", "tool_finished", "runtime_control"].includes(event.eventType)) {
+  if (event.eventType?.startsWith("tool_execution") || TOOL_CALL_EVENT_TYPES.has(event.eventType)) {
     return toolCallId || undefined;
   }
   if (event.eventType === "message_end") {
@@ -2051,23 +2144,25 @@ function getToolCallId(event: WebEvent): string | undefined {
   return undefined;
 }
 
+const SKIPPED_TRACE_EVENT_TYPES = new Set([
+  "agent_start",
+  "agent_end",
+  "turn_end",
+  "turn_usage",
+  "assistant_intent",
+  "tool_started",
+  "tool_finished",
+  "runtime_control",
+  "planner_apply_commands",
+  "supervisor_check_succeeded",
+  "projection_job_succeeded",
+  "projection_job_failed",
+  "provider_error"
+]);
+
 function shouldSkipTraceEvent(event: WebEvent): boolean {
   if (event.role === "runtime") return true;
-  if ([
-    "agent_start",
-    "agent_end",
-    "turn_end",
-    "turn_usage",
-    "assistant_intent",
-    "tool_started",
-    "tool_finished",
-    "runtime_control",
-    "planner_apply_commands",
-    "supervisor_check_succeeded",
-    "projection_job_succeeded",
-    "projection_job_failed",
-    "provider_error"
-  ].includes(event.eventType)) {
+  if (SKIPPED_TRACE_EVENT_TYPES.has(event.eventType)) {
     return true;
   }
   if (event.eventType !== "message_end") return false;
@@ -2089,19 +2184,21 @@ function isToolEndEvent(eventType: string): boolean {
   return eventType === "tool_finished" || eventType === "runtime_control" || eventType === "tool_execution_end";
 }
 
+const AGENT_ACTION_DETAIL_EVENT_TYPES = new Set([
+  "tool_started",
+  "tool_finished",
+  "runtime_control",
+  "turn_usage",
+  "planner_apply_commands",
+  "supervisor_check_succeeded",
+  "task_completed",
+  "task_partial",
+  "task_blocked",
+  "task_failed"
+]);
+
 function isAgentActionDetailEvent(eventType: string): boolean {
-  return [
-    "tool_started",
-    "tool_finished",
-    "runtime_control",
-    "turn_usage",
-    "planner_apply_commands",
-    "supervisor_check_succeeded",
-    "task_completed",
-    "task_partial",
-    "task_blocked",
-    "task_failed"
-  ].includes(eventType);
+  return AGENT_ACTION_DETAIL_EVENT_TYPES.has(eventType);
 }
 
 function intentToolCalls(payload: JsonRecord): TraceToolCall[] {
@@ -2230,6 +2327,8 @@ function compactArtifact(record: ArtifactRecord): ArtifactRecord {
   };
 }
 
+const COMPACT_JSON_OMITTED_KEYS = new Set(["thinking", "thinkingSignature", "messages"]);
+
 function compactJson(value: unknown, depth: number): unknown {
   if (typeof value === "string") return truncate(value, 1200);
   if (typeof value !== "object" || value === null) return value;
@@ -2237,7 +2336,7 @@ function compactJson(value: unknown, depth: number): unknown {
   if (depth > 5) return "[truncated:depth]";
   const output: JsonRecord = {};
   for (const [key, item] of Object.entries(value)) {
-    if (["thinking", "thinkingSignature", "messages"].includes(key)) continue;
+    if (COMPACT_JSON_OMITTED_KEYS.has(key)) continue;
     output[key] = compactJson(item, depth + 1);
   }
   return output;
@@ -2245,8 +2344,7 @@ function compactJson(value: unknown, depth: number): unknown {
 
 async function readJsonl<T>(filePath: string, limit: number): Promise<T[]> {
   try {
-    const content = await readFile(filePath, "utf8");
-    const lines = content.split("\n").filter((line) => line.trim().length > 0).slice(-limit);
+    const lines = await readTailLines(filePath, limit);
     const parsed: T[] = [];
     for (const line of lines) {
       try {
@@ -2262,6 +2360,58 @@ async function readJsonl<T>(filePath: string, limit: number): Promise<T[]> {
   }
 }
 
+// The logs are append-only and grow for the whole run, so the tail is read in
+// chunks from the end of the file instead of loading the file on every poll.
+const JSONL_TAIL_CHUNK_BYTES = 64 * 1024;
+
+async function readTailLines(filePath: string, limit: number): Promise<string[]> {
+  const handle = await open(filePath, "r");
+  try {
+    const { size } = await handle.stat();
+    const chunks: Buffer[] = [];
+    let position = size;
+    let newlineCount = 0;
+    while (position > 0) {
+      const length = Math.min(JSONL_TAIL_CHUNK_BYTES, position);
+      position -= length;
+      const chunk = Buffer.allocUnsafe(length);
+      const { bytesRead } = await handle.read(chunk, 0, length, position);
+      chunks.unshift(chunk.subarray(0, bytesRead));
+      for (let index = chunk.indexOf(10); index !== -1 && index < bytesRead; index = chunk.indexOf(10, index + 1)) {
+        newlineCount += 1;
+      }
+      if (position > 0 && newlineCount > limit) {
+        // Bytes after a newline start a whole line, so the partial first line is
+        // dropped before decoding and multi-byte characters are never split.
+        const buffer = Buffer.concat(chunks);
+        const lines = tailLines(buffer.subarray(buffer.indexOf(10) + 1).toString("utf8"), limit);
+        if (lines.length >= limit) {
+          return lines;
+        }
+      }
+    }
+    return tailLines(Buffer.concat(chunks).toString("utf8"), limit);
+  } finally {
+    await handle.close();
+  }
+}
+
+// Walks back from the end of the file so only the retained tail is copied,
+// instead of splitting, filtering and slicing the whole log on every poll.
+function tailLines(content: string, limit: number): string[] {
+  const lines: string[] = [];
+  let end = content.length;
+  while (end > 0 && lines.length < limit) {
+    const start = content.lastIndexOf("\n", end - 1);
+    const line = content.slice(start + 1, end);
+    if (line.trim().length > 0) {
+      lines.push(line);
+    }
+    end = Math.max(0, start);
+  }
+  return lines.reverse();
+}
+
 async function countJsonlLines(filePath: string): Promise<number> {
   try {
     let count = 0;
@@ -2390,7 +2540,7 @@ async function sendJson(
     "X-Content-Type-Options": "nosniff",
     ...headers
   });
-  response.end(JSON.stringify(data, null, 2));
+  response.end(JSON.stringify(data));
 }
 
 function parseArgs(rawArgs: string[]): Record<string, string> {
@@ -2408,10 +2558,12 @@ function parseArgs(rawArgs: string[]): Record<string, string> {
   return parsed;
 }
 
+// Port 0 lets the listening socket take a free port in the bind itself, so
+// callers do not need to probe for one and race other processes for it.
 function parseWebPort(value: string): number {
   const port = Number(value);
-  if (!Number.isInteger(port) || port < 1 || port > 65535) {
-    throw new Error(`Invalid web server port: ${value} (expected an integer between 1 and 65535)`);
+  if (!Number.isInteger(port) || port < 0 || port > 65535) {
+    throw new Error(`Invalid web server port: ${value} (expected an integer between 0 and 65535)`);
   }
   return port;
 }
@@ -1,5 +1,5 @@
 import assert from "node:assert/strict";
-import { mkdtempSync } from "node:fs";
+import { mkdtempSync, readFileSync } from "node:fs";
 import { tmpdir } from "node:os";
 import { join } from "node:path";
 import test from "node:test";
@@ -19,6 +19,37 @@ test("writes artifacts and reads them by artifact ref", async () => {
   assert.equal((await artifactStore.get(record.artifactRef))?.path, record.path);
 });
 
+test("reads bounded artifact ranges and previews without the rest of the file", async () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-artifact-"));
+  const artifactStore = new ArtifactStore(join(runtimeDir, "artifacts"));
+  const record = await artifactStore.write({
+    taskId: "task:range",
+    kind: "text",
+    mediaType: "text/plain",
+    data: "0123456789"
+  });
+
+  assert.equal(await artifactStore.read(record.artifactRef, { offset: 3, length: 4 }), "3456");
+  assert.equal(await artifactStore.read(record.artifactRef, { offset: 8, length: Number.MAX_SAFE_INTEGER }), "89");
+  assert.equal(await artifactStore.read(record.artifactRef, { offset: 12, length: 4 }), "");
+  assert.deepEqual(await artifactStore.preview(record.artifactRef, 4), { byteLength: 10, preview: "0123" });
+});
+
+test("concurrent artifact writes all land in the JSONL index", async () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-artifact-"));
+  const artifactStore = new ArtifactStore(join(runtimeDir, "artifacts"));
+  const records = await Promise.all(["alpha", "beta", "gamma"].map((data) => artifactStore.write({
+    taskId: "task:index",
+    kind: "text",
+    mediaType: "text/plain",
+    data
+  })));
+
+  const indexed = readFileSync(join(runtimeDir, "artifacts", "index.jsonl"), "utf8").trim().split("\n")
+    .map((line) => (JSON.parse(line) as { artifactRef: string }).artifactRef);
+  assert.deepEqual(indexed.sort(), records.map((record) => record.artifactRef).sort());
+});
+
 test("lists artifacts by task id", async () => {
   const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-artifact-"));
   const artifactStore = new ArtifactStore(join(runtimeDir, "artifacts"));
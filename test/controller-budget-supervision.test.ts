@@ -2249,6 +2249,72 @@ test("retries executor when provider returns a retryable concurrency error", asy
   controller.close();
 });
 
+test("stops retrying the executor when a stop lands during the provider backoff", async () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-controller-"));
+  const controller = createControllerWithTestLlmEnv(runtimeDir);
+  const controllerHarness = controller as unknown as ControllerHarness;
+  const executorSession = createProviderErrorThenSuccessSession(
+    "Concurrency limit exceeded for user, please retry later",
+    JSON.stringify({
+      taskId: "task:retry-stopped",
+      status: "completed",
+      summary: "Should not run after stop",
+      evidenceRefs: [],
+      artifactRefs: []
+    })
+  );
+  const observerSession = createAbortableMockTextSession(JSON.stringify({
+    sourceEventIds: [],
+    nodes: [],
+    edges: []
+  }));
+  controllerHarness.agents = {
+    planner: createMockTextSession(JSON.stringify({
+      decision: "apply_commands",
+      commands: [{
+        kind: "create_tasks",
+        tasks: [{
+          id: "task:retry-stopped",
+          goal: "Stop while the executor waits to retry",
+          targetRefs: ["goal:root"],
+          scopeRef: "scope:root",
+          constraints: [],
+          successCriteria: ["executor stops retrying"],
+          budget: { maxTurns: 1 },
+          priority: 1
+        }],
+        reason: "Start retry task",
+        basedOnRefs: ["goal:root"]
+      }],
+      reason: "Start retry task",
+      basedOnRefs: ["goal:root"]
+    })),
+    executor: executorSession,
+    observer: observerSession
+  };
+  controllerHarness.createObserverSessionForMode = async () => ({
+    session: observerSession,
+    dynamicObserver: true
+  });
+  const unsubscribe = controller.executionLog.subscribe((event) => {
+    if (event.eventType === "executor_provider_retry_scheduled") {
+      setTimeout(() => void controller.requestStop("operator stop during backoff"), 20);
+    }
+  });
+
+  const result = await controller.runOnce({
+    userGoal: "Stop during provider backoff",
+    scopeSummary: "Authorized target only",
+    maxParallelTasks: 1
+  });
+  unsubscribe();
+
+  assert.equal(executorSession.promptCount(), 1);
+  assert.equal(controller.runtimeStore.countTaskEpochs("task:retry-stopped"), 1);
+  assert.notEqual(result.taskResult?.status, "completed");
+  controller.close();
+});
+
 test("skips task_end projector for pure retryable provider failure without execution evidence", async () => {
   const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-controller-"));
   const controller = createControllerWithTestLlmEnv(runtimeDir);
@@ -1,9 +1,9 @@
 import assert from "node:assert/strict";
-import { mkdtempSync } from "node:fs";
+import { mkdtempSync, readFileSync } from "node:fs";
 import { tmpdir } from "node:os";
 import { join } from "node:path";
 import test from "node:test";
-import { ExecutionLog } from "../src/stores/execution-log.js";
+import { eventVocabularyCacheSize, ExecutionLog } from "../src/stores/execution-log.js";
 
 test("notifies live subscribers after durable append and supports unsubscribe", async () => {
   const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-execution-subscribe-"));
@@ -30,6 +30,48 @@ test("notifies live subscribers after durable append and supports unsubscribe",
   executionLog.close();
 });
 
+test("coalesces concurrent appends into the JSONL mirror in seq order", async () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-execution-mirror-"));
+  const filePath = join(runtimeDir, "execution.jsonl");
+  const executionLog = new ExecutionLog(filePath);
+
+  const events = await Promise.all(Array.from({ length: 12 }, (_, index) => executionLog.append({
+    role: "runtime",
+    eventType: `event_${index}`,
+    payload: { index }
+  })));
+  await executionLog.drain();
+
+  const mirrored = readFileSync(filePath, "utf8").trim().split("\n").map((line) => JSON.parse(line) as { id: string; seq: number });
+  assert.deepEqual(mirrored.map((event) => event.id), events.map((event) => event.id));
+  assert.deepEqual(mirrored.map((event) => event.seq), [...mirrored.map((event) => event.seq)].sort((left, right) => left - right));
+  executionLog.close();
+});
+
+test("mirror lines serialize the stored event exactly", async () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-execution-mirror-"));
+  const filePath = join(runtimeDir, "execution.jsonl");
+  const executionLog = new ExecutionLog(filePath);
+
+  const bare = await executionLog.append({ role: "runtime", eventType: "run_started", payload: {} });
+  const full = await executionLog.append({
+    epochId: "epoch:1",
+    taskId: "task:web",
+    role: "executor",
+    eventType: "tool_finished",
+    summary: "curl finished",
+    payload: { toolName: "bash", output: "line 1\n\"quoted\"", nested: { exitCode: 0 } },
+    artifactRefs: ["artifact:1"]
+  });
+  await executionLog.drain();
+
+  assert.deepEqual(readFileSync(filePath, "utf8").split("\n").filter(Boolean), [
+    JSON.stringify(bare),
+    JSON.stringify(full)
+  ]);
+  executionLog.close();
+});
+
 test("aggregates Pi usage, invocation, projector, supervisor and tool metrics", async () => {
   const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-execution-log-"));
   const executionLog = new ExecutionLog(join(runtimeDir, "execution.jsonl"));
@@ -237,3 +279,82 @@ test("aggregates Pi usage, invocation, projector, supervisor and tool metrics",
   assert.equal(metrics.supervisor.decisions.checkpoint, 1);
   executionLog.close();
 });
+
+test("range returns the filtered task window in seq order", async () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-execution-range-"));
+  const executionLog = new ExecutionLog(join(runtimeDir, "execution.jsonl"));
+  const appended = [];
+  for (const [taskId, role, eventType] of [
+    ["task:a", "executor", "tool_started"],
+    ["task:b", "executor", "tool_started"],
+    ["task:a", "runtime", "task_completed"],
+    ["task:a", "planner", "planner_decision"],
+    ["task:a", "executor", "tool_finished"]
+  ] as const) {
+    appended.push(await executionLog.append({ taskId, role, eventType, payload: {} }));
+  }
+
+  const events = await executionLog.range({
+    taskId: "task:a",
+    afterSeq: appended[0].seq ?? 0,
+    toSeq: appended[4].seq ?? 0,
+    roles: ["executor", "runtime"]
+  });
+
+  assert.deepEqual(events.map((event) => event.eventType), ["task_completed", "tool_finished"]);
+  assert.deepEqual(events[0], appended[2]);
+  executionLog.close();
+});
+
+test("appends from one tick are readable before their batch commits", async () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-execution-batch-"));
+  const executionLog = new ExecutionLog(join(runtimeDir, "execution.jsonl"));
+  const pending = [
+    executionLog.append({ taskId: "task:a", role: "runtime", eventType: "first", payload: {} }),
+    executionLog.append({ taskId: "task:a", role: "runtime", eventType: "second", payload: {} })
+  ];
+
+  assert.equal(executionLog.latestSeq("task:a"), 2);
+  const events = await Promise.all(pending);
+  assert.deepEqual(events.map((event) => event.seq), [1, 2]);
+  assert.equal(executionLog.seqForEvent(events[1].id), 2);
+  executionLog.close();
+});
+
+test("appends queued after close reject instead of escaping the batch flush", async () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-execution-closed-"));
+  const executionLog = new ExecutionLog(join(runtimeDir, "execution.jsonl"));
+  executionLog.close();
+
+  const results = await Promise.allSettled([
+    executionLog.append({ role: "runtime", eventType: "first", payload: {} }),
+    executionLog.append({ role: "runtime", eventType: "second", payload: {} })
+  ]);
+
+  assert.deepEqual(results.map((result) => result.status), ["rejected", "rejected"]);
+});
+
+test("decoded event interning keeps only a bounded role and event type vocabulary", async () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-execution-vocabulary-"));
+  const executionLog = new ExecutionLog(join(runtimeDir, "execution.jsonl"));
+  for (let index = 0; index < 200; index += 1) {
+    await executionLog.append({
+      taskId: `task:vocabulary-${index}`,
+      role: "runtime",
+      eventType: "vocabulary_probe",
+      summary: `unique summary ${index} ${"x".repeat(256)}`,
+      payload: {}
+    });
+  }
+  const sizeBefore = eventVocabularyCacheSize();
+  assert.equal((await executionLog.readAll()).length, 200);
+  assert.ok(eventVocabularyCacheSize() <= sizeBefore + 2);
+
+  for (let index = 0; index < 600; index += 1) {
+    await executionLog.append({ role: "runtime", eventType: `vocabulary_type_${index}`, payload: {} });
+  }
+  const events = await executionLog.readAll();
+  assert.equal(events.at(-1)?.eventType, "vocabulary_type_599");
+  assert.ok(eventVocabularyCacheSize() <= 512);
+  executionLog.close();
+});
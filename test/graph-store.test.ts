@@ -1,7 +1,8 @@
 import assert from "node:assert/strict";
-import { mkdtempSync } from "node:fs";
+import { existsSync, mkdtempSync, readFileSync } from "node:fs";
 import { tmpdir } from "node:os";
 import { join } from "node:path";
+import { DatabaseSync } from "node:sqlite";
 import test from "node:test";
 import { GraphValidationError, PlannerDecisionConflict, SQLiteGraphStore } from "../src/stores/graph-store.js";
 import { RuntimeStore } from "../src/stores/runtime-store.js";
@@ -53,6 +54,120 @@ test("upserts tri-graph nodes and reads planner view", () => {
   graphStore.close();
 });
 
+test("delta log appends from one tick are flushed together in commit order", async () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-graph-"));
+  const deltaLogPath = join(runtimeDir, "deltas.jsonl");
+  const graphStore = new SQLiteGraphStore(join(runtimeDir, "state.sqlite"), deltaLogPath);
+  for (const index of [1, 2, 3]) {
+    graphStore.upsertDelta({
+      sourceEventIds: [`event:delta-log-${index}`],
+      nodes: [{ id: `task:delta-log-${index}`, graphKind: "task", type: "Task", label: `Task ${index}`, properties: { status: "open" } }],
+      edges: []
+    });
+  }
+  assert.equal(existsSync(deltaLogPath), false);
+  await new Promise((resolve) => setImmediate(resolve));
+  const sourceEventIds = () => readFileSync(deltaLogPath, "utf8").trim().split("\n")
+    .map((line) => (JSON.parse(line) as { delta: { sourceEventIds: string[] } }).delta.sourceEventIds[0]);
+  assert.deepEqual(sourceEventIds(), ["event:delta-log-1", "event:delta-log-2", "event:delta-log-3"]);
+  graphStore.upsertDelta({
+    sourceEventIds: ["event:delta-log-4"],
+    nodes: [{ id: "task:delta-log-4", graphKind: "task", type: "Task", label: "Task 4", properties: { status: "open" } }],
+    edges: []
+  });
+  graphStore.close();
+  assert.equal(sourceEventIds().at(-1), "event:delta-log-4");
+});
+
+test("task dependency lookups are answered from the covering edge index", () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-graph-"));
+  const graphStore = new SQLiteGraphStore(join(runtimeDir, "state.sqlite"), join(runtimeDir, "deltas.jsonl"));
+  graphStore.upsertDelta({
+    sourceEventIds: ["event:covering"],
+    nodes: [
+      { id: "task:a", graphKind: "task", type: "Task", label: "A", properties: { status: "open" } },
+      { id: "task:b", graphKind: "task", type: "Task", label: "B", properties: { status: "open" } }
+    ],
+    edges: [{ from: "task:b", to: "task:a", type: "depends_on" }]
+  });
+  const database = (graphStore as unknown as { database: DatabaseSync }).database;
+  const prepare = database.prepare.bind(database);
+  const dependencySql: string[] = [];
+  database.prepare = (sql: string) => {
+    if (sql.includes("type = 'depends_on' AND from_id IN")) {
+      dependencySql.push(sql);
+    }
+    return prepare(sql);
+  };
+  graphStore.listReadyTasks(10);
+  database.prepare = prepare;
+
+  assert.equal(dependencySql.length, 1);
+  const parameterCount = dependencySql[0].split("?").length - 1;
+  const plan = database.prepare(`EXPLAIN QUERY PLAN ${dependencySql[0]}`)
+    .all(...Array.from({ length: parameterCount }, (_, index) => `task:${index}`)) as Array<{ detail: string }>;
+  assert.ok(plan.some(({ detail }) => /COVERING INDEX idx_edges_type_from/.test(detail)), JSON.stringify(plan));
+  assert.ok(!plan.some(({ detail }) => /TEMP B-TREE/.test(detail)), JSON.stringify(plan));
+  graphStore.close();
+});
+
+test("graph kind reads walk the kind and recency index without sorting", () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-graph-"));
+  const databasePath = join(runtimeDir, "state.sqlite");
+  new SQLiteGraphStore(databasePath, join(runtimeDir, "deltas.jsonl")).close();
+  const check = new DatabaseSync(databasePath);
+  const plan = check.prepare(`
+    EXPLAIN QUERY PLAN
+    SELECT * FROM nodes WHERE graph_kind = ? ORDER BY updated_at DESC LIMIT ?
+  `).all("operation", 10) as Array<{ detail: string }>;
+  assert.ok(plan.some(({ detail }) => /INDEX idx_nodes_kind_updated/.test(detail)), JSON.stringify(plan));
+  assert.ok(!plan.some(({ detail }) => /TEMP B-TREE/.test(detail)), JSON.stringify(plan));
+  check.close();
+});
+
+test("hasNode checks node identity without reading its neighborhood", () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-graph-"));
+  const graphStore = new SQLiteGraphStore(join(runtimeDir, "state.sqlite"), join(runtimeDir, "deltas.jsonl"));
+  graphStore.upsertDelta({
+    sourceEventIds: ["event:has-node"],
+    nodes: [
+      {
+        id: "endpoint:/login",
+        graphKind: "operation",
+        type: "WebEndpoint",
+        label: "POST /login",
+        properties: { method: "POST", path: "/login" }
+      }
+    ],
+    edges: []
+  });
+  assert.equal(graphStore.hasNode("endpoint:/login"), true);
+  assert.equal(graphStore.hasNode("endpoint:/logout"), false);
+  graphStore.close();
+});
+
+test("findOrphanNodeIds returns unconnected operation and reasoning nodes in candidate order", () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-graph-"));
+  const graphStore = new SQLiteGraphStore(join(runtimeDir, "state.sqlite"), join(runtimeDir, "deltas.jsonl"));
+  graphStore.upsertDelta({
+    sourceEventIds: ["event:orphans"],
+    nodes: [
+      { id: "goal:root", graphKind: "task", type: "Goal", label: "Goal", properties: {} },
+      { id: "host:target", graphKind: "operation", type: "Host", label: "Target", properties: {} },
+      { id: "host:lonely", graphKind: "operation", type: "Host", label: "Lonely", properties: {} },
+      { id: "hypothesis:idle", graphKind: "reasoning", type: "Hypothesis", label: "Idle", properties: {} }
+    ],
+    edges: [{ from: "goal:root", to: "host:target", type: "observed_on", evidenceRefs: ["event:orphans"] }]
+  });
+
+  assert.deepEqual(
+    graphStore.findOrphanNodeIds(["hypothesis:idle", "host:target", "goal:root", "host:lonely", "host:missing", "hypothesis:idle"]),
+    ["hypothesis:idle", "host:lonely"]
+  );
+  assert.deepEqual(graphStore.findOrphanNodeIds([]), []);
+  graphStore.close();
+});
+
 test("focused graph queries filter neighborhood nodes by graph kind", () => {
   const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-graph-"));
   const graphStore = new SQLiteGraphStore(join(runtimeDir, "state.sqlite"), join(runtimeDir, "deltas.jsonl"));
@@ -201,6 +316,60 @@ test("graph upserts merge evidence references instead of replacing them", () =>
   graphStore.close();
 });
 
+test("repeated node and edge entries in one delta merge in order", () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-graph-"));
+  const graphStore = new SQLiteGraphStore(join(runtimeDir, "state.sqlite"), join(runtimeDir, "deltas.jsonl"));
+  const host = { id: "host:10.0.0.5", graphKind: "operation" as const, type: "Host", label: "10.0.0.5" };
+  graphStore.upsertDelta({
+    sourceEventIds: ["event:1"],
+    nodes: [{ ...host, properties: { os: "linux" }, evidenceRefs: ["event:1"] }],
+    edges: []
+  });
+  graphStore.upsertDelta({
+    sourceEventIds: ["event:2", "event:3"],
+    nodes: [
+      { ...host, properties: { ports: [22] }, evidenceRefs: ["event:2"] },
+      { id: "service:ssh", graphKind: "operation", type: "Service", label: "ssh", properties: {} },
+      { ...host, properties: { ports: [22, 80] }, evidenceRefs: ["event:3"] }
+    ],
+    edges: [
+      { from: "service:ssh", to: host.id, type: "runs_on", properties: { first: true }, evidenceRefs: ["event:2"] },
+      { from: "service:ssh", to: host.id, type: "runs_on", properties: { second: true }, evidenceRefs: ["event:3"] }
+    ]
+  });
+
+  const snapshot = graphStore.query("operation", [host.id], 10);
+  const node = snapshot.nodes.find((candidate) => candidate.id === host.id);
+  assert.deepEqual(node?.properties, { os: "linux", ports: [22, 80] });
+  assert.deepEqual(node?.evidenceRefs, ["event:1", "event:2", "event:3"]);
+  assert.deepEqual(snapshot.edges.map((edge) => [edge.properties, edge.evidenceRefs]), [
+    [{ first: true, second: true }, ["event:2", "event:3"]]
+  ]);
+  graphStore.close();
+});
+
+test("large deltas are written across multi-row insert chunks", () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-graph-"));
+  const graphStore = new SQLiteGraphStore(join(runtimeDir, "state.sqlite"), join(runtimeDir, "deltas.jsonl"));
+  const ports = Array.from({ length: 300 }, (_, index) => ({
+    id: `port:10.0.0.5:${index + 1}`,
+    graphKind: "operation" as const,
+    type: "Port",
+    label: `${index + 1}/tcp`,
+    properties: { port: index + 1 }
+  }));
+  graphStore.upsertDelta({
+    sourceEventIds: ["event:scan"],
+    nodes: [{ id: "host:10.0.0.5", graphKind: "operation", type: "Host", label: "10.0.0.5", properties: {} }, ...ports],
+    edges: ports.map((port) => ({ from: port.id, to: "host:10.0.0.5", type: "exposes" }))
+  });
+
+  assert.equal(graphStore.stats().nodeCount, 301);
+  assert.equal(graphStore.stats().edgeCount, 300);
+  assert.deepEqual(graphStore.query("operation", ["port:10.0.0.5:300"], 1).nodes[0]?.properties, { port: 300 });
+  graphStore.close();
+});
+
 test("rejects graph node type changes for an existing identity", () => {
   const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-graph-"));
   const graphStore = new SQLiteGraphStore(join(runtimeDir, "state.sqlite"), join(runtimeDir, "deltas.jsonl"));
@@ -759,6 +928,16 @@ test("runtime task result preserves planner version for later expectedVersion pa
     }
   });
   assert.equal(patched.properties.version, 2);
+  assert.deepEqual(graphStore.plannerVersionSnapshot(), { "task:extract-flag": 2, "task:recon": 1 });
+  assert.throws(() => graphStore.createTask({
+    taskId: "task:recon",
+    goal: "Recon target again",
+    targetRefs: ["goal:root"],
+    scopeRef: "scope:root",
+    constraints: [],
+    successCriteria: ["recon done"],
+    priority: 1
+  }), GraphValidationError);
 
   const taskEnvelope = graphStore.getTaskEnvelope("task:extract-flag");
   assert.ok(taskEnvelope);
@@ -1061,6 +1240,60 @@ test("planner decision view exposes the stored Root Goal and Scope references",
   graphStore.close();
 });
 
+test("planner decision view is reused until any connection writes a graph delta", () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-graph-"));
+  const databasePath = join(runtimeDir, "state.sqlite");
+  const graphStore = new SQLiteGraphStore(databasePath, join(runtimeDir, "deltas.jsonl"));
+  const writer = new SQLiteGraphStore(databasePath, join(runtimeDir, "deltas.jsonl"));
+  graphStore.upsertDelta({
+    sourceEventIds: [],
+    nodes: [{ id: "task:first", graphKind: "task", type: "Task", label: "First", properties: { status: "open" } }],
+    edges: []
+  });
+
+  const first = graphStore.plannerDecisionView();
+  assert.equal(graphStore.plannerDecisionView(), first);
+  writer.upsertDelta({
+    sourceEventIds: [],
+    nodes: [{ id: "task:second", graphKind: "task", type: "Task", label: "Second", properties: { status: "open" } }],
+    edges: []
+  });
+
+  const second = graphStore.plannerDecisionView();
+  assert.notEqual(second, first);
+  assert.deepEqual(second.taskLedger.map((item) => item.taskId).sort(), ["task:first", "task:second"]);
+  writer.close();
+  graphStore.close();
+});
+
+test("projection closures are reused per request until the graph changes", () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-graph-"));
+  const graphStore = new SQLiteGraphStore(join(runtimeDir, "state.sqlite"), join(runtimeDir, "deltas.jsonl"));
+  graphStore.upsertDelta({
+    sourceEventIds: [],
+    nodes: [
+      { id: "task:web", graphKind: "task", type: "Task", label: "Web", properties: { status: "open" } },
+      { id: "host:web", graphKind: "operation", type: "Host", label: "10.0.0.5", properties: {} }
+    ],
+    edges: [{ from: "task:web", to: "host:web", type: "targets" }]
+  });
+  const request = { taskId: "task:web", scopeRef: "scope:root", targetRefs: ["host:web"] };
+
+  const first = graphStore.projectionClosure(request);
+  assert.equal(graphStore.projectionClosure({ ...request }), first);
+  assert.notEqual(graphStore.projectionClosure({ ...request, nodeLimit: 12 }), first);
+  graphStore.upsertDelta({
+    sourceEventIds: [],
+    nodes: [{ id: "service:web", graphKind: "operation", type: "Service", label: "http", properties: {} }],
+    edges: [{ from: "host:web", to: "service:web", type: "runs" }]
+  });
+
+  const second = graphStore.projectionClosure(request);
+  assert.notEqual(second, first);
+  assert.ok(second.nodes.some((node) => node.id === "service:web"));
+  graphStore.close();
+});
+
 test("stores parallel operational edges by explicit identity and validates topology endpoints", () => {
   const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-graph-"));
   const graphStore = new SQLiteGraphStore(join(runtimeDir, "state.sqlite"), join(runtimeDir, "deltas.jsonl"));
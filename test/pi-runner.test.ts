@@ -573,6 +573,38 @@ test("keeps small tool output inline in execution log", async () => {
   assert.deepEqual(await artifactStore.list({ taskId: "task:small" }), []);
 });
 
+test("normalizes non-JSON event values the same way JSON serialization does", async () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-runner-"));
+  const session = createMockSession();
+  const executionLog = new ExecutionLog(join(runtimeDir, "execution.jsonl"));
+  attachExecutionLogging({
+    session,
+    executionLog,
+    role: "executor",
+    getTaskId: () => "task:json-safe"
+  });
+  const shared = { text: "shared" };
+
+  session.emit({
+    type: "tool_execution_end",
+    toolName: "bash",
+    result: {
+      finishedAt: new Date("2026-01-02T03:04:05.000Z"),
+      skipped: undefined,
+      exitCode: Number.NaN,
+      content: [shared, shared, undefined]
+    }
+  });
+
+  await waitFor(async () => (await executionLog.readAll()).length === 1);
+  const [event] = await executionLog.readAll();
+  assert.deepEqual(event.payload.result, {
+    finishedAt: "2026-01-02T03:04:05.000Z",
+    exitCode: null,
+    content: [{ text: "shared" }, { text: "shared" }, null]
+  });
+});
+
 test("spills large tool output to artifact and leaves pointer in execution log", async () => {
   const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-runner-"));
   const session = createMockSession();
@@ -7,7 +7,8 @@ import {
   PLANNER_SYSTEM_PROMPT,
   renderExecutorInput,
   renderExecutorResumeInput,
-  renderPlannerInput
+  renderPlannerInput,
+  stableJson
 } from "../src/prompts.js";
 import type { GraphSnapshot, PlannerDecisionView, TaskEnvelope } from "../src/types.js";
 
@@ -186,3 +187,17 @@ test("projector prompt requests semantic changes instead of one node per observa
   assert.match(OBSERVER_SUPERVISOR_SYSTEM_PROMPT, /页面静态说明、全局关键词、请求脚本自己打印的标签不能证明/);
   assert.match(OBSERVER_SUPERVISOR_SYSTEM_PROMPT, /只评价当前因果边界最近窗口的进展/);
 });
+
+test("stable JSON sorts keys at every depth without dropping values", () => {
+  const value = {
+    zeta: [{ beta: 2, alpha: { delta: true, charlie: null } }],
+    alpha: "first",
+    skipped: undefined,
+    when: new Date("2026-01-02T03:04:05.000Z")
+  };
+  assert.equal(stableJson(value), JSON.stringify({
+    alpha: "first",
+    when: "2026-01-02T03:04:05.000Z",
+    zeta: [{ alpha: { charlie: null, delta: true }, beta: 2 }]
+  }, null, 2));
+});
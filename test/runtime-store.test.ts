@@ -35,6 +35,21 @@ test("projection desired sequence does not advance committed sequence", () => {
   assert.equal(store.getProjectionState("task:test").committedSeq, 0);
 });
 
+test("lists every projection whose desired sequence is ahead of its commit", () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-runtime-"));
+  const store = new RuntimeStore(join(runtimeDir, "state.sqlite"));
+  store.raiseProjectionDesired("task:behind", 4);
+  store.raiseProjectionDesired("task:claimed", 6);
+  assert.ok(store.claimProjection("task:claimed"));
+  store.getProjectionState("task:idle");
+
+  assert.deepEqual(
+    store.listUncommittedProjectionStates().map((state) => state.taskId).sort(),
+    ["task:behind", "task:claimed"]
+  );
+  store.close();
+});
+
 test("releases interrupted projection claims without advancing committed sequence", () => {
   const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-runtime-"));
   const databasePath = join(runtimeDir, "state.sqlite");
@@ -53,3 +68,29 @@ test("releases interrupted projection claims without advancing committed sequenc
   assert.deepEqual(recoveredStore.listPendingProjectionTasks().map((item) => item.taskId), ["task:test"]);
   recoveredStore.close();
 });
+
+test("epoch transitions and projection raises return the stored row", () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-runtime-"));
+  const store = new RuntimeStore(join(runtimeDir, "state.sqlite"));
+  store.createEpoch({ epochId: "epoch:1", taskId: "task:test", attempt: 1, startSeq: 2 });
+  const closed = store.transitionEpoch({ epochId: "epoch:1", state: "closed", terminationReason: "executor_submitted", endSeq: 7 });
+
+  assert.deepEqual(closed, store.getEpoch("epoch:1"));
+  assert.ok(closed.closedAt);
+  assert.throws(() => store.transitionEpoch({ epochId: "epoch:missing", state: "running" }), /not found/);
+  store.raiseProjectionDesired("task:test", 9, 2);
+  assert.deepEqual(store.raiseProjectionDesired("task:test", 3), store.getProjectionState("task:test"));
+  assert.equal(store.getProjectionState("task:test").desiredSeq, 9);
+  store.close();
+});
+
+test("projection raises that change nothing leave the stored state untouched", () => {
+  const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-runtime-"));
+  const store = new RuntimeStore(join(runtimeDir, "state.sqlite"));
+  const raised = store.raiseProjectionDesired("task:test", 9, 10);
+
+  assert.deepEqual(store.raiseProjectionDesired("task:test", 9, 10), raised);
+  assert.deepEqual(store.raiseProjectionDesired("task:test", 4, 0), raised);
+  assert.equal(store.raiseProjectionDesired("task:test", 12).desiredSeq, 12);
+  store.close();
+});
@@ -0,0 +1,19 @@
+import assert from "node:assert/strict";
+import test from "node:test";
+import { timeOrderedUuid } from "../src/stores/time-ordered-id.js";
+
+test("time ordered ids are version 7 uuids that sort by creation time", () => {
+  const earlier = timeOrderedUuid(Date.UTC(2026, 0, 1));
+  const later = timeOrderedUuid(Date.UTC(2026, 0, 1) + 1);
+
+  assert.match(earlier, /^[0-9a-f]{8}-[0-9a-f]{4}-7[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$/);
+  assert.equal(earlier.slice(0, 13), "019b76da-a800");
+  assert.ok(earlier < later);
+});
+
+test("time ordered ids stay unique across pooled entropy refills", () => {
+  const now = Date.now();
+  const ids = Array.from({ length: 1000 }, () => timeOrderedUuid(now));
+
+  assert.equal(new Set(ids).size, ids.length);
+});
@@ -74,6 +74,27 @@ test("registry shutdown does not stop a sidecar owned by another manager", async
   }
 });
 
+test("registry reuses an attached manager until its sidecar stops answering", async () => {
+  const root = await mkdtemp("/tmp/traffic-proxy-attached-");
+  const runtime = join(root, "runtime");
+  const owner = new TrafficProxyManager(runtime, { binary });
+  const registry = new TrafficProxyManagerRegistry({ binary });
+  try {
+    await owner.start();
+    const first = await registry.getExisting(runtime);
+    assert.ok(first);
+    assert.equal(first.ownsProcess(), false);
+    assert.equal(await registry.getExisting(runtime), first);
+    assert.equal(registry.size, 0);
+    await owner.close();
+    assert.equal(await registry.getExisting(runtime), undefined);
+  } finally {
+    await owner.close();
+    await registry.closeAll();
+    await rm(root, { recursive: true, force: true });
+  }
+});
+
 test("registry evicts an owned manager when its sidecar exits", async () => {
   const root = await mkdtemp("/tmp/traffic-proxy-exit-");
   const runtime = join(root, "runtime");
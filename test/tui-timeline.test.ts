@@ -7,6 +7,7 @@ import type { Terminal } from "@earendil-works/pi-tui";
 import { ArtifactStore } from "../src/stores/artifact-store.js";
 import { ExecutionLog } from "../src/stores/execution-log.js";
 import { AgentCliApp } from "../src/tui/app.js";
+import { AgentTimeline, extractToolOutput } from "../src/tui/timeline.js";
 
 test("renders durable intent, correlated tool output and handles interrupt input", async () => {
   const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-tui-"));
@@ -95,6 +96,30 @@ test("renders durable intent, correlated tool output and handles interrupt input
   executionLog.close();
 });
 
+test("reuses the rendered frame until timeline state changes", () => {
+  const timeline = new AgentTimeline();
+  timeline.setGoal("inspect the target");
+  const first = timeline.render(80);
+  assert.equal(timeline.render(80), first);
+  const widened = timeline.render(100);
+  assert.notEqual(widened, first);
+  assert.equal(timeline.render(100), widened);
+
+  timeline.ingest({
+    id: "event:status",
+    seq: 1,
+    taskId: "task:recon",
+    role: "runtime",
+    eventType: "task_started",
+    timestamp: new Date(0).toISOString(),
+    summary: "started",
+    payload: {}
+  });
+  assert.notEqual(timeline.render(100), widened);
+  timeline.setStatus("completed", "done");
+  assert.ok(timeline.render(100).join("\n").includes("done"));
+});
+
 test("loads artifact-backed tool details only when the action is expanded", async () => {
   const runtimeDir = mkdtempSync(join(tmpdir(), "luanniao-tui-artifact-"));
   const executionLog = new ExecutionLog(join(runtimeDir, "execution.jsonl"));
@@ -307,6 +332,13 @@ test("recognizes enhanced Ctrl+C and force exits on a repeated interrupt", async
   executionLog.close();
 });
 
+test("tool output keeps tabs, newlines and wide characters while dropping control bytes", () => {
+  const output = extractToolOutput({
+    content: [{ type: "text", text: "\u001b]0;title\u0007a\tb\r\nc\u0000\u0008\u000b\u001f\u007fd 目标 🔍\u001b[31m" }]
+  });
+  assert.equal(output, "a\tb\ncd 目标 🔍");
+});
+
 class FakeTerminal implements Terminal {
   columns = 100;
   rows = 40;
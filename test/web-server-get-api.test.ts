@@ -100,6 +100,46 @@ test("web server binds to WEB_HOST/WEB_PORT from the environment when args are a
   }
 });
 
+test("web server takes an OS-assigned port when WEB_PORT is 0 and reports it", async () => {
+  const root = await mkdtemp("/tmp/lnw-port0-");
+  const auth = new WebAuthService(join(root, "auth.sqlite"));
+  await auth.register({ username: "admin", displayName: "Admin", password: "admin-password-123" });
+  const child = spawn(process.execPath, [
+    resolve("dist/src/web-server.js"),
+    "--runtime-dir", root,
+    "--auth-db", join(root, "auth.sqlite")
+  ], {
+    cwd: process.cwd(),
+    stdio: ["ignore", "pipe", "pipe"],
+    env: { ...process.env, WEB_HOST: "127.0.0.1", WEB_PORT: "0" }
+  });
+  try {
+    const port = await new Promise<number>((resolvePort, rejectPort) => {
+      let stdout = "";
+      const timer = setTimeout(() => rejectPort(new Error(`web server did not report a port: ${stdout}`)), 10_000);
+      child.stdout?.on("data", (chunk: Buffer) => {
+        stdout += chunk.toString("utf8");
+        const match = stdout.match(/listening on http:\/\/127\.0\.0\.1:(\d+)/);
+        if (match) {
+          clearTimeout(timer);
+          resolvePort(Number(match[1]));
+        }
+      });
+    });
+    assert.ok(port > 0);
+    await waitForServer(child, `http://127.0.0.1:${port}`);
+  } finally {
+    if (child.exitCode === null && child.signalCode === null) {
+      child.kill("SIGTERM");
+      await new Promise<void>((resolveExit) => {
+        child.once("exit", () => resolveExit());
+        setTimeout(resolveExit, 3_000).unref();
+      });
+    }
+    await rm(root, { recursive: true, force: true });
+  }
+});
+
 test("analyst reaches metadata and sensitive-read GET routes but lacks export and credential capabilities", async () => {
   const auth = new WebAuthService(join(fixture.root, "auth.sqlite"));
   const analyst = (await auth.login({ username: "analyst", password: "analyst-password-456" })).user;
@@ -150,6 +190,28 @@ test("runtime query parameters enforce canonical containment including traversal
   assert.doesNotMatch(text, new RegExp(escapeRegExp(fixture.runtimeB)));
 });
 
+test("runtime state returns the newest events from a log spanning many read chunks", async () => {
+  const runtimeDir = join(fixture.root, "runtime-tail");
+  await mkdir(runtimeDir, { recursive: true });
+  const events = Array.from({ length: 1000 }, (_, index) => JSON.stringify({
+    id: `event:${index}`,
+    role: "executor",
+    eventType: "assistant_intent",
+    timestamp: "2026-07-11T00:00:00.000Z",
+    summary: `步骤 ${index} ${"探测".repeat(60)}`,
+    payload: {}
+  }));
+  await writeFile(join(runtimeDir, "execution.jsonl"), `${events.join("\n")}\n`);
+
+  const response = await analystGet(`/api/state?runtimeDir=${encodeURIComponent(runtimeDir)}`);
+  assert.equal(response.status, 200);
+  const state = await json(response);
+  assert.equal(state.events.length, 700);
+  assert.equal(state.events[0].id, "event:300");
+  assert.equal(state.events.at(-1).id, "event:999");
+  assert.equal(state.events[0].summary, `步骤 300 ${"探测".repeat(60)}`);
+});
+
 test("history pagination and detail/body routes emit exact control protocol fields", async () => {
   const before = fixture.requests.length;
   const listResponse = await analystGet(
@@ -1,6 +1,6 @@
 import { fireEvent, render, screen, waitFor } from "@testing-library/react";
 import { beforeEach, describe, expect, it } from "vitest";
-import { LanguageProvider, useLanguage } from "./language";
+import { formatBytes, formatDuration, formatNumber, LanguageProvider, useLanguage } from "./language";
 
 beforeEach(() => {
   localStorage.clear();
@@ -51,6 +51,17 @@ describe("LanguageProvider", () => {
   });
 });
 
+describe("formatters", () => {
+  it("keeps locale and options apart when formatters are reused", () => {
+    expect(formatNumber(1234.5, "en-US")).toBe("1,234.5");
+    expect(formatBytes(1536, "en-US")).toBe("1.5 KB");
+    expect(formatDuration(1500, "en-US")).toBe("1.50 s");
+    expect(formatNumber(1234.5, "en-US", { maximumFractionDigits: 0 })).toBe("1,235");
+    expect(formatNumber(1234.5, "en-US")).toBe("1,234.5");
+    expect(formatDuration(1500, "zh-CN")).toBe("1.50 s");
+  });
+});
+
 function Probe() {
   const { locale, t, toggleLocale } = useLanguage();
   return <button type="button" onClick={toggleLocale}>{locale}:{t("common.load")}</button>;
@@ -610,10 +610,34 @@ export function translate(key: TranslationKey, variables?: Variables, locale: Lo
   return variables ? template.replace(/\{(\w+)\}/g, (match, name: string) => variables[name] === undefined ? match : String(variables[name])) : template;
 }
 
+// Intl formatters are costly to construct and tables format many cells per render,
+// so each locale and option set builds its formatter once.
+const dateTimeFormats = new Map<Locale, Intl.DateTimeFormat>();
+const numberFormats = new Map<string, Intl.NumberFormat>();
+
+function dateTimeFormat(locale: Locale): Intl.DateTimeFormat {
+  let format = dateTimeFormats.get(locale);
+  if (!format) {
+    format = new Intl.DateTimeFormat(locale, { dateStyle: "medium", timeStyle: "medium", hour12: false });
+    dateTimeFormats.set(locale, format);
+  }
+  return format;
+}
+
+function numberFormat(locale: Locale, options?: Intl.NumberFormatOptions): Intl.NumberFormat {
+  const key = options ? `${locale}:${JSON.stringify(options)}` : locale;
+  let format = numberFormats.get(key);
+  if (!format) {
+    format = new Intl.NumberFormat(locale, options);
+    numberFormats.set(key, format);
+  }
+  return format;
+}
+
 export function formatDateTime(value?: string | number | Date, locale: Locale = currentLocale): string {
   if (value === undefined) return "-";
   const date = value instanceof Date ? value : new Date(value);
-  return Number.isFinite(date.getTime()) ? new Intl.DateTimeFormat(locale, { dateStyle: "medium", timeStyle: "medium", hour12: false }).format(date) : "-";
+  return Number.isFinite(date.getTime()) ? dateTimeFormat(locale).format(date) : "-";
 }
 
 export function formatRelativeTime(value?: string | number | Date, locale: Locale = currentLocale, now = Date.now()): string {
@@ -628,7 +652,7 @@ export function formatRelativeTime(value?: string | number | Date, locale: Local
 }
 
 export function formatNumber(value: number, locale: Locale = currentLocale, options?: Intl.NumberFormatOptions): string {
-  return new Intl.NumberFormat(locale, options).format(value);
+  return numberFormat(locale, options).format(value);
 }
 
 export function formatBytes(value: number, locale: Locale = currentLocale): string {
@@ -179,6 +179,7 @@ export interface RuntimeState {
     edges: GraphEdge[];
     source: string;
     summary: JsonRecord;
+    version?: string;
     sqliteError?: string;
   };
   events: JsonRecord[];
@@ -51,6 +51,31 @@ describe("useRuntimeDashboard", () => {
     expect(aborted).toHaveBeenCalled();
   });
 
+  it("keeps the previous graph object while the graph version is unchanged", async () => {
+    let graphVersion = "1:7:2026-07-11T00:00:00.000Z";
+    vi.stubGlobal("fetch", vi.fn((input: RequestInfo | URL) => {
+      const url = String(input);
+      const state = stateFixture("session-a");
+      const payload = url.startsWith("/api/state")
+        ? { ...state, graph: { ...state.graph, version: graphVersion } }
+        : sessionsFixture("session-a");
+      return Promise.resolve(new Response(JSON.stringify(payload), { status: 200 }));
+    }));
+
+    const { result } = renderHook(() => useRuntimeDashboard("session-a"));
+    await waitFor(() => expect(result.current.data?.graph.version).toBe(graphVersion));
+    const firstGraph = result.current.data?.graph;
+    const firstData = result.current.data;
+    await act(async () => { await result.current.refresh(); });
+    expect(result.current.data).not.toBe(firstData);
+    expect(result.current.data?.graph).toBe(firstGraph);
+
+    graphVersion = "1:8:2026-07-11T00:00:01.000Z";
+    await act(async () => { await result.current.refresh(); });
+    expect(result.current.data?.graph).not.toBe(firstGraph);
+    expect(result.current.data?.graph.version).toBe(graphVersion);
+  });
+
   it("polls every five seconds while auto refresh is enabled", async () => {
     vi.useFakeTimers();
     const fetchMock = vi.fn((input: RequestInfo | URL) => {
@@ -53,7 +53,13 @@ export function useRuntimeDashboard(runtimeDir: string): RuntimeDashboardState {
     try {
       const stateResult = await fetchRuntimeState(runtimeDir, controller.signal);
       if (requestId !== requestSequence.current) return;
-      setData(stateResult);
+      // An unchanged graph version keeps the previous graph object, so the graph
+      // view skips re-filtering, re-signing and re-laying out identical data.
+      setData((current) => current?.graph.version !== undefined
+        && current.runtimeDir === stateResult.runtimeDir
+        && current.graph.version === stateResult.graph.version
+        ? { ...stateResult, graph: current.graph }
+        : stateResult);
       setLoadedRuntimeDir(runtimeDir);
       setError(undefined);
       void fetchRuns()